@@ -0,0 +1,130 @@
+"""Compare the blocking executor-based poll with the async API client.
+
+Starts ``FakeSensusServer``, then runs one poll per simulated
+config entry, first with the legacy ``requests`` code path inside a thread pool
+(as ``hass.async_add_executor_job`` did) and then with ``SensusAnalyticsApiClient``
+on the event loop.
+
+Usage (from the repository root, with ``requirements.txt`` and ``requests`` installed)::
+
+    python -m benchmarks.bench_async_client --entries 50 --latency 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+import requests
+
+from benchmarks.fake_server import FakeSensusServer, FakeServerConfig
+from custom_components.sensus_analytics_water.api import SensusAnalyticsApiClient, SensusPortalSession
+
+# One day of hourly rows, as the coordinator requests for yesterday
+USAGE_PARAMS = {"start": 1_700_000_000_000, "end": 1_700_086_399_999, "zoom": "day", "page": "null", "weather": "1"}
+
+
+class ThreadTimer:
+    """Accumulate the time worker threads spend inside a job."""
+
+    def __init__(self):
+        """Initialize the timer."""
+        self._lock = threading.Lock()
+        self.busy = 0.0
+
+    def wrap(self, func):
+        """Return ``func`` wrapped so its runtime is added to ``busy``."""
+
+        def _run(*args):
+            start = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.busy += time.perf_counter() - start
+
+        return _run
+
+
+def legacy_poll(base_url: str) -> dict:
+    """Blocking poll equivalent to the previous ``_fetch_data`` implementation."""
+    session = requests.Session()
+    session.post(
+        f"{base_url}j_spring_security_check",
+        data={"j_username": "u", "j_password": "p"},
+        allow_redirects=False,
+        timeout=10,
+    )
+    data = session.post(f"{base_url}water/widget/byPage", json={}, timeout=10).json()
+    session.get(f"{base_url}water/usage/1/1", params=USAGE_PARAMS, timeout=10).json()
+    return data
+
+
+async def run_legacy(base_url: str, entries: int, workers: int):
+    """Run one legacy poll per entry through a bounded executor."""
+    loop = asyncio.get_running_loop()
+    timer = ThreadTimer()
+    job = timer.wrap(legacy_poll)
+    latencies = []
+
+    async def _poll(executor):
+        start = time.perf_counter()
+        await loop.run_in_executor(executor, job, base_url)
+        latencies.append(time.perf_counter() - start)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        start = time.perf_counter()
+        await asyncio.gather(*(_poll(executor) for _ in range(entries)))
+        wall = time.perf_counter() - start
+    return latencies, wall, timer.busy
+
+
+async def run_async(base_url: str, entries: int):
+    """Run one async-client poll per entry on the event loop."""
+    latencies = []
+
+    async def _poll(session):
+        client = SensusAnalyticsApiClient(SensusPortalSession(session, base_url, "u", "p"), "1", "1")
+        start = time.perf_counter()
+        await client.async_ensure_login()
+        await client.async_get_daily_data()
+        await client.async_get_usage_data(USAGE_PARAMS)
+        latencies.append(time.perf_counter() - start)
+
+    async with aiohttp.ClientSession() as session:
+        start = time.perf_counter()
+        await asyncio.gather(*(_poll(session) for _ in range(entries)))
+        wall = time.perf_counter() - start
+    return latencies, wall, 0.0
+
+
+def report(label: str, latencies: list[float], wall: float, thread_time: float) -> None:
+    """Print a one-line summary for a run."""
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{label:<8} polls={len(latencies):<4} p50={statistics.median(ordered) * 1000:8.1f} ms "
+        f"p95={p95 * 1000:8.1f} ms wall={wall:6.2f} s executor-thread-time={thread_time:6.2f} s"
+    )
+
+
+async def main() -> None:
+    """Run both variants against the same local server."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=50, help="number of simulated config entries")
+    parser.add_argument("--latency", type=float, default=0.2, help="server latency per request in seconds")
+    parser.add_argument("--workers", type=int, default=8, help="executor threads available to the legacy path")
+    args = parser.parse_args()
+
+    async with FakeSensusServer(FakeServerConfig(latency=args.latency)) as server:
+        report("before", *await run_legacy(server.base_url, args.entries, args.workers))
+        report("after", *await run_async(server.base_url, args.entries))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""Measure rebuilding the hour-of-week usage baseline and scoring a day.
+
+Builds a year of synthetic hourly usage with a daily profile, noise and a few
+missing readings, then reports the time to rebuild the 7x24 quantile matrix
+with ``HourOfWeekBaseline`` (NumPy) versus grouping the readings in Python and
+taking ``statistics.quantiles`` per slot, and the time to score one day.
+
+Usage (from the repository root, with ``requirements.txt`` installed)::
+
+    python -m benchmarks.bench_baseline --weeks 52
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from custom_components.sensus_analytics_water.baseline import HourOfWeekBaseline
+
+HOUR_MS = 3600 * 1000
+TIME_ZONE = ZoneInfo("America/Chicago")
+
+
+def year_of_usage(weeks: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return hourly timestamps and usage with a morning and evening peak."""
+    start = int(datetime(2024, 1, 1, tzinfo=TIME_ZONE).timestamp() * 1000)
+    timestamps = start + HOUR_MS * np.arange(weeks * 7 * 24, dtype=np.int64)
+    hours = (timestamps // HOUR_MS) % 24
+    rng = np.random.default_rng(0)
+    profile = 2.0 + 8.0 * np.exp(-((hours - 13) ** 2) / 4) + 6.0 * np.exp(-((hours - 1) ** 2) / 3)
+    usage = rng.gamma(2.0, profile / 2.0)
+    usage[rng.random(usage.size) < 0.02] = np.nan
+    return timestamps, usage
+
+
+def run_python(timestamps: np.ndarray, usage: np.ndarray) -> float:
+    """Group readings by local hour of the week in Python and return seconds spent."""
+    start = time.perf_counter()
+    slots: dict[int, list[float]] = {}
+    for timestamp, value in zip(timestamps.tolist(), usage.tolist()):
+        if value != value:  # NaN
+            continue
+        local = datetime.fromtimestamp(timestamp / 1000, TIME_ZONE)
+        slots.setdefault(local.weekday() * 24 + local.hour, []).append(value)
+    _ = {slot: statistics.quantiles(values, n=10, method="inclusive") for slot, values in slots.items()}
+    return time.perf_counter() - start
+
+
+def best_of(repeat: int, func, *args) -> float:
+    """Return the fastest of several timed runs."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    """Print rebuild and scoring times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--weeks", type=int, default=52, help="weeks of hourly history")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement, the best is reported")
+    args = parser.parse_args()
+
+    timestamps, usage = year_of_usage(args.weeks)
+    baseline = HourOfWeekBaseline(TIME_ZONE, args.weeks)
+    rebuild = best_of(args.repeat, baseline.rebuild, timestamps, usage)
+    day = slice(-24, None)
+    score = best_of(args.repeat, baseline.score, timestamps[day], usage[day] * 1.5)
+    python = min(run_python(timestamps, usage) for _ in range(args.repeat))
+
+    print(f"{timestamps.size} hourly readings over {args.weeks} weeks")
+    print(f"{'operation':>16} {'ms':>10}")
+    print(f"{'numpy rebuild':>16} {rebuild * 1e3:>10.2f}")
+    print(f"{'python rebuild':>16} {python * 1e3:>10.2f}")
+    print(f"{'score one day':>16} {score * 1e3:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Measure the hourly history ring buffer against rescanning for window totals.
+
+Feeds a day of hourly readings at a time, as each poll does, and reports the
+time per day to keep 7-day, 30-day and billing-cycle totals with
+``HourlyHistory`` versus summing a growing list of rows on every update, plus
+the memory each approach holds after the simulated uptime.
+
+Usage (from the repository root, with ``requirements.txt`` installed)::
+
+    python -m benchmarks.bench_history --days 365
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from zoneinfo import ZoneInfo
+
+from custom_components.sensus_analytics_water.history import HourlyHistory
+from custom_components.sensus_analytics_water.series import HourlySeries
+
+HOUR_MS = 3600 * 1000
+START_MS = 1_700_000_000_000
+WINDOWS = (7 * 24, 30 * 24)
+
+
+def day_series(day: int) -> HourlySeries:
+    """Return an API-shaped day of hourly readings."""
+    start = START_MS + day * 24 * HOUR_MS
+    return HourlySeries.from_usage_list(
+        [["GAL", "INCHES", "FAHRENHEIT"]]
+        + [[start + hour * HOUR_MS, (day + hour) % 7 * 1.5, 0.0, 60.0] for hour in range(24)]
+    )
+
+
+def run_history(days: list[HourlySeries], capacity: int) -> tuple[float, int]:
+    """Feed the ring buffer and return seconds spent and bytes retained."""
+    gc.collect()
+    tracemalloc.start()
+    history = HourlyHistory(capacity, WINDOWS, ZoneInfo("UTC"))
+    start = time.perf_counter()
+    for series in days:
+        history.extend(series)
+        _ = (history.total(WINDOWS[0]), history.total(WINDOWS[1]), history.cycle_total)
+    elapsed = time.perf_counter() - start
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, size
+
+
+def run_rescan(days: list[HourlySeries]) -> tuple[float, int]:
+    """Append rows to a list and rescan the windows after every day."""
+    gc.collect()
+    tracemalloc.start()
+    rows: list[tuple[int, float]] = []
+    start = time.perf_counter()
+    for series in days:
+        rows.extend((reading.timestamp, reading.usage or 0.0) for reading in series)
+        newest = rows[-1][0]
+        _ = [sum(usage for timestamp, usage in rows if newest - timestamp < hours * HOUR_MS) for hours in WINDOWS]
+    elapsed = time.perf_counter() - start
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, size
+
+
+def main() -> None:
+    """Print time per day and retained memory for both approaches."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=365, help="days of simulated uptime")
+    parser.add_argument("--capacity-days", type=int, default=90, help="ring buffer capacity in days")
+    args = parser.parse_args()
+
+    days = [day_series(day) for day in range(args.days)]
+    history_time, history_bytes = run_history(days, args.capacity_days * 24)
+    rescan_time, rescan_bytes = run_rescan(days)
+    print(f"{'approach':>10} {'us/day':>10} {'retained KiB':>13}")
+    print(f"{'history':>10} {history_time * 1e6 / args.days:>10.1f} {history_bytes / 1024:>13.1f}")
+    print(f"{'rescan':>10} {rescan_time * 1e6 / args.days:>10.1f} {rescan_bytes / 1024:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
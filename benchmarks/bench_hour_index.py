@@ -0,0 +1,102 @@
+"""Micro-benchmark the Last Hour sensor properties against the previous linear scan.
+
+Builds a day of hourly rows, then times ``native_value`` of the four Last Hour
+sensors reading the coordinator's hour index, next to the old per-row
+``get_time_zone``/``utc_from_timestamp``/``astimezone`` scan.
+
+Usage (from the repository root, with ``requirements.txt`` installed)::
+
+    python -m benchmarks.bench_hour_index --number 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.sensus_analytics_water.coordinator import SensusAnalyticsDataUpdateCoordinator
+from custom_components.sensus_analytics_water.meter import MeterState
+from custom_components.sensus_analytics_water.sensor import (
+    LastHourRainfallSensor,
+    LastHourTemperatureSensor,
+    LastHourTimestampSensor,
+    LastHourUsageSensor,
+)
+from custom_components.sensus_analytics_water.series import HourlySeries
+
+TIME_ZONE = "America/Chicago"
+
+
+def build_rows(local_tz) -> list[dict]:
+    """Return yesterday's 24 hourly rows in the previous per-row dict format."""
+    start = dt_util.start_of_local_day(dt_util.now(local_tz) - timedelta(days=1))
+    return [
+        {
+            "timestamp": int((start + timedelta(hours=hour)).timestamp() * 1000),
+            "usage": hour * 1.5,
+            "rain": 0.0,
+            "temp": 60 + hour,
+            "usage_unit": "GAL",
+            "rain_unit": "INCHES",
+            "temp_unit": "FAHRENHEIT",
+        }
+        for hour in range(24)
+    ]
+
+
+def to_series(rows: list[dict]) -> HourlySeries:
+    """Return the rows as the coordinator's columnar series."""
+    return HourlySeries.from_usage_list(
+        [["GAL", "INCHES", "FAHRENHEIT", "gal"]] + [[r["timestamp"], r["usage"], r["rain"], r["temp"]] for r in rows]
+    )
+
+
+def legacy_scan(hass, hourly_data, key):
+    """Previous native_value implementation shared by the Last Hour sensors."""
+    local_tz = dt_util.get_time_zone(hass.config.time_zone)
+    now = datetime.now(local_tz)
+    for entry in hourly_data:
+        entry_time = dt_util.utc_from_timestamp(entry["timestamp"] / 1000).astimezone(local_tz)
+        if entry_time.hour == now.hour:
+            return entry[key]
+    return None
+
+
+def main() -> None:
+    """Time each property path."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="evaluations per sensor")
+    args = parser.parse_args()
+
+    local_tz = dt_util.get_time_zone(TIME_ZONE)
+    dt_util.set_default_time_zone(local_tz)
+    rows = build_rows(local_tz)
+    hass = SimpleNamespace(config=SimpleNamespace(time_zone=TIME_ZONE))
+    # pylint: disable-next=protected-access
+    index = SensusAnalyticsDataUpdateCoordinator._build_hourly_index(to_series(rows), local_tz)
+    # The sensors read the hour index from the configured meter's state
+    coordinator = SimpleNamespace(
+        water_meter_number="M1",
+        meters={"M1": MeterState("M1", hourly_index=index)},
+        config_entry=SimpleNamespace(entry_id="bench", data={"unit_type": "gal", "water_unit_type": "gal"}),
+    )
+    entry = coordinator.config_entry
+
+    print(f"{'path':<28}{'per call':>12}")
+    for key in ("usage", "rain", "temp"):
+        per_call = timeit.timeit(lambda k=key: legacy_scan(hass, rows, k), number=args.number) / args.number
+        print(f"{'legacy scan (' + key + ')':<28}{per_call * 1e6:>9.2f} us")
+    for sensor_cls in (LastHourUsageSensor, LastHourRainfallSensor, LastHourTemperatureSensor, LastHourTimestampSensor):
+        sensor = sensor_cls(coordinator, entry)
+        sensor.hass = hass
+        prop = sensor_cls.native_value.fget
+        per_call = timeit.timeit(lambda s=sensor, p=prop: p(s), number=args.number) / args.number
+        print(f"{sensor_cls.__name__:<28}{per_call * 1e6:>9.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""End-to-end polling benchmark against the offline Sensus stand-in.
+
+Creates 1 to 500 real ``SensusAnalyticsDataUpdateCoordinator`` instances on a
+bare ``HomeAssistant`` core, polls them concurrently against
+``FakeSensusServer`` and reports per entry count:
+
+* poll latency (p50/p95) of ``_async_update_data``
+* bytes transferred per poll
+* relogins per hour per entry: logins after the first round, which every
+  entry needs to open its session, extrapolated from the remaining rounds and
+  each coordinator's poll interval (blank with ``--rounds 1``)
+* executor-thread time (should be zero for the async client)
+* CPU time to evaluate every sensor's state once
+* failed polls, with the most common errors
+
+Usage (from the repository root, with ``requirements.txt`` installed)::
+
+    python -m benchmarks.bench_polling --entries 1,10,100,500 --rounds 3
+    python -m benchmarks.bench_polling --entries 50 --error-rate 0.2 --session-ttl 1
+    python -m benchmarks.bench_polling --entries 100 --meters-per-login 10
+    python -m benchmarks.bench_polling --entries 10 --meters-per-entry 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+
+from benchmarks.fake_server import FakeSensusServer, FakeServerConfig
+from custom_components.sensus_analytics_water import sensor
+from custom_components.sensus_analytics_water.const import DOMAIN
+from custom_components.sensus_analytics_water.coordinator import SensusAnalyticsDataUpdateCoordinator
+
+SENSOR_PROPERTIES = ("native_value", "native_unit_of_measurement", "last_reset", "extra_state_attributes")
+
+
+class TimedExecutor(ThreadPoolExecutor):
+    """Thread pool that accumulates the time jobs spend on worker threads."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the executor."""
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+        self.busy = 0.0
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Submit a job wrapped with a timer."""
+
+        def _timed():
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.busy += time.perf_counter() - start
+
+        return super().submit(_timed)
+
+
+def entry_data(base_url: str, index: int, meters_per_login: int = 1) -> dict:
+    """Return config entry data for one simulated meter."""
+    return {
+        "base_url": base_url,
+        "username": f"user{index // meters_per_login}",
+        "password": "secret",
+        "account_number": f"{1000 + index}",
+        "water_meter_number": f"M{index}",
+        "water_unit_type": "gal",
+        "all_meters": True,
+        "water_tier1_gallons": 3000.0,
+        "water_tier1_price": 0.0128,
+        "water_tier2_gallons": 2000.0,
+        "water_tier2_price": 0.015,
+        "water_tier3_price": 0.02,
+        "water_service_fee": 15.0,
+    }
+
+
+async def build_coordinators(hass: HomeAssistant, base_url: str, count: int, meters_per_login: int = 1) -> list:
+    """Create one coordinator per simulated config entry."""
+    coordinators = []
+    for index in range(count):
+        entry = config_entries.ConfigEntry(
+            data=entry_data(base_url, index, meters_per_login),
+            discovery_keys=MappingProxyType({}),
+            domain=DOMAIN,
+            entry_id=f"bench_{index}",
+            minor_version=1,
+            options={},
+            source=config_entries.SOURCE_USER,
+            title=f"Meter {index}",
+            unique_id=f"bench_{index}",
+            version=1,
+        )
+        # DataUpdateCoordinator picks up the entry being set up from this context variable
+        config_entries.current_entry.set(entry)
+        coordinators.append(SensusAnalyticsDataUpdateCoordinator(hass, entry))
+    config_entries.current_entry.set(None)
+    return coordinators
+
+
+async def poll_all(coordinators: list, rounds: int) -> tuple[list[float], Counter]:
+    """Poll every coordinator concurrently for a number of rounds.
+
+    Returns the latencies of successful polls and the failed polls counted by
+    their error, so failures show in the report instead of shrinking the sample.
+    """
+    latencies: list[float] = []
+    failures: Counter = Counter()
+
+    async def _poll(coordinator):
+        start = time.perf_counter()
+        try:
+            # pylint: disable-next=protected-access
+            coordinator.data = await coordinator._async_update_data()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            cause = error.__cause__ or error
+            failures[f"{type(cause).__name__}: {cause}"] += 1
+            return
+        latencies.append(time.perf_counter() - start)
+
+    for _ in range(rounds):
+        await asyncio.gather(*(_poll(coordinator) for coordinator in coordinators))
+    return latencies, failures
+
+
+async def evaluate_sensors(hass: HomeAssistant, coordinators: list) -> tuple[int, float]:
+    """Evaluate every sensor property once and return the entity count and CPU seconds."""
+    entities = []
+    for coordinator in coordinators:
+        if coordinator.snapshot is None:
+            continue
+        hass.data.setdefault(DOMAIN, {})[coordinator.config_entry.entry_id] = coordinator
+        await sensor.async_setup_entry(
+            hass, coordinator.config_entry, lambda new, update_before_add=False: entities.extend(new)
+        )
+    for entity in entities:
+        entity.hass = hass
+
+    start = time.process_time()
+    for entity in entities:
+        for name in SENSOR_PROPERTIES:
+            getattr(entity, name, None)
+    return len(entities), time.process_time() - start
+
+
+async def run(count: int, args, executor: TimedExecutor) -> None:
+    """Benchmark one entry count and print a summary line."""
+    server_config = FakeServerConfig(
+        latency=args.latency,
+        latency_jitter=args.jitter,
+        error_rate=args.error_rate,
+        session_ttl=args.session_ttl,
+        padding_bytes=args.padding,
+        devices=args.meters_per_entry,
+    )
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        async with FakeSensusServer(server_config) as server:
+            coordinators = await build_coordinators(hass, server.base_url, count, args.meters_per_login)
+            busy_before = executor.busy
+            latencies, failures = await poll_all(coordinators, 1)
+            warmup_logins = server.stats.logins
+            steady_latencies, steady_failures = await poll_all(coordinators, args.rounds - 1)
+            latencies += steady_latencies
+            failures += steady_failures
+            thread_time = executor.busy - busy_before
+            entities, sensor_cpu = await evaluate_sensors(hass, coordinators)
+            stats = server.stats
+        await hass.async_stop(force=True)
+
+    polls = max(len(latencies), 1)
+    ordered = sorted(latencies) or [0.0]
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    interval = statistics.mean(c.update_interval.total_seconds() for c in coordinators)
+    steady_rounds = args.rounds - 1
+    relogins = (
+        f"{(stats.logins - warmup_logins) / (count * steady_rounds) * (3600 / interval):>11.2f}"
+        if steady_rounds
+        else f"{'':>11}"
+    )
+    print(
+        f"{count:>5} {statistics.median(ordered) * 1000:>9.1f} {p95 * 1000:>9.1f} "
+        f"{(stats.bytes_in + stats.bytes_out) / polls:>10.0f} {relogins} "
+        f"{thread_time:>10.3f} {sensor_cpu * 1e6 / max(entities, 1):>12.1f} "
+        f"{stats.widget_requests:>7} {stats.usage_requests:>6} {stats.rejected_sessions + stats.injected_errors:>6} "
+        f"{sum(failures.values()):>6}"
+    )
+    for error, polls_failed in failures.most_common(3):
+        print(f"      {polls_failed} failed polls: {error}")
+
+
+async def main() -> None:
+    """Run the benchmark for each requested entry count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", default="1,10,100,500", help="comma separated config entry counts")
+    parser.add_argument("--rounds", type=int, default=3, help="polls per entry")
+    parser.add_argument("--latency", type=float, default=0.05, help="server latency per request in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of data requests that fail")
+    parser.add_argument("--session-ttl", type=float, default=None, help="seconds before sessions expire")
+    parser.add_argument("--meters-per-entry", type=int, default=1, help="meters the widget returns per entry")
+    parser.add_argument("--meters-per-login", type=int, default=1, help="config entries sharing one username")
+    parser.add_argument("--padding", type=int, default=0, help="extra bytes per device in widget payloads")
+    args = parser.parse_args()
+
+    # Keep integration warnings about the random fake data out of the table
+    logging.getLogger("custom_components").setLevel(logging.ERROR)
+    executor = TimedExecutor()
+    asyncio.get_running_loop().set_default_executor(executor)
+    print(
+        f"{'entries':>5} {'p50 ms':>9} {'p95 ms':>9} {'bytes/poll':>10} {'relogin/h/e':>11} "
+        f"{'thread s':>10} {'sensor us/e':>12} {'widget':>7} {'usage':>6} {'errors':>6} {'failed':>6}"
+    )
+    for count in (int(value) for value in args.entries.split(",")):
+        await run(count, args, executor)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""Compare per-day hourly requests with multi-day zoom windows for a year of history.
+
+Starts ``FakeSensusServer``, which serves hourly rows for any ``start``/``end``
+window, then fetches 365 days through ``HourlyRangeFetcher``
+with and without the week/month zoom levels.
+
+Usage (from the repository root, with ``requirements.txt`` installed)::
+
+    python -m benchmarks.bench_range_fetch --days 365 --latency 0.3
+    python -m benchmarks.bench_range_fetch --reject-ranges   # exercise the per-day fallback
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import date, timedelta
+
+import aiohttp
+from homeassistant.util import dt as dt_util
+
+from benchmarks.fake_server import FakeSensusServer, FakeServerConfig
+from custom_components.sensus_analytics_water.api import SensusAnalyticsApiClient, SensusPortalSession
+from custom_components.sensus_analytics_water.range_fetch import RANGE_ZOOM_LEVELS, HourlyRangeFetcher
+from custom_components.sensus_analytics_water.series import HourlySeries
+
+
+def window_fetcher(client: SensusAnalyticsApiClient):
+    """Return a fetch_window callable that mirrors the coordinator's request and parsing."""
+
+    async def _fetch(start: date, end: date, zoom: str):
+        start_dt = dt_util.start_of_local_day(start)
+        end_dt = dt_util.start_of_local_day(end + timedelta(days=1))
+        payload = await client.async_get_usage_data(
+            {
+                "start": int(start_dt.timestamp() * 1000),
+                "end": int(end_dt.timestamp() * 1000),
+                "zoom": zoom,
+                "page": "null",
+                "weather": "1",
+            }
+        )
+        if not payload.get("operationSuccess"):
+            return None
+        return HourlySeries.from_usage_list(payload["data"]["usage"])
+
+    return _fetch
+
+
+async def run(label: str, base_url: str, days: int, concurrency: int, zoom_levels) -> None:
+    """Fetch the range once and print the request count and wall-clock time."""
+    async with aiohttp.ClientSession() as session:
+        client = SensusAnalyticsApiClient(SensusPortalSession(session, base_url, "u", "p"), "1", "1")
+        await client.async_ensure_login()
+        fetcher = HourlyRangeFetcher(window_fetcher(client), dt_util.UTC, concurrency, zoom_levels)
+        end_day = date.today() - timedelta(days=1)
+        start = time.perf_counter()
+        result = await fetcher.async_fetch(end_day - timedelta(days=days - 1), end_day)
+        wall = time.perf_counter() - start
+    rows = sum(len(day_rows) for day_rows in result.values() if day_rows)
+    print(f"{label:<10} days={len(result):<4} rows={rows:<6} requests={fetcher.requests:<4} wall={wall:6.2f} s")
+
+
+async def main() -> None:
+    """Run the per-day and ranged variants against the same local server."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--latency", type=float, default=0.3, help="server latency per request in seconds")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--reject-ranges", action="store_true", help="make the server refuse week/month zoom")
+    args = parser.parse_args()
+
+    server_config = FakeServerConfig(latency=args.latency, reject_ranges=args.reject_ranges)
+    async with FakeSensusServer(server_config) as server:
+        await run("per-day", server.base_url, args.days, args.concurrency, ())
+        await run("ranged", server.base_url, args.days, args.concurrency, RANGE_ZOOM_LEVELS)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""Report memory use of hourly usage storage per 10k hours.
+
+Compares the previous list-of-dicts rows (one dict per hour with the units
+copied into each) with the columnar ``HourlySeries``, measured with tracemalloc.
+
+Usage (from the repository root, with ``requirements.txt`` installed)::
+
+    python -m benchmarks.bench_series_memory --hours 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import timeit
+import tracemalloc
+
+from custom_components.sensus_analytics_water.series import HourlySeries
+
+HOUR_MS = 3600 * 1000
+START_MS = 1_700_000_000_000
+
+
+def usage_list(hours: int) -> list:
+    """Return an API-shaped usage list with distinct float readings."""
+    return [["GAL", "INCHES", "FAHRENHEIT", "gal"]] + [
+        [START_MS + hour * HOUR_MS, hour * 0.25, hour * 0.001, 40.0 + hour % 50] for hour in range(hours)
+    ]
+
+
+def legacy_rows(raw: list) -> list[dict]:
+    """Previous _process_hourly_data_response output."""
+    usage_unit, rain_unit, temp_unit = raw[0][:3]
+    return [
+        {
+            "timestamp": timestamp,
+            "usage": usage,
+            "rain": rain,
+            "temp": temp,
+            "usage_unit": usage_unit,
+            "rain_unit": rain_unit,
+            "temp_unit": temp_unit,
+        }
+        for timestamp, usage, rain, temp in raw[1:]
+    ]
+
+
+def measure(build, raw) -> tuple[int, object]:
+    """Return the bytes retained by the structure ``build`` creates from ``raw``."""
+    gc.collect()
+    tracemalloc.start()
+    result = build(raw)
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, result
+
+
+def main() -> None:
+    """Print retained memory and slice cost for both layouts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=int, default=10000)
+    args = parser.parse_args()
+
+    # Build the input outside the measurement so only the stored rows count
+    raw = usage_list(args.hours)
+    per_10k = 10000 / args.hours
+
+    legacy_size, rows = measure(legacy_rows, raw)
+    series_size, series = measure(HourlySeries.from_usage_list, raw)
+    print(f"list of dicts : {legacy_size * per_10k / 1024:9.1f} KiB per 10k hours")
+    print(f"HourlySeries  : {series_size * per_10k / 1024:9.1f} KiB per 10k hours")
+
+    # Slice the middle day of the range
+    start = START_MS + (args.hours // 2) * HOUR_MS
+    end = start + 24 * HOUR_MS
+    legacy_slice = timeit.timeit(lambda: [r for r in rows if start <= r["timestamp"] < end], number=200) / 200
+    series_slice = timeit.timeit(lambda: series.between(start, end), number=200) / 200
+    print(f"slice one day : list {legacy_slice * 1e6:9.1f} us, series {series_slice * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""Offline stand-in for the Sensus Analytics portal.
+
+Implements ``j_spring_security_check``, ``water/widget/byPage`` and
+``water/usage/{account}/{meter}`` on an aiohttp test server with configurable
+latency, payload sizes, session expiry and error injection, and counts the
+requests, logins and bytes it serves.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import secrets
+import time
+from dataclasses import dataclass, field
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+HOUR_MS = 3600 * 1000
+UNITS_ROW = ["GAL", "INCHES", "FAHRENHEIT", "gal"]
+
+
+@dataclass
+class FakeServerConfig:  # pylint: disable=too-many-instance-attributes
+    """Behaviour of the fake portal."""
+
+    latency: float = 0.05
+    latency_jitter: float = 0.0
+    devices: int = 1
+    padding_bytes: int = 0
+    error_rate: float = 0.0
+    error_status: int = 500
+    session_ttl: float | None = None
+    reject_ranges: bool = False
+    upload_interval: float = 6 * 3600
+    seed: int = 0
+
+
+@dataclass
+class FakeServerStats:
+    """Counters collected while serving requests."""
+
+    logins: int = 0
+    widget_requests: int = 0
+    usage_requests: int = 0
+    rejected_sessions: int = 0
+    injected_errors: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    usage_zooms: dict[str, int] = field(default_factory=dict)
+
+
+class FakeSensusServer:
+    """Serve the three portal endpoints the integration uses."""
+
+    def __init__(self, config: FakeServerConfig | None = None):
+        """Initialize the fake server."""
+        self.config = config or FakeServerConfig()
+        self.stats = FakeServerStats()
+        self._random = random.Random(self.config.seed)
+        self._sessions: dict[str, float] = {}
+        self._server: TestServer | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Return the base URL the integration should be configured with."""
+        return str(self._server.make_url("/"))
+
+    async def start(self) -> str:
+        """Start listening on a free local port and return the base URL."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_post("/j_spring_security_check", self._login)
+        app.router.add_get("/login", self._login_page)
+        app.router.add_post("/water/widget/byPage", self._widget)
+        app.router.add_get("/water/usage/{account}/{meter}", self._usage)
+        # Serve on a host name: aiohttp's default cookie jar ignores cookies from IP addresses
+        self._server = TestServer(app, host="localhost")
+        await self._server.start_server()
+        return self.base_url
+
+    async def close(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            await self._server.close()
+
+    async def __aenter__(self) -> FakeSensusServer:
+        """Start the server in an async context."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Stop the server when leaving the context."""
+        await self.close()
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        """Apply latency, session checks, error injection and byte counting."""
+        config = self.config
+        delay = config.latency + self._random.uniform(0, config.latency_jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        self.stats.bytes_in += request.content_length or 0
+
+        if request.path.startswith("/water/"):
+            if not self._session_valid(request.cookies.get("JSESSIONID")):
+                self.stats.rejected_sessions += 1
+                return self._count(web.Response(status=302, headers={"Location": "/login"}))
+            if config.error_rate and self._random.random() < config.error_rate:
+                self.stats.injected_errors += 1
+                return self._count(web.Response(status=config.error_status, text="injected error"))
+
+        return self._count(await handler(request))
+
+    def _count(self, response: web.StreamResponse) -> web.StreamResponse:
+        """Add a response body to the byte counter."""
+        body = getattr(response, "body", None)
+        if body is not None:
+            self.stats.bytes_out += len(body)
+        return response
+
+    def _session_valid(self, session_id: str | None) -> bool:
+        """Return True if the cookie belongs to a live session."""
+        issued = self._sessions.get(session_id)
+        if issued is None:
+            return False
+        ttl = self.config.session_ttl
+        return ttl is None or time.monotonic() - issued < ttl
+
+    async def _login(self, request: web.Request) -> web.Response:
+        """Accept any credentials and issue a session cookie."""
+        await request.post()
+        self.stats.logins += 1
+        session_id = secrets.token_hex(16)
+        self._sessions[session_id] = time.monotonic()
+        response = web.Response(status=302, headers={"Location": "/"})
+        response.set_cookie("JSESSIONID", session_id)
+        return response
+
+    async def _login_page(self, _request: web.Request) -> web.Response:
+        """Return the HTML login page unauthenticated requests are sent to."""
+        return web.Response(text="<html>login</html>", content_type="text/html")
+
+    def _last_read_ms(self) -> int:
+        """Return the most recent simulated meter upload."""
+        interval = self.config.upload_interval
+        now = time.time()
+        return int((now - now % interval) * 1000)
+
+    async def _widget(self, request: web.Request) -> web.Response:
+        """Return the meters widget with one entry per configured device."""
+        body = await request.json()
+        self.stats.widget_requests += 1
+        devices = [
+            {
+                "meterId": f"{body.get('deviceId', 'meter')}-{index}" if index else body.get("deviceId", "meter"),
+                "meterAddress1": f"{100 + index} Main St",
+                "meterLat": 30.0 + index / 1000,
+                "meterLong": -97.0 - index / 1000,
+                "usageUnit": "GAL",
+                "dailyUsage": 120.5 + index,
+                "billingUsage": 2400.0 + index,
+                "latestReadUsage": 123456.0 + index,
+                "lastRead": self._last_read_ms(),
+                "padding": "x" * self.config.padding_bytes,
+            }
+            for index in range(self.config.devices)
+        ]
+        return self._json({"widgetList": [{"data": {"devices": devices}}]})
+
+    async def _usage(self, request: web.Request) -> web.Response:
+        """Return hourly rows between the requested start and end."""
+        query = request.query
+        zoom = query.get("zoom", "day")
+        self.stats.usage_requests += 1
+        self.stats.usage_zooms[zoom] = self.stats.usage_zooms.get(zoom, 0) + 1
+        if self.config.reject_ranges and zoom != "day":
+            return self._json({"operationSuccess": False, "errors": [f"unsupported zoom {zoom}"]})
+        start = int(query["start"])
+        end = int(query["end"])
+        first = start - start % HOUR_MS
+        rows = [
+            [ts, round(self._random.uniform(0, 20), 2), 0.0, 55 + (ts // HOUR_MS) % 24]
+            for ts in range(first, end, HOUR_MS)
+        ]
+        return self._json({"operationSuccess": True, "data": {"usage": [UNITS_ROW] + rows}})
+
+    @staticmethod
+    def _json(payload) -> web.Response:
+        """Return a JSON response with a pre-rendered body so its size is known."""
+        return web.Response(text=json.dumps(payload), content_type="application/json")
@@ -2,30 +2,69 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import DOMAIN, REPAIR_INTERVAL
 from .coordinator import SensusAnalyticsDataUpdateCoordinator
+from .services import async_setup_services
+from .session_registry import async_get_session_registry
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)  # pylint: disable=invalid-name
+
+PLATFORMS = ["sensor", "binary_sensor"]
+
+
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+    """Set up the Sensus Analytics services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Sensus Analytics from a config entry."""
     coordinator = SensusAnalyticsDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.completeness.async_load()
+    if await coordinator.async_restore_last_payload():
+        # Sensors start from the stored payload; the live refresh must not hold up startup
+        entry.async_create_background_task(hass, coordinator.async_refresh(), f"{DOMAIN} first refresh")
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            # Give back the shared session so the retry does not count twice
+            await async_get_session_registry(hass).async_release(coordinator.portal)
+            raise
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Fill the rolling totals and baseline with past days instead of waiting weeks for polls
+    entry.async_create_background_task(hass, coordinator.async_seed_history(), f"{DOMAIN} seed history")
+
+    @callback
+    def _async_start_repair(_now) -> None:
+        """Re-fetch incomplete days in the background."""
+        entry.async_create_background_task(
+            hass, coordinator.backfill.async_repair(), f"{DOMAIN}_repair_{entry.entry_id}"
+        )
+
+    entry.async_on_unload(async_track_time_interval(hass, _async_start_repair, timedelta(seconds=REPAIR_INTERVAL)))
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a Sensus Analytics config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor"])
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await async_get_session_registry(hass).async_release(coordinator.portal)
 
     return unload_ok
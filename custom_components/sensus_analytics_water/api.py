@@ -0,0 +1,230 @@
+"""Async API client for the Sensus Analytics portal."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any
+from urllib.parse import urljoin
+
+import aiohttp
+
+from .const import HOST_CONCURRENCY
+from .metrics import RequestMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Statuses the portal uses when the session cookie is missing or expired
+SESSION_REJECTED_STATUSES = (401, 403)
+
+_SESSION_REJECTED = object()
+
+
+class SensusAnalyticsApiError(Exception):
+    """Raised when the Sensus Analytics API cannot be reached or returns an error."""
+
+
+class SensusAnalyticsAuthError(SensusAnalyticsApiError):
+    """Raised when the Sensus Analytics portal rejects the credentials."""
+
+
+class SensusPortalSession:  # pylint: disable=too-many-instance-attributes
+    """Authenticated portal session shared by every meter behind one login.
+
+    Holds the cookie-carrying aiohttp session, the login state and a semaphore
+    bounding concurrent requests to the portal host.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        base_url: str,
+        username: str,
+        password: str,
+        host_limit: asyncio.Semaphore | None = None,
+    ):
+        """Initialize the portal session."""
+        self.session = session
+        self.base_url = base_url
+        self.username = username
+        self._password = password
+        self.host_limit = host_limit or asyncio.Semaphore(HOST_CONCURRENCY)
+        self._login_lock = asyncio.Lock()
+        self._authenticated = False
+        self.generation = 0
+        self.login_count = 0
+
+    def update_password(self, password: str) -> None:
+        """Use a new password, logging in again on the next request if it changed."""
+        if password != self._password:
+            self._password = password
+            self._authenticated = False
+
+    async def async_ensure_login(self, metrics: RequestMetrics) -> bool:
+        """Log in unless the session is still usable, returning True if a login was made."""
+        async with self._login_lock:
+            if self._authenticated:
+                return False
+            await self._async_login(metrics)
+            return True
+
+    async def async_relogin(self, generation: int, metrics: RequestMetrics) -> bool:
+        """Log in again after a rejection unless another request already renewed the session."""
+        async with self._login_lock:
+            if generation != self.generation:
+                return False
+            await self._async_login(metrics)
+            return True
+
+    def invalidate(self) -> None:
+        """Forget the login so the next request authenticates again."""
+        self._authenticated = False
+
+    async def _async_login(self, metrics: RequestMetrics) -> None:
+        """Authenticate against the portal and store the session cookie."""
+        self._authenticated = False
+        login_url = urljoin(self.base_url, "j_spring_security_check")
+        _LOGGER.debug("Authentication URL: %s", login_url)
+        start = time.monotonic()
+        try:
+            async with (
+                self.host_limit,
+                self.session.post(
+                    login_url,
+                    data={"j_username": self.username, "j_password": self._password},
+                    allow_redirects=False,
+                    timeout=REQUEST_TIMEOUT,
+                ) as response,
+            ):
+                status = response.status
+        except (aiohttp.ClientError, TimeoutError) as error:
+            metrics.record("login", time.monotonic() - start, error=True)
+            raise SensusAnalyticsApiError(f"Authentication request failed: {error}") from error
+        metrics.record("login", time.monotonic() - start, error=status != 302)
+
+        # Check if login was successful
+        if status != 302:
+            _LOGGER.error("Authentication failed with status code %s", status)
+            raise SensusAnalyticsAuthError("Authentication failed")
+
+        self._authenticated = True
+        self.generation += 1
+        self.login_count += 1
+        _LOGGER.debug("Authentication successful")
+
+
+class SensusAnalyticsApiClient:  # pylint: disable=too-many-instance-attributes
+    """Client for one meter on the Sensus Analytics web portal built on aiohttp."""
+
+    def __init__(
+        self,
+        portal: SensusPortalSession,
+        account_number: str,
+        water_meter_number: str,
+        metrics: RequestMetrics | None = None,
+    ):
+        """Initialize the API client."""
+        self.portal = portal
+        self.base_url = portal.base_url
+        self.account_number = account_number
+        self.water_meter_number = water_meter_number
+        self.login_count = 0
+        self.logins_skipped = 0
+        self.reauth_count = 0
+        self.metrics = metrics or RequestMetrics()
+
+    async def async_ensure_login(self) -> None:
+        """Log in unless the shared session is still usable."""
+        if await self.portal.async_ensure_login(self.metrics):
+            self.login_count += 1
+        else:
+            self.logins_skipped += 1
+
+    async def async_get_daily_data(self) -> dict[str, Any]:
+        """Fetch the raw widget payload holding the daily meter data."""
+        widget_url = urljoin(self.base_url, "water/widget/byPage")
+        _LOGGER.debug("Widget URL: %s", widget_url)
+        return await self._async_request_json(
+            "widget",
+            "post",
+            widget_url,
+            json={
+                "group": "meters",
+                "accountNumber": self.account_number,
+                "deviceId": self.water_meter_number,
+            },
+        )
+
+    async def async_get_usage_data(self, params: dict[str, Any], meter_id: str | None = None) -> dict[str, Any]:
+        """Fetch the raw usage payload of a meter (the configured one by default)."""
+        usage_url = self.usage_url(meter_id)
+        _LOGGER.debug("Hourly data request URL: %s", usage_url)
+        _LOGGER.debug("Hourly data request parameters: %s", params)
+        return await self._async_request_json("usage", "get", usage_url, params=params)
+
+    def usage_url(self, meter_id: str | None = None) -> str:
+        """Return the usage endpoint for a meter on the account, the configured one by default."""
+        return urljoin(self.base_url, f"water/usage/{self.account_number}/{meter_id or self.water_meter_number}")
+
+    async def _async_request_json(self, operation: str, method: str, url: str, **kwargs) -> Any:
+        """Send a request on the authenticated session and decode the JSON body.
+
+        If the portal rejects the session cookie the client logs in again and
+        retries the request once.
+        """
+        generation = self.portal.generation
+        result = await self._async_send(operation, method, url, **kwargs)
+        if result is not _SESSION_REJECTED:
+            return result
+
+        _LOGGER.debug("Session rejected by %s, re-authenticating", url)
+        self.metrics.retries += 1
+        # A concurrent request may already have renewed the session
+        if await self.portal.async_relogin(generation, self.metrics):
+            self.login_count += 1
+            self.reauth_count += 1
+
+        result = await self._async_send(operation, method, url, **kwargs)
+        if result is _SESSION_REJECTED:
+            self.portal.invalidate()
+            raise SensusAnalyticsAuthError("Session rejected after re-authentication")
+        return result
+
+    async def _async_send(self, operation: str, method: str, url: str, **kwargs) -> Any:
+        """Send a single request, returning the decoded JSON or the rejection sentinel."""
+        start = time.monotonic()
+        try:
+            async with (
+                self.portal.host_limit,
+                self.portal.session.request(
+                    method, url, allow_redirects=False, timeout=REQUEST_TIMEOUT, **kwargs
+                ) as response,
+            ):
+                if self._is_session_rejected(response):
+                    self.metrics.record(operation, time.monotonic() - start, error=True)
+                    return _SESSION_REJECTED
+                response.raise_for_status()
+                body = await response.read()
+        except (aiohttp.ClientError, TimeoutError) as error:
+            self.metrics.record(operation, time.monotonic() - start, error=True)
+            raise SensusAnalyticsApiError(f"Request to {url} failed: {error}") from error
+        self.metrics.record(operation, time.monotonic() - start, len(body))
+
+        try:
+            with self.metrics.measure(f"{operation}_parse"):
+                return json.loads(body)
+        except ValueError as error:
+            raise SensusAnalyticsApiError(f"Invalid JSON from {url}: {error}") from error
+
+    @staticmethod
+    def _is_session_rejected(response: aiohttp.ClientResponse) -> bool:
+        """Return True if the response means the session is no longer authenticated."""
+        if response.status in SESSION_REJECTED_STATUSES:
+            return True
+        # Data endpoints never redirect unless they send us back to the login page
+        return 300 <= response.status < 400
@@ -0,0 +1,207 @@
+"""Backfill hourly usage into Home Assistant long-term statistics."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfVolume
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .completeness import coalesce_days
+from .const import BACKFILL_BATCH_DAYS, DOMAIN, REPAIR_LOOKBACK_DAYS
+from .series import HourlySeries
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Sensus usage units mapped to Home Assistant volume units
+STATISTIC_UNITS = {
+    "GAL": UnitOfVolume.GALLONS,
+    "CF": UnitOfVolume.CUBIC_FEET,
+    "CCF": UnitOfVolume.CENTUM_CUBIC_FEET,
+}
+
+
+def usage_statistic_id(coordinator) -> str:
+    """Return the external statistic id holding a meter's hourly usage."""
+    meter = slugify(f"{coordinator.account_number}_{coordinator.water_meter_number}")
+    return f"{DOMAIN}:{meter}_hourly_usage"
+
+
+def _statistic_hour(moment: datetime) -> datetime:
+    """Return the UTC hour a row starting at ``moment`` is imported under.
+
+    Zones with a half-hour offset start local hours mid-way through a UTC hour,
+    so the statistic row is keyed by the UTC hour the reading falls in.
+    """
+    return dt_util.as_utc(moment).replace(minute=0, second=0, microsecond=0)
+
+
+class StatisticsBackfill:
+    """Import past hourly usage as external statistics, resuming from a checkpoint.
+
+    Days are fetched in multi-day windows and imported oldest first so
+    cumulative sums can be carried forward. After every batch the next day to import and the running sum are saved,
+    so an interrupted import continues where it stopped.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator):
+        """Initialize the backfill for a coordinator."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.statistic_id = usage_statistic_id(coordinator)
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{coordinator.config_entry.entry_id}.backfill")
+        self._lock = asyncio.Lock()
+
+    async def async_run(self, days: int) -> None:
+        """Backfill the given number of days up to and including yesterday."""
+        if self._lock.locked():
+            _LOGGER.warning("Backfill for %s is already running", self.statistic_id)
+            return
+        async with self._lock:
+            end_day = dt_util.now().date() - timedelta(days=1)
+            start_day = end_day - timedelta(days=days - 1)
+            start_day, next_day, running_sum = await self._async_load_checkpoint(start_day)
+            _LOGGER.info("Backfilling %s from %s to %s", self.statistic_id, next_day, end_day)
+
+            while next_day <= end_day:
+                batch_end = min(next_day + timedelta(days=BACKFILL_BATCH_DAYS - 1), end_day)
+                try:
+                    days = await self.coordinator.range_fetcher.async_fetch(next_day, batch_end)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    _LOGGER.error("Backfill stopped at %s, rerun to resume: %s", next_day, error)
+                    return
+
+                for day in sorted(days):
+                    running_sum = self._import_day(day, days[day], running_sum)
+                next_day = batch_end + timedelta(days=1)
+                await self._store.async_save(
+                    {
+                        "start": start_day.isoformat(),
+                        "end": end_day.isoformat(),
+                        "next_day": next_day.isoformat(),
+                        "sum": running_sum,
+                    }
+                )
+
+            _LOGGER.info("Backfill of %s complete", self.statistic_id)
+
+    async def _async_load_checkpoint(self, start_day: date) -> tuple[date, date, float]:
+        """Return the first day of the range, the day to resume from and the cumulative sum up to it.
+
+        The checkpoint holds the absolute range requested so far. A request that
+        starts inside that range or right after it, such as the same number of
+        days requested again after midnight, continues from the checkpoint.
+        """
+        checkpoint = await self._store.async_load()
+        if checkpoint:
+            stored_start = date.fromisoformat(checkpoint["start"])
+            next_day = date.fromisoformat(checkpoint["next_day"])
+            stored_end = date.fromisoformat(checkpoint["end"])
+            if stored_start <= start_day <= stored_end + timedelta(days=1):
+                return stored_start, next_day, checkpoint["sum"]
+        # A range starting earlier or after a gap restarts from its first day so sums stay consistent
+        return start_day, start_day, 0.0
+
+    async def async_repair(self) -> None:
+        """Fetch imported days that miss hourly readings again and correct their statistics.
+
+        Only days imported by a backfill and older than yesterday, which every
+        poll fetches anyway, are repaired. Adjacent days are fetched as one
+        range. A repaired day's rows are re-imported from the sum before it and
+        every later sum is shifted by the change in the day's total, including
+        the recorded sums of the days after it that are repaired next.
+        """
+        coordinator = self.coordinator
+        if self._lock.locked() or coordinator.circuit_breaker.is_open:
+            return
+        index = coordinator.completeness
+        end_day = dt_util.now().date() - timedelta(days=2)
+        start_day = end_day - timedelta(days=REPAIR_LOOKBACK_DAYS - 1)
+        days = [day for day in index.incomplete_days(start_day, end_day) if "imported" in index.get(day)]
+        if not days:
+            return
+
+        async with self._lock:
+            _LOGGER.debug("Repairing %s days of %s", len(days), self.statistic_id)
+            adjustment = 0.0
+            for range_start, range_end in coalesce_days(days):
+                try:
+                    fetched = await coordinator.range_fetcher.async_fetch(range_start, range_end)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    _LOGGER.debug("Repair of %s stopped at %s: %s", self.statistic_id, range_start, error)
+                    break
+                for day in sorted(fetched):
+                    adjustment += self._repair_day(day, fetched[day])
+            if adjustment:
+                await self._async_adjust_checkpoint(days[0], adjustment)
+
+    def _repair_day(self, day: date, rows: HourlySeries | None) -> float:
+        """Re-import a day and shift the sums after it, returning the change in its total."""
+        index = self.coordinator.completeness
+        index.record(day, rows)
+        imported = index.get(day)["imported"]
+        if not rows:
+            return 0.0
+        total = self._add_statistics(rows, imported["sum_before"]) - imported["sum_before"]
+        delta = total - imported["total"]
+        index.mark_imported(day, imported["sum_before"], total)
+        if delta:
+            _LOGGER.info("Corrected %s on %s by %s", self.statistic_id, day, delta)
+            index.shift_imported_after(day, delta)
+            get_instance(self.hass).async_adjust_statistics(
+                self.statistic_id,
+                # The next day's first row is keyed by its truncated UTC hour, not by local midnight
+                _statistic_hour(dt_util.start_of_local_day(day + timedelta(days=1))),
+                delta,
+                STATISTIC_UNITS.get(rows.usage_unit, rows.usage_unit),
+            )
+        return delta
+
+    async def _async_adjust_checkpoint(self, first_day: date, adjustment: float) -> None:
+        """Shift the running sum of an unfinished backfill that already passed the repaired days."""
+        checkpoint = await self._store.async_load()
+        if checkpoint and date.fromisoformat(checkpoint["next_day"]) > first_day:
+            checkpoint["sum"] += adjustment
+            await self._store.async_save(checkpoint)
+
+    def _import_day(self, day: date, rows: HourlySeries | None, running_sum: float) -> float:
+        """Import one day's rows, record how complete they were and return the updated sum."""
+        index = self.coordinator.completeness
+        index.record(day, rows)
+        end_sum = self._add_statistics(rows, running_sum)
+        index.mark_imported(day, running_sum, end_sum - running_sum)
+        return end_sum
+
+    def _add_statistics(self, rows: HourlySeries | None, running_sum: float) -> float:
+        """Queue one day's rows for import and return the updated cumulative sum."""
+        if not rows:
+            return running_sum
+        statistics = []
+        for reading in rows:
+            if reading.usage is None:
+                continue
+            start = _statistic_hour(dt_util.utc_from_timestamp(reading.timestamp / 1000))
+            running_sum += reading.usage
+            statistics.append(StatisticData(start=start, state=reading.usage, sum=running_sum))
+
+        if statistics:
+            metadata = StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"Sensus Analytics Water {self.coordinator.water_meter_number} Hourly Usage",
+                source=DOMAIN,
+                statistic_id=self.statistic_id,
+                unit_of_measurement=STATISTIC_UNITS.get(rows.usage_unit, rows.usage_unit),
+            )
+            async_add_external_statistics(self.hass, metadata, statistics)
+        return running_sum
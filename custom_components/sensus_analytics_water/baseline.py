@@ -0,0 +1,182 @@
+"""Hour-of-week usage baseline and anomaly scoring built on NumPy."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import date, tzinfo
+
+import numpy as np
+from homeassistant.util import dt as dt_util
+
+from .const import BASELINE_WEEKS
+from .history import HourlyHistory
+from .series import HourlySeries
+
+HOUR_MS = 3_600_000
+DAY_MS = 24 * HOUR_MS
+HOURS_PER_WEEK = 7 * 24
+
+# Quantiles kept for every hour of the week: the median and the band around it
+QUANTILES = (0.1, 0.5, 0.9)
+# Width of the 10-90% band of a normal distribution in standard deviations
+QUANTILE_SPREAD = 2.563
+# Smallest deviation scale as a share of the mean expected hourly usage, so
+# hours that are always dry do not turn any usage into a huge score
+SCALE_FLOOR = 0.1
+
+# Epoch day 0 (1970-01-01) was a Thursday, 72 hours after the start of its week
+_EPOCH_WEEK_OFFSET = 3 * 24
+
+
+def _utc_offset_ms(timestamp_ms: int, local_tz: tzinfo) -> int:
+    """Return the UTC offset in milliseconds of a time zone at an instant."""
+    offset = dt_util.utc_from_timestamp(timestamp_ms / 1000).astimezone(local_tz).utcoffset()
+    return int(offset.total_seconds() * 1000)
+
+
+def hour_of_week(timestamps: np.ndarray, local_tz: tzinfo) -> np.ndarray:
+    """Return the local hour of the week (Monday 0:00 is 0) of epoch millisecond timestamps.
+
+    The UTC offset is looked up once at each end of every UTC day covered, and
+    per hour only on the days a daylight saving change falls in.
+    """
+    days, inverse = np.unique(timestamps // DAY_MS, return_inverse=True)
+    first = np.array([_utc_offset_ms(int(day) * DAY_MS, local_tz) for day in days], dtype=np.int64)
+    last = np.array([_utc_offset_ms(int(day) * DAY_MS + DAY_MS - HOUR_MS, local_tz) for day in days], dtype=np.int64)
+    offsets = first[inverse]
+    for changed in np.flatnonzero(first != last):
+        hours = np.flatnonzero(inverse == changed)
+        offsets[hours] = [_utc_offset_ms(int(timestamp), local_tz) for timestamp in timestamps[hours]]
+    return ((timestamps + offsets) // HOUR_MS + _EPOCH_WEEK_OFFSET) % HOURS_PER_WEEK
+
+
+def _grid_quantiles(grid: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Return the quantiles of each row of a sorted grid holding ``counts`` readings per row.
+
+    Values are interpolated linearly between the closest ranks, as numpy.quantile does.
+    """
+    rows = np.arange(grid.shape[0])
+    position = np.multiply.outer(QUANTILES, np.maximum(counts - 1, 0))
+    lower = np.floor(position).astype(np.int64)
+    upper = np.ceil(position).astype(np.int64)
+    low_values = grid[rows, lower]
+    quantiles = low_values + (position - lower) * (grid[rows, upper] - low_values)
+    quantiles[:, counts == 0] = np.nan
+    return quantiles
+
+
+@dataclass(slots=True)
+class DayScore:
+    """How one local day of hourly usage compares with the baseline."""
+
+    day: date
+    score: float
+    expected: float
+    actual: float
+    hours_scored: int
+    peak_hour: int
+    peak_score: float
+
+
+class HourOfWeekBaseline:
+    """Usual hourly usage for every hour of the week over the last weeks.
+
+    The baseline is a ``(len(QUANTILES), 7, 24)`` matrix of usage quantiles per
+    weekday and local hour, rebuilt from a meter's :class:`HourlyHistory` when a
+    new day arrives. Rebuilding and scoring use array operations only: readings
+    are grouped into a padded hour-of-week grid, sorted once and the quantiles
+    interpolated for all 168 slots together.
+
+    A day is scored with the root mean square of its hourly robust z-scores,
+    the deviation from the median divided by the spread of the 10-90% band.
+    """
+
+    def __init__(self, local_tz: tzinfo, weeks: int = BASELINE_WEEKS):
+        """Initialize an empty baseline."""
+        self._local_tz = local_tz
+        self.weeks = weeks
+        self.quantiles = np.full((len(QUANTILES), 7, 24), np.nan)
+        # Readings behind each weekday and hour
+        self.samples = np.zeros((7, 24), dtype=np.int64)
+        self.latest: DayScore | None = None
+
+    @property
+    def median(self) -> np.ndarray:
+        """Return the 7x24 matrix of median hourly usage."""
+        return self.quantiles[QUANTILES.index(0.5)]
+
+    @property
+    def weeks_covered(self) -> int:
+        """Return the number of readings behind the least covered hour of the week."""
+        return int(self.samples.min())
+
+    def rebuild(self, timestamps: np.ndarray, usage: np.ndarray) -> None:
+        """Recompute the quantile matrix from hourly readings, ignoring missing ones."""
+        known = ~np.isnan(usage)
+        slots = hour_of_week(timestamps[known], self._local_tz)
+        values = usage[known]
+        counts = np.bincount(slots, minlength=HOURS_PER_WEEK)
+        self.samples = counts.reshape(7, 24)
+        if not values.size:
+            self.quantiles.fill(np.nan)
+            return
+
+        # Lay the readings of each slot out in one row, padding with NaN which sorts last
+        order = np.argsort(slots, kind="stable")
+        sorted_slots = slots[order]
+        rank = np.arange(values.size) - (np.cumsum(counts) - counts)[sorted_slots]
+        grid = np.full((HOURS_PER_WEEK, counts.max()), np.nan)
+        grid[sorted_slots, rank] = values[order]
+        grid.sort(axis=1)
+        self.quantiles = _grid_quantiles(grid, counts).reshape(len(QUANTILES), 7, 24)
+
+    def score(self, timestamps: np.ndarray, usage: np.ndarray) -> DayScore | None:
+        """Compare a day of hourly readings with the baseline."""
+        slots = hour_of_week(timestamps, self._local_tz)
+        low, median, high = self.quantiles.reshape(len(QUANTILES), HOURS_PER_WEEK)[:, slots]
+        profile = self.median[~np.isnan(self.median)]
+        if not profile.size:
+            return None
+        floor = float(profile.mean()) * SCALE_FLOOR or 1.0
+        z_scores = (usage - median) / np.maximum((high - low) / QUANTILE_SPREAD, floor)
+        scored = ~np.isnan(z_scores)
+        if not scored.any():
+            return None
+
+        peak = int(np.nanargmax(np.abs(np.where(scored, z_scores, np.nan))))
+        local = dt_util.utc_from_timestamp(int(timestamps[peak]) / 1000).astimezone(self._local_tz)
+        first = dt_util.utc_from_timestamp(int(timestamps[0]) / 1000).astimezone(self._local_tz)
+        return DayScore(
+            day=first.date(),
+            score=float(np.sqrt(np.mean(z_scores[scored] ** 2))),
+            expected=float(np.nansum(median)),
+            actual=float(np.nansum(usage)),
+            hours_scored=int(scored.sum()),
+            peak_hour=local.hour,
+            peak_score=float(z_scores[peak]),
+        )
+
+    def update(self, history: HourlyHistory, series: HourlySeries) -> None:
+        """Score a fetched day, first rebuilding the baseline from the weeks before it if the day is new."""
+        if len(series) == 0 or history.newest is None:
+            return
+        timestamps = np.frombuffer(series.timestamps, dtype=np.int64)
+        usage = np.frombuffer(series.usage, dtype=np.float64)
+        day = dt_util.utc_from_timestamp(int(timestamps[0]) / 1000).astimezone(self._local_tz).date()
+        if self.latest is None or self.latest.day != day:
+            held = np.frombuffer(history.chronological(), dtype=np.float64)
+            held_timestamps = history.newest - HOUR_MS * np.arange(held.size - 1, -1, -1, dtype=np.int64)
+            before = held_timestamps < timestamps[0]
+            window = self.weeks * HOURS_PER_WEEK
+            self.rebuild(held_timestamps[before][-window:], held[before][-window:])
+        self.latest = self.score(timestamps, usage)
+
+    def as_dict(self) -> dict:
+        """Return the baseline for diagnostics."""
+        median = np.round(self.median, 3).tolist()
+        return {
+            "weeks": self.weeks,
+            "weeks_covered": self.weeks_covered,
+            "median": [[None if math.isnan(value) else value for value in row] for row in median],
+        }
@@ -0,0 +1,71 @@
+"""Binary sensor platform for the Sensus Analytics Integration."""
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, HOUSEHOLD_METER_ID
+from .meter import meter_identity
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
+    """Set up the Sensus Analytics binary sensor platform."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    known_meters: set[str] = set()
+
+    def _new_meter_sensors():
+        """Return the binary sensors of meters that have no entities yet."""
+        sensors = []
+        for meter_id in coordinator.meters:
+            if meter_id in known_meters or meter_id == HOUSEHOLD_METER_ID:
+                continue
+            known_meters.add(meter_id)
+            sensors.append(
+                SensusAnalyticsContinuousFlowSensor(
+                    coordinator, entry, None if meter_id == coordinator.water_meter_number else meter_id
+                )
+            )
+        return sensors
+
+    @callback
+    def _async_add_new_meters() -> None:
+        """Add binary sensors for meters a poll found after setup."""
+        if sensors := _new_meter_sensors():
+            async_add_entities(sensors)
+
+    async_add_entities(_new_meter_sensors(), update_before_add=False)
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_meters))
+
+
+# Most attributes are the _attr_ fields Home Assistant reads
+# pylint: disable-next=too-many-instance-attributes
+class SensusAnalyticsContinuousFlowSensor(CoordinatorEntity, BinarySensorEntity):
+    """Representation of the continuous-flow (leak) binary sensor."""
+
+    def __init__(self, coordinator, entry, meter_id=None):
+        """Initialize the continuous flow sensor."""
+        super().__init__(coordinator)
+        self.coordinator = coordinator
+        self.entry = entry
+        self.meter = coordinator.meters[meter_id or coordinator.water_meter_number]
+        unique_id, name_prefix, self._attr_device_info = meter_identity(entry, meter_id)
+        self._attr_name = f"{name_prefix} Continuous Flow"
+        self._attr_unique_id = f"{unique_id}_continuous_flow"
+        self._attr_icon = "mdi:water-alert"
+        self._attr_device_class = BinarySensorDeviceClass.MOISTURE
+
+    @property
+    def available(self):
+        """Return True once hourly readings have been processed for a meter still on the account."""
+        return self.meter.snapshot is not None and self.meter.leak.newest is not None
+
+    @property
+    def is_on(self):
+        """Return True while a leak threshold is crossed."""
+        return self.meter.leak.leak
+
+    @property
+    def extra_state_attributes(self):
+        """Return the flow statistics behind the state."""
+        return self.meter.leak.as_dict()
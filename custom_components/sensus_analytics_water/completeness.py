@@ -0,0 +1,127 @@
+"""Persisted record of which days have complete hourly readings."""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, timedelta, tzinfo
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import BACKFILL_BATCH_DAYS, COMPLETENESS_MAX_DAYS, DOMAIN, REPAIR_LOOKBACK_DAYS
+from .hourly_cache import expected_hours
+from .series import HourlySeries
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Seconds to wait before writing the index, coalescing updates from one poll or batch
+SAVE_DELAY = 10
+
+
+def coalesce_days(days: list[date], max_days: int = BACKFILL_BATCH_DAYS) -> list[tuple[date, date]]:
+    """Group sorted days into runs of adjacent days, each at most max_days long."""
+    ranges: list[tuple[date, date]] = []
+    for day in days:
+        if ranges:
+            start, end = ranges[-1]
+            if day == end + timedelta(days=1) and (day - start).days < max_days:
+                ranges[-1] = (start, day)
+                continue
+        ranges.append((day, day))
+    return ranges
+
+
+class CompletenessIndex:
+    """Track the hourly readings known for each local day.
+
+    Every day records how many of its hours have a usage reading, how many it
+    should have and the day's usage total. Days imported into statistics also
+    keep the cumulative sum before them and the total that was imported, so a
+    later repair can correct the sums that follow. Days with missing hours are
+    the ones the repair pass fetches again.
+
+    Complete days older than the repair window are dropped when the index is
+    saved, and at most ``COMPLETENESS_MAX_DAYS`` of the newest days are kept,
+    so the store does not grow with every poll and backfilled day.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, local_tz: tzinfo):
+        """Initialize the index."""
+        self._local_tz = local_tz
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.completeness")
+        self._days: dict[str, dict] = {}
+
+    async def async_load(self) -> None:
+        """Load the index saved by a previous run."""
+        stored = await self._store.async_load()
+        if isinstance(stored, dict):
+            self._days = stored.get("days", {})
+            self._prune()
+
+    def get(self, day: date) -> dict | None:
+        """Return the record of a day, if it has been seen."""
+        return self._days.get(day.isoformat())
+
+    def record(self, day: date, rows: HourlySeries | None) -> None:
+        """Record the readings fetched for a day."""
+        key = day.isoformat()
+        present = 0
+        total = 0.0
+        for reading in rows or ():
+            if reading.usage is not None:
+                present += 1
+                total += reading.usage
+        entry = self._days.setdefault(key, {})
+        entry.update(present=present, expected=expected_hours(day, self._local_tz), total=total)
+        self._async_schedule_save()
+
+    def mark_imported(self, day: date, sum_before: float, total: float) -> None:
+        """Record the cumulative sum before a day and the total imported into statistics for it."""
+        self._days[day.isoformat()]["imported"] = {"sum_before": sum_before, "total": total}
+        self._async_schedule_save()
+
+    def shift_imported_after(self, day: date, delta: float) -> None:
+        """Shift the recorded sum before every imported day after a day whose total changed."""
+        for key, entry in self._days.items():
+            if "imported" in entry and date.fromisoformat(key) > day:
+                entry["imported"]["sum_before"] += delta
+        self._async_schedule_save()
+
+    def _async_schedule_save(self) -> None:
+        """Save the index after a short delay."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        """Return the pruned index for storage."""
+        self._prune()
+        return {"days": self._days}
+
+    def _prune(self) -> None:
+        """Drop complete days the repair pass no longer looks at and cap the number of days."""
+        # The repair window ends the day before yesterday
+        cutoff = (dt_util.now(self._local_tz).date() - timedelta(days=REPAIR_LOOKBACK_DAYS + 1)).isoformat()
+        for key in [key for key, entry in self._days.items() if key < cutoff and entry["present"] >= entry["expected"]]:
+            del self._days[key]
+        for key in sorted(self._days)[:-COMPLETENESS_MAX_DAYS]:
+            del self._days[key]
+
+    def incomplete_days(self, start: date, end: date) -> list[date]:
+        """Return the recorded days from start through end that miss readings, oldest first."""
+        days = []
+        for key, entry in self._days.items():
+            day = date.fromisoformat(key)
+            if start <= day <= end and entry["present"] < entry["expected"]:
+                days.append(day)
+        return sorted(days)
+
+    def as_dict(self) -> dict:
+        """Return a summary of the index for diagnostics."""
+        incomplete = [key for key, entry in self._days.items() if entry["present"] < entry["expected"]]
+        return {
+            "days": len(self._days),
+            "incomplete_days": len(incomplete),
+            "oldest_incomplete": min(incomplete, default=None),
+        }
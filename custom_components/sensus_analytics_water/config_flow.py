@@ -13,15 +13,38 @@ from homeassistant.helpers import config_validation as cv
 
 from .const import (
     CONF_ACCOUNT_NUMBER,
+    CONF_ALL_METERS,
     CONF_BASE_URL,
+    CONF_HOUSEHOLD_TOTAL,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
     CONF_PASSWORD,
     CONF_USERNAME,
     CONF_WATER_METER_NUMBER,
+    CONF_WATER_UNIT_TYPE,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
     DOMAIN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Options the coordinator reads only when it is created, with their defaults;
+# changing any of them reloads the entry
+RELOAD_OPTIONS = {
+    CONF_ALL_METERS: False,
+    CONF_HOUSEHOLD_TOTAL: False,
+    CONF_MIN_POLL_INTERVAL: DEFAULT_MIN_POLL_INTERVAL,
+    CONF_MAX_POLL_INTERVAL: DEFAULT_MAX_POLL_INTERVAL,
+}
+
+
+def _poll_intervals_valid(user_input) -> bool:
+    """Return True if the minimum poll interval is not longer than the maximum."""
+    minimum = user_input.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL)
+    maximum = user_input.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL)
+    return minimum <= maximum
+
 
 class SensusAnalyticsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Sensus Analytics Integration."""
@@ -44,11 +67,13 @@ class SensusAnalyticsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(unique_id)
             self._abort_if_unique_id_configured()
 
+            if not _poll_intervals_valid(user_input):
+                errors[CONF_MAX_POLL_INTERVAL] = "poll_interval_range"
             # Validate the user input (e.g., test the connection)
-            valid = await self._test_credentials(user_input)
-            if valid:
+            elif await self._test_credentials(user_input):
                 return self.async_create_entry(title="Sensus Analytics", data=user_input)
-            errors["base"] = "auth"
+            else:
+                errors["base"] = "auth"
 
         data_schema = vol.Schema(
             {
@@ -57,13 +82,17 @@ class SensusAnalyticsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(CONF_PASSWORD): str,
                 vol.Required(CONF_ACCOUNT_NUMBER): str,
                 vol.Required(CONF_WATER_METER_NUMBER): str,
-                vol.Required("water_unit_type", default="gal"): vol.In(["CCF", "gal"]),
+                vol.Required(CONF_WATER_UNIT_TYPE, default="gal"): vol.In(["CCF", "gal"]),
+                vol.Required(CONF_ALL_METERS, default=False): bool,
+                vol.Required(CONF_HOUSEHOLD_TOTAL, default=False): bool,
                 vol.Optional("water_tier1_gallons"): cv.positive_float,
                 vol.Required("water_tier1_price", default=0.0128): cv.positive_float,
                 vol.Optional("water_tier2_gallons"): cv.positive_float,
                 vol.Optional("water_tier2_price"): cv.positive_float,
                 vol.Optional("water_tier3_price"): cv.positive_float,
                 vol.Required("water_service_fee", default=15.00): cv.positive_float,
+                vol.Required(CONF_MIN_POLL_INTERVAL, default=DEFAULT_MIN_POLL_INTERVAL): cv.positive_int,
+                vol.Required(CONF_MAX_POLL_INTERVAL, default=DEFAULT_MAX_POLL_INTERVAL): cv.positive_int,
             }
         )
         return self.async_show_form(step_id="user", data_schema=data_schema, errors=errors)
@@ -103,14 +132,26 @@ class SensusAnalyticsOptionsFlow(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None) -> FlowResult:
         """Manage the options."""
+        errors = {}
         if user_input is not None:
             _LOGGER.debug("User updated options: %s", user_input)
-            # Update the entry with new options
-            self.hass.config_entries.async_update_entry(self.config_entry, data=user_input)
-            # Force a sensor refresh
-            coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]
-            await coordinator.async_request_refresh()
-            return self.async_create_entry(title="", data={})
+            if not _poll_intervals_valid(user_input):
+                errors[CONF_MAX_POLL_INTERVAL] = "poll_interval_range"
+            else:
+                reload_needed = any(
+                    user_input.get(key, default) != self.config_entry.data.get(key, default)
+                    for key, default in RELOAD_OPTIONS.items()
+                )
+                # Update the entry with new options
+                self.hass.config_entries.async_update_entry(self.config_entry, data=user_input)
+                if reload_needed:
+                    # Meters gained or lost devices, or the poll scheduler needs new limits
+                    self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+                else:
+                    # Force a sensor refresh
+                    coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]
+                    await coordinator.async_request_refresh()
+                return self.async_create_entry(title="", data={})
 
         # Fetch current configuration data
         current_data = self.config_entry.data
@@ -138,9 +179,17 @@ class SensusAnalyticsOptionsFlow(config_entries.OptionsFlow):
                     default=current_data.get(CONF_WATER_METER_NUMBER),
                 ): str,
                 vol.Required(
-                    "water_unit_type",
-                    default=current_data.get("water_unit_type", "gal"),
+                    CONF_WATER_UNIT_TYPE,
+                    default=current_data.get(CONF_WATER_UNIT_TYPE, "gal"),
                 ): vol.In(["CCF", "gal"]),
+                vol.Required(
+                    CONF_ALL_METERS,
+                    default=current_data.get(CONF_ALL_METERS, False),
+                ): bool,
+                vol.Required(
+                    CONF_HOUSEHOLD_TOTAL,
+                    default=current_data.get(CONF_HOUSEHOLD_TOTAL, False),
+                ): bool,
                 vol.Optional(
                     "water_tier1_gallons",
                     default=current_data.get("water_tier1_gallons"),
@@ -165,7 +214,15 @@ class SensusAnalyticsOptionsFlow(config_entries.OptionsFlow):
                     "water_service_fee",
                     default=current_data.get("water_service_fee", 15.00),
                 ): cv.positive_float,
+                vol.Required(
+                    CONF_MIN_POLL_INTERVAL,
+                    default=current_data.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
+                ): cv.positive_int,
+                vol.Required(
+                    CONF_MAX_POLL_INTERVAL,
+                    default=current_data.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+                ): cv.positive_int,
             }
         )
 
-        return self.async_show_form(step_id="init", data_schema=data_schema)
+        return self.async_show_form(step_id="init", data_schema=data_schema, errors=errors)
@@ -9,3 +9,95 @@ CONF_ACCOUNT_NUMBER = "account_number"
 CONF_WATER_METER_NUMBER = "water_meter_number"
 
 DEFAULT_NAME = "Sensus Analytics Water"
+
+# Complete days of hourly data are refetched after this many seconds to pick up corrections
+HOURLY_CACHE_TTL = 6 * 60 * 60
+# Number of local days kept in the hourly data cache
+HOURLY_CACHE_DAYS = 3
+
+CONF_MIN_POLL_INTERVAL = "min_poll_interval"
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+
+# Poll interval bounds in minutes
+DEFAULT_MIN_POLL_INTERVAL = 5
+DEFAULT_MAX_POLL_INTERVAL = 120
+
+# Number of usage requests in flight during range fetches such as the statistics backfill
+BACKFILL_CONCURRENCY = 4
+# Days fetched between two backfill checkpoints
+BACKFILL_BATCH_DAYS = 124
+
+SERVICE_BACKFILL = "backfill"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DAYS = "days"
+
+SERVICE_GET_USAGE = "get_usage"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_GRANULARITY = "granularity"
+GRANULARITY_HOURLY = "hourly"
+GRANULARITY_DAILY = "daily"
+# Longest date range a get_usage call may cover
+USAGE_QUERY_MAX_DAYS = 366
+# Days of queried hourly usage kept in memory per config entry
+USAGE_CACHE_DAYS = 400
+# Incomplete days returned by get_usage are fetched again after this many seconds
+USAGE_CACHE_RETRY_TTL = 60 * 60
+
+SERVICE_EXPORT = "export"
+ATTR_FORMAT = "format"
+ATTR_PATH = "path"
+EXPORT_FORMAT_CSV = "csv"
+EXPORT_FORMAT_PARQUET = "parquet"
+# Days fetched and written per step of an export, one month window request
+EXPORT_CHUNK_DAYS = 31
+
+CONF_WATER_UNIT_TYPE = "water_unit_type"
+
+# Upper bound in seconds for the poll interval while backing off after failures
+BACKOFF_MAX_INTERVAL = 2 * 60 * 60
+# Consecutive failed polls against a base URL before its circuit opens
+CIRCUIT_FAILURE_THRESHOLD = 3
+# Seconds an open circuit waits before letting a probe poll through
+CIRCUIT_RECOVERY_TIMEOUT = 15 * 60
+# Largest random fraction added to each poll interval
+POLL_JITTER = 0.1
+
+DATA_CIRCUIT_BREAKERS = f"{DOMAIN}_circuit_breakers"
+
+# Seconds to wait before writing the last payload, coalescing back-to-back polls
+PAYLOAD_SAVE_DELAY = 30
+
+# Concurrent requests allowed to one portal host across all config entries
+HOST_CONCURRENCY = 4
+
+DATA_SESSIONS = f"{DOMAIN}_sessions"
+
+CONF_ALL_METERS = "all_meters"
+CONF_HOUSEHOLD_TOTAL = "household_total"
+# Pseudo meter id of the aggregate device summing every meter on an entry
+HOUSEHOLD_METER_ID = "household"
+# Hourly usage requests in flight at once for the meters of one entry
+METER_FETCH_CONCURRENCY = 4
+
+# Seconds between passes re-fetching days with missing hourly readings
+REPAIR_INTERVAL = 6 * 60 * 60
+# Days back from yesterday the repair pass keeps trying to complete
+REPAIR_LOOKBACK_DAYS = 14
+# Days kept in the completeness index, which holds incomplete days beyond the repair window
+COMPLETENESS_MAX_DAYS = 366
+
+# Days of hourly usage kept in memory per meter for rolling totals
+HISTORY_DAYS = 90
+
+# Weeks of hourly history behind the hour-of-week usage baseline
+BASELINE_WEEKS = 8
+
+# Consecutive hours with flow that count as a continuous-flow leak
+LEAK_RUN_HOURS = 24
+# Local hours making up the night, when a household normally uses no water
+LEAK_NIGHT_HOURS = (1, 2, 3, 4)
+# Night flow above this in every night hour (native units per hour) counts as a leak
+LEAK_NIGHT_FLOW = 0.0
+
+EVENT_LEAK_DETECTED = f"{DOMAIN}_leak_detected"
@@ -1,27 +1,68 @@
 """DataUpdateCoordinator for Sensus Analytics Integration."""
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from urllib.parse import urljoin
+import random
+import time
+from datetime import date, datetime, timedelta
 
-import requests
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
+from .api import SensusAnalyticsApiClient, SensusAnalyticsApiError, SensusAnalyticsAuthError
+from .backfill import StatisticsBackfill
+from .baseline import HourOfWeekBaseline
+from .completeness import CompletenessIndex, coalesce_days
 from .const import (
+    BACKFILL_CONCURRENCY,
+    BACKOFF_MAX_INTERVAL,
     CONF_ACCOUNT_NUMBER,
+    CONF_ALL_METERS,
     CONF_BASE_URL,
+    CONF_HOUSEHOLD_TOTAL,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
     CONF_PASSWORD,
     CONF_USERNAME,
     CONF_WATER_METER_NUMBER,
+    CONF_WATER_UNIT_TYPE,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
     DOMAIN,
+    EVENT_LEAK_DETECTED,
+    HISTORY_DAYS,
+    HOURLY_CACHE_DAYS,
+    HOURLY_CACHE_TTL,
+    HOUSEHOLD_METER_ID,
+    METER_FETCH_CONCURRENCY,
+    PAYLOAD_SAVE_DELAY,
+    USAGE_CACHE_DAYS,
+    USAGE_CACHE_RETRY_TTL,
 )
+from .history import HourlyHistory
+from .hourly_cache import HourlyDataCache, UsageRangeCache
+from .leak import LeakDetector
+from .meter import MeterState
+from .metrics import RequestMetrics
+from .range_fetch import HourlyRangeFetcher
+from .resilience import ExponentialBackoff, async_get_circuit_breaker, jittered
+from .scheduler import AdaptivePollScheduler
+from .series import HourlySeries
+from .session_registry import async_get_session_registry
+from .snapshot import SensusSnapshot, convert_usage
+from .tariff import TariffEngine
 
 _LOGGER = logging.getLogger(__name__)
 
+PAYLOAD_STORAGE_VERSION = 1
 
-class SensusAnalyticsDataUpdateCoordinator(DataUpdateCoordinator):
+# Rolling totals kept by each meter's history, in hours
+HISTORY_WINDOWS = (7 * 24, 30 * 24)
+
+
+class SensusAnalyticsDataUpdateCoordinator(DataUpdateCoordinator):  # pylint: disable=too-many-instance-attributes
     """Class to manage fetching data from the API."""
 
     def __init__(self, hass: HomeAssistant, config_entry):
@@ -33,139 +74,449 @@ class SensusAnalyticsDataUpdateCoordinator(DataUpdateCoordinator):
         self.account_number = config_entry.data[CONF_ACCOUNT_NUMBER]
         self.water_meter_number = config_entry.data[CONF_WATER_METER_NUMBER]
         self.config_entry = config_entry
+        self.metrics = RequestMetrics()
+        # Entries on the same login share one session, so they log in once between them
+        self.portal = async_get_session_registry(hass).acquire(self.base_url, self.username, self.password)
+        self.client = SensusAnalyticsApiClient(
+            self.portal,
+            self.account_number,
+            self.water_meter_number,
+            self.metrics,
+        )
+        # Meter id -> per-meter state, the configured meter first
+        self.meters: dict[str, MeterState] = {}
+        self._meter_state(self.water_meter_number)
+        self._meter_limit = asyncio.Semaphore(METER_FETCH_CONCURRENCY)
+        self.scheduler = AdaptivePollScheduler(
+            timedelta(minutes=config_entry.data.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL)),
+            timedelta(minutes=config_entry.data.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL)),
+        )
+        self.range_fetcher = HourlyRangeFetcher(
+            self.async_fetch_hourly_window,
+            dt_util.get_time_zone(hass.config.time_zone),
+            BACKFILL_CONCURRENCY,
+        )
+        self.backfill = StatisticsBackfill(hass, self)
+        # Days of the configured meter fetched for get_usage calls
+        self.usage_cache = UsageRangeCache(timedelta(seconds=USAGE_CACHE_RETRY_TTL), USAGE_CACHE_DAYS)
+        self.completeness = CompletenessIndex(hass, config_entry.entry_id, dt_util.get_time_zone(hass.config.time_zone))
+        self.tariff = TariffEngine.from_config(config_entry.data)
+        self._tariff_config = config_entry.data
+        self.backoff = ExponentialBackoff(self.scheduler.min_interval, timedelta(seconds=BACKOFF_MAX_INTERVAL))
+        # Shared with every entry on the same portal so an outage pauses them all
+        self.circuit_breaker = async_get_circuit_breaker(hass, self.base_url)
+        # Delay the second poll by a random share of the interval so entries
+        # set up together do not keep hitting the portal at the same moment
+        self._phase_offset: timedelta | None = self.scheduler.min_interval * random.random()  # nosec B311
+        self._payload_store = Store(hass, PAYLOAD_STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}.last_payload")
+        # When the current data was fetched and whether it came from storage
+        self.fetched_at: datetime | None = None
+        self.restored = False
+        # Sensor state writes made and skipped because nothing had changed
+        self.state_writes = 0
+        self.state_writes_skipped = 0
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=5),
+            update_interval=self.scheduler.min_interval,
         )
 
+    @property
+    def primary_meter(self) -> MeterState:
+        """Return the state of the meter configured on the entry."""
+        return self.meters[self.water_meter_number]
+
+    @property
+    def snapshot(self) -> SensusSnapshot | None:
+        """Return the configured meter's snapshot."""
+        return self.primary_meter.snapshot
+
+    @property
+    def hourly_index(self) -> dict[int, dict]:
+        """Return the configured meter's hourly index."""
+        return self.primary_meter.hourly_index
+
+    @property
+    def hourly_cache(self) -> HourlyDataCache:
+        """Return the configured meter's hourly cache."""
+        return self.primary_meter.hourly_cache
+
+    def _meter_state(self, meter_id: str) -> MeterState:
+        """Return the state for a meter, creating it the first time the meter is seen."""
+        meter = self.meters.get(meter_id)
+        if meter is None:
+            meter = self.meters[meter_id] = MeterState(meter_id)
+            if meter_id != HOUSEHOLD_METER_ID:
+                meter.hourly_cache = HourlyDataCache(timedelta(seconds=HOURLY_CACHE_TTL), HOURLY_CACHE_DAYS)
+                local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
+                meter.history = HourlyHistory(HISTORY_DAYS * 24, HISTORY_WINDOWS, local_tz)
+                meter.leak = LeakDetector(local_tz)
+                meter.baseline = HourOfWeekBaseline(local_tz)
+        return meter
+
     async def _async_update_data(self):
-        """Fetch data from API."""
-        _LOGGER.debug("Async update of data started")
-        return await self.hass.async_add_executor_job(self._fetch_data)
+        """Fetch data from the Sensus Analytics API and record how the poll went."""
+        breaker = self.circuit_breaker
+        if not breaker.allow_request():
+            retry_after = max(timedelta(seconds=breaker.retry_after()), self.scheduler.min_interval)
+            self.update_interval = jittered(retry_after)
+            raise UpdateFailed(f"Polling {self.base_url} is paused after repeated failures")
+
+        start = time.monotonic()
+        success = False
+        try:
+            data = await self._async_poll()
+            success = True
+        except UpdateFailed as error:
+            if isinstance(error.__cause__, SensusAnalyticsAuthError):
+                # The portal answered, so the host itself is healthy
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+            self.update_interval = self.backoff.next_interval()
+            _LOGGER.debug("Poll %s failed in a row, retrying in %s", self.backoff.failures, self.update_interval)
+            raise
+        finally:
+            # A cancelled or crashed probe must not keep the shared circuit shut for good
+            breaker.release_probe()
+            self.metrics.record_poll(time.monotonic() - start, success)
+
+        breaker.record_success()
+        self.backoff.reset()
+        return data
 
-    def _fetch_data(self):
+    async def _async_poll(self):
         """Fetch data from the Sensus Analytics API."""
         _LOGGER.debug("Starting data fetch from Sensus Analytics API")
+        if self._tariff_config is not self.config_entry.data:
+            # Recompile only when the options flow replaced the entry data
+            self.tariff = TariffEngine.from_config(self.config_entry.data)
+            self._tariff_config = self.config_entry.data
         try:
-            session = self._create_authenticated_session()
-
-            # Fetch daily data
-            data = self._fetch_daily_water_data(session)
+            await self.client.async_ensure_login()
 
-            # Fetch hourly data
-            _LOGGER.debug("Fetching hourly data")
             local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
             now_local = datetime.now(local_tz)
             target_date = now_local - timedelta(days=1)
-            hourly_data = self._retrieve_hourly_data(session, target_date)
-            if hourly_data:
-                data["hourly_usage_data"] = hourly_data
-            else:
-                _LOGGER.warning("Failed to fetch hourly data")
 
+            # Fetch daily and hourly data concurrently; hourly failures are
+            # swallowed by _async_retrieve_hourly_data so daily data still comes through
+            _LOGGER.debug("Fetching daily and hourly data")
+            data, primary_hourly = await asyncio.gather(
+                self._async_fetch_daily_water_data(),
+                self._async_get_hourly_data(target_date),
+            )
+            # The widget call returns every meter; only their hourly data needs more requests
+            other_meters = [meter_id for meter_id in data if meter_id != self.water_meter_number]
+            other_hourly = await asyncio.gather(
+                *(self._async_get_meter_hourly_data(meter_id, target_date) for meter_id in other_meters)
+            )
+            hourly = {self.water_meter_number: primary_hourly, **dict(zip(other_meters, other_hourly))}
+            for meter_id, hourly_data in hourly.items():
+                if not hourly_data:
+                    _LOGGER.warning("Failed to fetch hourly data for meter %s", meter_id)
+            if primary_hourly:
+                self.completeness.record(target_date.date(), primary_hourly)
+
+            self._apply_payload(data, hourly, local_tz)
+            self.fetched_at = dt_util.utcnow()
+            self.restored = False
+            self._payload_store.async_delay_save(self._payload_to_store, PAYLOAD_SAVE_DELAY)
+
+            self.scheduler.observe(data[self.water_meter_number].get("lastRead"))
+            interval = jittered(self.scheduler.next_interval())
+            if self._phase_offset is not None:
+                interval += self._phase_offset
+                self._phase_offset = None
+            self.update_interval = interval
+            _LOGGER.debug("Next poll in %s", self.update_interval)
             return data
 
-        except UpdateFailed as error:
-            raise error
+        except SensusAnalyticsAuthError as error:
+            raise UpdateFailed("Authentication failed") from error
+        except SensusAnalyticsApiError as error:
+            raise UpdateFailed(f"Error communicating with API: {error}") from error
         except Exception as error:
             _LOGGER.error("Unexpected error: %s", error)
             raise UpdateFailed(f"Unexpected error: {error}") from error
 
-    def _create_authenticated_session(self):
-        """Create and return an authenticated session."""
-        session = requests.Session()
-        # Authenticate and get session cookie
-        login_url = urljoin(self.base_url, "j_spring_security_check")
-        _LOGGER.debug("Authentication URL: %s", login_url)
-        r_sec = session.post(
-            login_url,
-            data={"j_username": self.username, "j_password": self.password},
-            allow_redirects=False,
-            timeout=10,
-        )
-        # Check if login was successful
-        if r_sec.status_code != 302:
-            _LOGGER.error("Authentication failed with status code %s", r_sec.status_code)
-            raise UpdateFailed("Authentication failed")
-
-        _LOGGER.debug("Authentication successful")
-        return session
-
-    def _fetch_daily_water_data(self, session):
-        """Fetch daily water meter data."""
-        widget_url = urljoin(self.base_url, "water/widget/byPage")
-        _LOGGER.debug("Widget URL: %s", widget_url)
-        response = session.post(
-            widget_url,
-            json={
-                "group": "meters",
-                "accountNumber": self.account_number,
-                "deviceId": self.water_meter_number,
-            },
-            timeout=10,
-        )
-        response.raise_for_status()
-        data = response.json()
+    def _apply_payload(self, data: dict, hourly: dict[str, HourlySeries | None], local_tz, notify: bool = True) -> None:
+        """Derive the hourly index and snapshot of every meter from a payload.
+
+        Leaks found in a payload restored from storage were reported by the run
+        that fetched it, so ``notify`` is False then and no event is fired.
+        """
+        config = self.config_entry.data
+        for meter_id, device in data.items():
+            meter = self._meter_state(meter_id)
+            hourly_data = hourly.get(meter_id)
+            if hourly_data:
+                device["hourly_usage_data"] = hourly_data
+                meter.history.extend(hourly_data)
+                meter.baseline.update(meter.history, hourly_data)
+                if meter.leak.feed(hourly_data) and notify:
+                    _LOGGER.warning("Possible leak on meter %s: %s", meter_id, ", ".join(meter.leak.reasons))
+                    self.hass.bus.async_fire(
+                        EVENT_LEAK_DETECTED,
+                        {
+                            "config_entry_id": self.config_entry.entry_id,
+                            "meter_id": meter_id,
+                            **meter.leak.as_dict(),
+                        },
+                    )
+                meter.hourly_index = self._build_hourly_index(
+                    hourly_data, local_tz, config.get(CONF_WATER_UNIT_TYPE), self.tariff
+                )
+            else:
+                meter.hourly_index = {}
+            meter.snapshot = SensusSnapshot.from_data(device, config, self.tariff)
+        for meter_id, meter in self.meters.items():
+            if meter_id not in data and meter_id != HOUSEHOLD_METER_ID:
+                # A meter the account stopped returning goes unavailable rather than showing old values
+                meter.snapshot = None
+                meter.hourly_index = {}
+
+        if config.get(CONF_HOUSEHOLD_TOTAL):
+            meters = [self.meters[meter_id] for meter_id in data]
+            household = self._meter_state(HOUSEHOLD_METER_ID)
+            household.snapshot = SensusSnapshot.combine((meter.snapshot for meter in meters), HOUSEHOLD_METER_ID)
+            indexes = [meter.hourly_index for meter in meters]
+            # A total missing a meter's hours would understate usage, so leave it empty instead
+            household.hourly_index = self._combine_hourly_indexes(indexes) if all(indexes) else {}
+
+    def _payload_to_store(self) -> dict:
+        """Return the last successful payload in a JSON-serializable form."""
+        devices = {}
+        for meter_id, device in self.data.items():
+            device = dict(device)
+            hourly_data = device.pop("hourly_usage_data", None)
+            devices[meter_id] = {
+                "data": device,
+                "hourly_usage_data": hourly_data.to_usage_list() if hourly_data else None,
+            }
+        return {"fetched_at": self.fetched_at.isoformat(), "devices": devices}
+
+    async def async_restore_last_payload(self) -> bool:
+        """Serve the payload saved by a previous run until the first live poll completes."""
+        stored = await self._payload_store.async_load()
+        if not stored:
+            return False
+        try:
+            data = {}
+            hourly = {}
+            for meter_id, device in stored["devices"].items():
+                data[meter_id] = device["data"]
+                hourly_list = device["hourly_usage_data"]
+                hourly[meter_id] = HourlySeries.from_usage_list(hourly_list) if hourly_list else None
+            if self.water_meter_number not in data:
+                raise KeyError(self.water_meter_number)
+            if not self.config_entry.data.get(CONF_ALL_METERS):
+                # Other meters saved while all_meters was on are no longer part of the entry
+                data = {self.water_meter_number: data[self.water_meter_number]}
+            local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
+            self._apply_payload(data, hourly, local_tz, notify=False)
+            self.fetched_at = dt_util.parse_datetime(stored["fetched_at"])
+        except (KeyError, TypeError, ValueError, IndexError, AttributeError) as error:
+            _LOGGER.warning("Ignoring unreadable stored payload: %s", error)
+            for meter in self.meters.values():
+                meter.snapshot = None
+                meter.hourly_index = {}
+            return False
+        self.data = data
+        self.restored = True
+        _LOGGER.debug("Restored payload fetched at %s", self.fetched_at)
+        return True
+
+    async def _async_fetch_daily_water_data(self):
+        """Fetch daily water meter data, keyed by meter id."""
+        data = await self.client.async_get_daily_data()
         _LOGGER.debug("Raw response data: %s", data)
         # Navigate to the specific data
-        data = data.get("widgetList")[0].get("data").get("devices")[0]
-        _LOGGER.debug("Parsed data: %s", data)
+        with self.metrics.measure("widget_process"):
+            devices = data.get("widgetList")[0].get("data").get("devices")
+        _LOGGER.debug("Parsed data: %s", devices)
+        # The first device is the one requested by number; the rest are other meters on the account
+        data = {self.water_meter_number: devices[0]}
+        if self.config_entry.data.get(CONF_ALL_METERS):
+            for device in devices[1:]:
+                meter_id = device.get("meterId")
+                if meter_id and meter_id not in data:
+                    data[str(meter_id)] = device
         return data
 
-    def _retrieve_hourly_data(self, session: requests.Session, target_date: datetime):
+    async def async_get_usage_range(self, start_day: date, end_day: date) -> dict[date, HourlySeries | None]:
+        """Return hourly rows of the configured meter for each local day, fetching only days not cached."""
+        local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
+        days = [start_day + timedelta(days=offset) for offset in range((end_day - start_day).days + 1)]
+        now = dt_util.utcnow()
+        missing = self.usage_cache.missing(days, now)
+        result = {day: self.usage_cache.get(day) for day in days}
+        if missing:
+            _LOGGER.debug("Fetching %d of %d requested days", len(missing), len(days))
+            fetched = await asyncio.gather(
+                *(self.range_fetcher.async_fetch(start, end) for start, end in coalesce_days(missing))
+            )
+            for window in fetched:
+                for day, rows in window.items():
+                    self.usage_cache.put(day, rows, now, local_tz)
+                    result[day] = rows
+        return result
+
+    async def async_seed_history(self) -> None:
+        """Fill the configured meter's history with the days before the one polled.
+
+        Polls add one day at a time, so without seeding the rolling totals and
+        the hour-of-week baseline would take weeks of uptime to cover their
+        windows. The days are fetched into a new history, the newest polled day
+        is added on top and the baseline is rebuilt from the result.
+        """
+        meter = self.primary_meter
+        local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
+        # Polls fetch yesterday, so seed the days before it
+        end_day = dt_util.now(local_tz).date() - timedelta(days=2)
+        start_day = end_day - timedelta(days=HISTORY_DAYS - 2)
+        try:
+            days = await self.range_fetcher.async_fetch(start_day, end_day)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            _LOGGER.warning("Could not seed the hourly history: %s", error)
+            return
+
+        history = HourlyHistory(meter.history.capacity, meter.history.windows, local_tz)
+        for day in sorted(days):
+            if days[day]:
+                history.extend(days[day])
+        device = (self.data or {}).get(self.water_meter_number) or {}
+        current = device.get("hourly_usage_data")
+        if current:
+            history.extend(current)
+        meter.history = history
+        if current:
+            meter.baseline.latest = None
+            meter.baseline.update(history, current)
+        _LOGGER.debug("Seeded %d hours of history for meter %s", len(history), self.water_meter_number)
+        self.async_update_listeners()
+
+    async def _async_get_meter_hourly_data(self, meter_id: str, target_date: datetime):
+        """Return hourly data for another meter on the account, bounding concurrent requests."""
+        async with self._meter_limit:
+            return await self._async_get_hourly_data(target_date, meter_id)
+
+    async def _async_get_hourly_data(self, target_date: datetime, meter_id: str | None = None):
+        """Return hourly data for a date, from the cache when it is complete and fresh."""
+        cache = self._meter_state(meter_id or self.water_meter_number).hourly_cache
+        target_day = target_date.date()
+        now = dt_util.utcnow()
+        cached = cache.get_fresh(target_day, now)
+        if cached is not None:
+            _LOGGER.debug("Using cached hourly data for %s", target_day)
+            return cached
+
+        hourly_data = await self._async_retrieve_hourly_data(target_date, meter_id)
+        if hourly_data:
+            cache.put(target_day, hourly_data, now, target_date.tzinfo)
+            return hourly_data
+        # Fall back to whatever was fetched earlier for the same day
+        return cache.get(target_day)
+
+    async def _async_retrieve_hourly_data(self, target_date: datetime, meter_id: str | None = None):
         """Retrieve hourly usage data for a specific date based on local time."""
-        # Prepare request parameters
-        start_ts, end_ts = self._get_start_end_timestamps(target_date)
-        usage_url, params = self._construct_hourly_data_request(start_ts, end_ts)
-
-        _LOGGER.debug("Hourly data request URL: %s", usage_url)
-        _LOGGER.debug("Hourly data request parameters: %s", params)
-
         try:
-            response = session.get(usage_url, params=params, timeout=10)
-            response.raise_for_status()
-            hourly_data = response.json()
-            _LOGGER.debug("Hourly data response: %s", hourly_data)
-
-            # Validate and process the response
-            hourly_entries = self._process_hourly_data_response(hourly_data)
-            return hourly_entries
+            return await self.async_fetch_hourly_day(target_date, meter_id)
 
-        except requests.exceptions.RequestException as e:
+        except SensusAnalyticsApiError as e:
             _LOGGER.error("Hourly data retrieval failed: %s", e)
             return None
         except (KeyError, TypeError, ValueError) as e:
             _LOGGER.error("Error processing the hourly data response: %s", e)
             return None
 
-    def _get_start_end_timestamps(self, target_date):
-        """Get start and end timestamps in milliseconds for the target date."""
+    async def async_fetch_hourly_day(self, target_date: date, meter_id: str | None = None):
+        """Fetch and process hourly usage for one local day, raising on API errors."""
+        return await self.async_fetch_hourly_window(target_date, target_date, meter_id=meter_id)
+
+    async def async_fetch_hourly_window(
+        self, start_date: date, end_date: date, zoom: str = "day", meter_id: str | None = None
+    ):
+        """Fetch and process hourly usage for a span of local days, raising on API errors."""
+        # Prepare request parameters
+        start_ts, end_ts = self._get_start_end_timestamps(start_date, end_date)
+        params = self._construct_hourly_data_request(start_ts, end_ts, zoom)
+
+        hourly_data = await self.client.async_get_usage_data(params, meter_id)
+        _LOGGER.debug("Hourly data response: %s", hourly_data)
+
+        # Validate and process the response
+        with self.metrics.measure("usage_process"):
+            return self._process_hourly_data_response(hourly_data)
+
+    def _get_start_end_timestamps(self, target_date, end_date=None):
+        """Get start and end timestamps in milliseconds for the target date (through end_date)."""
         # Use HA's local timezone
         local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
 
         # Start and end of the day in local time with timezone
         start_dt = datetime.combine(target_date, datetime.min.time(), tzinfo=local_tz)
-        end_dt = datetime.combine(target_date, datetime.max.time(), tzinfo=local_tz)
+        end_dt = datetime.combine(end_date or target_date, datetime.max.time(), tzinfo=local_tz)
 
         # Convert to timestamps in milliseconds
         start_ts = int(start_dt.timestamp() * 1000)
         end_ts = int(end_dt.timestamp() * 1000)
         return start_ts, end_ts
 
-    def _construct_hourly_data_request(self, start_ts, end_ts):
-        """Construct the hourly data request URL and parameters."""
-        usage_url = urljoin(self.base_url, f"water/usage/{self.account_number}/{self.water_meter_number}")
+    def _construct_hourly_data_request(self, start_ts, end_ts, zoom="day"):
+        """Construct the hourly data request parameters."""
         params = {
             "start": start_ts,
             "end": end_ts,
-            "zoom": "day",
+            "zoom": zoom,
             "page": "null",
             "weather": "1",
         }
-        return usage_url, params
+        return params
+
+    @staticmethod
+    def _build_hourly_index(hourly_data: HourlySeries, local_tz, config_unit_type=None, tariff=None):
+        """Map each local hour to its row so sensors avoid per-row datetime, unit and cost work."""
+        usage_unit = hourly_data.usage_unit
+        converted = [convert_usage(reading.usage, usage_unit, config_unit_type) for reading in hourly_data]
+        # Hourly costs apply the tiers to the day's running total, like the daily fee
+        costs = tariff.marginal_costs(usage or 0 for usage in converted) if tariff else [None] * len(converted)
+        index = {}
+        for reading, converted_usage, cost in zip(hourly_data, converted, costs):
+            local_time = dt_util.utc_from_timestamp(reading.timestamp / 1000).astimezone(local_tz)
+            # On the DST fall-back day the repeated hour keeps its first reading
+            index.setdefault(
+                local_time.hour,
+                {
+                    "timestamp": reading.timestamp,
+                    "usage": reading.usage,
+                    "rain": reading.rain,
+                    "temp": reading.temp,
+                    "usage_unit": usage_unit,
+                    "converted_usage": converted_usage,
+                    "cost": None if converted_usage is None or cost is None else round(cost, 4),
+                    "local_time": local_time,
+                    "local_time_str": local_time.strftime("%Y-%m-%d %H:%M:%S"),
+                },
+            )
+        return index
+
+    @staticmethod
+    def _combine_hourly_indexes(indexes: list[dict[int, dict]]) -> dict[int, dict]:
+        """Sum the converted usage and cost of several meters for each local hour."""
+        combined = {}
+        for index in indexes:
+            for hour, row in index.items():
+                total = combined.get(hour)
+                if total is None:
+                    combined[hour] = dict(row)
+                    continue
+                for key in ("converted_usage", "cost"):
+                    if row[key] is not None:
+                        total[key] = row[key] if total[key] is None else round(total[key] + row[key], 4)
+        return combined
 
     def _process_hourly_data_response(self, hourly_data):
         """Process and structure the hourly data response."""
@@ -183,26 +534,5 @@ class SensusAnalyticsDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Hourly usage data is missing or incomplete.")
             return None
 
-        # The first element contains units
-        units = usage_list[0]  # ["CCF", "INCHES", "FAHRENHEIT", "gal"]
-        usage_unit = units[0]
-        rain_unit = units[1]
-        temp_unit = units[2]
-
-        # The rest of the list contains hourly data
-        hourly_entries = []
-        for entry in usage_list[1:]:
-            timestamp, usage, rain, temp = entry[:4]
-            hourly_entries.append(
-                {
-                    "timestamp": timestamp,
-                    "usage": usage,
-                    "rain": rain,
-                    "temp": temp,
-                    "usage_unit": usage_unit,
-                    "rain_unit": rain_unit,
-                    "temp_unit": temp_unit,
-                }
-            )
-
-        return hourly_entries
+        # The first element contains units, the rest the hourly readings
+        return HourlySeries.from_usage_list(usage_list)
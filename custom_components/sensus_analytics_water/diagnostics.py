@@ -0,0 +1,74 @@
+"""Diagnostics support for the Sensus Analytics Integration (Water)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_ACCOUNT_NUMBER, CONF_PASSWORD, CONF_USERNAME, DOMAIN
+from .session_registry import async_get_session_registry
+
+TO_REDACT = {
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    CONF_ACCOUNT_NUMBER,
+    "meterAddress1",
+    "meterLat",
+    "meterLong",
+}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    cache = coordinator.hourly_cache
+    lookups = cache.hits + cache.misses
+    scheduler = coordinator.scheduler
+    data = {
+        meter_id: {key: value for key, value in device.items() if key != "hourly_usage_data"}
+        for meter_id, device in (coordinator.data or {}).items()
+    }
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "data": async_redact_data(data, TO_REDACT),
+        "requests": coordinator.metrics.as_dict(),
+        "session": {
+            "logins": coordinator.client.login_count,
+            "logins_skipped": coordinator.client.logins_skipped,
+            "reauthentications": coordinator.client.reauth_count,
+            "shared_by_entries": async_get_session_registry(hass).borrowers(coordinator.portal),
+            "shared_logins": coordinator.portal.login_count,
+        },
+        "hourly_cache": {
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "hit_ratio": round(cache.hits / lookups, 3) if lookups else None,
+        },
+        "usage_cache": {
+            "days": len(coordinator.usage_cache),
+            "hits": coordinator.usage_cache.hits,
+            "misses": coordinator.usage_cache.misses,
+        },
+        "scheduler": {
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "polls": scheduler.polls,
+            "baseline_polls": scheduler.baseline_polls,
+            "request_reduction": scheduler.request_reduction,
+            "last_read": scheduler.last_read,
+            "predicted_next_read": scheduler.predicted_next_read,
+            "consecutive_failures": coordinator.backoff.failures,
+        },
+        "circuit_breaker": coordinator.circuit_breaker.as_dict(),
+        "completeness": coordinator.completeness.as_dict(),
+        "usage_baseline": {
+            meter_id: meter.baseline.as_dict() for meter_id, meter in coordinator.meters.items() if meter.baseline
+        },
+        "state_writes": {
+            "written": coordinator.state_writes,
+            "skipped": coordinator.state_writes_skipped,
+        },
+    }
@@ -0,0 +1,198 @@
+"""Streaming export of hourly usage to CSV or Parquet files."""
+
+from __future__ import annotations
+
+import csv
+import logging
+import os
+from abc import ABC, abstractmethod
+from datetime import date, timedelta
+
+import numpy as np
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import EXPORT_CHUNK_DAYS, EXPORT_FORMAT_CSV, EXPORT_FORMAT_PARQUET
+from .series import HourlySeries
+
+_LOGGER = logging.getLogger(__name__)
+
+EXPORT_COLUMNS = ("time", "usage", "usage_unit", "rain", "rain_unit", "temperature", "temperature_unit")
+
+
+class UsageExportWriter(ABC):
+    """Base class for writers that append days of hourly rows to a file.
+
+    Writers do blocking file I/O and must be created and called in the executor.
+    """
+
+    def __init__(self, path: str, time_zone: str):
+        """Create the file, along with its directory if needed."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.time_zone = time_zone
+
+    @abstractmethod
+    def write_days(self, days: list[HourlySeries]) -> int:
+        """Append the rows of some days and return how many were written."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finish the file."""
+
+    def abort(self) -> None:
+        """Close and remove an unfinished file."""
+        try:
+            self.close()
+        finally:
+            os.remove(self.path)
+
+
+class CsvExportWriter(UsageExportWriter):
+    """Write hourly rows as CSV with local ISO 8601 times."""
+
+    def __init__(self, path: str, time_zone: str):
+        """Open the file and write the header."""
+        super().__init__(path, time_zone)
+        self._local_tz = dt_util.get_time_zone(time_zone)
+        self._file = open(path, "w", newline="", encoding="utf-8")  # pylint: disable=consider-using-with
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(EXPORT_COLUMNS)
+
+    def write_days(self, days: list[HourlySeries]) -> int:
+        """Append the rows of some days, leaving missing readings empty."""
+        written = 0
+        for rows in days:
+            usage_unit, rain_unit, temp_unit = rows.units
+            self._writer.writerows(
+                (
+                    dt_util.utc_from_timestamp(reading.timestamp / 1000).astimezone(self._local_tz).isoformat(),
+                    reading.usage,
+                    usage_unit,
+                    reading.rain,
+                    rain_unit,
+                    reading.temp,
+                    temp_unit,
+                )
+                for reading in rows
+            )
+            written += len(rows)
+        return written
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
+class ParquetExportWriter(UsageExportWriter):
+    """Write hourly rows as Parquet, one row group per batch of days.
+
+    Needs the optional pyarrow package, which is imported on first use so Home
+    Assistant does not load it unless a Parquet export is requested.
+    """
+
+    def __init__(self, path: str, time_zone: str):
+        """Open the Parquet writer."""
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            import pyarrow as pa
+
+            # pylint: disable-next=import-outside-toplevel
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise HomeAssistantError("Parquet export needs the pyarrow package") from error
+        super().__init__(path, time_zone)
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("time", pa.timestamp("ms", tz=time_zone)),
+                ("usage", pa.float64()),
+                ("usage_unit", pa.string()),
+                ("rain", pa.float64()),
+                ("rain_unit", pa.string()),
+                ("temperature", pa.float64()),
+                ("temperature_unit", pa.string()),
+            ]
+        )
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write_days(self, days: list[HourlySeries]) -> int:
+        """Append the rows of some days as one row group, storing missing readings as nulls."""
+        if not days:
+            return 0
+        pa = self._pa
+
+        def column(name: str):
+            # NaN marks a missing reading, which Parquet stores as null
+            values = np.concatenate([np.frombuffer(getattr(rows, name), dtype=np.float64) for rows in days])
+            return pa.array(values, type=pa.float64(), from_pandas=True)
+
+        def units(position: int):
+            return pa.array([rows.units[position] for rows in days for _ in range(len(rows))], type=pa.string())
+
+        timestamps = np.concatenate([np.frombuffer(rows.timestamps, dtype=np.int64) for rows in days])
+        table = pa.table(
+            [
+                pa.array(timestamps, type=self._schema.field("time").type),
+                column("usage"),
+                units(0),
+                column("rain"),
+                units(1),
+                column("temp"),
+                units(2),
+            ],
+            schema=self._schema,
+        )
+        self._writer.write_table(table)
+        return table.num_rows
+
+    def close(self) -> None:
+        """Write the footer and close the file."""
+        self._writer.close()
+
+
+EXPORT_WRITERS: dict[str, type[UsageExportWriter]] = {
+    EXPORT_FORMAT_CSV: CsvExportWriter,
+    EXPORT_FORMAT_PARQUET: ParquetExportWriter,
+}
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+async def async_export_usage(
+    hass: HomeAssistant, coordinator, start: date, end: date, path: str, file_format: str
+) -> dict:
+    """Export the configured meter's hourly rows from start to end inclusive.
+
+    Days are fetched and written a batch at a time, so memory use does not grow
+    with the length of the range. Cached days are reused and only missing days
+    are requested. The file is written under a temporary name and renamed once
+    complete, so an interrupted export does not leave a truncated file behind.
+    """
+    partial_path = f"{path}.part"
+    writer = await hass.async_add_executor_job(EXPORT_WRITERS[file_format], partial_path, hass.config.time_zone)
+    rows_written = 0
+    days_without_data = 0
+    try:
+        batch_start = start
+        while batch_start <= end:
+            batch_end = min(batch_start + timedelta(days=EXPORT_CHUNK_DAYS - 1), end)
+            days = await coordinator.async_get_usage_range(batch_start, batch_end)
+            series = [rows for rows in days.values() if rows]
+            days_without_data += len(days) - len(series)
+            rows_written += await hass.async_add_executor_job(writer.write_days, series)
+            batch_start = batch_end + timedelta(days=1)
+        await hass.async_add_executor_job(writer.close)
+    except BaseException:
+        # Also clean up when the call is cancelled
+        await hass.async_add_executor_job(writer.abort)
+        raise
+    await hass.async_add_executor_job(os.replace, partial_path, path)
+
+    _LOGGER.info("Exported %d hourly rows from %s to %s to %s", rows_written, start, end, path)
+    return {
+        "path": path,
+        "rows": rows_written,
+        "days": (end - start).days + 1,
+        "days_without_data": days_without_data,
+    }
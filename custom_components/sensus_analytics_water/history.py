@@ -0,0 +1,162 @@
+"""Fixed-capacity hourly usage history with running window totals."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from datetime import datetime, tzinfo
+
+from homeassistant.util import dt as dt_util
+
+from .series import HourlySeries
+
+HOUR_MS = 3_600_000
+
+
+def _month_bounds(timestamp_ms: int, local_tz: tzinfo) -> tuple[int, int]:
+    """Return the epoch milliseconds starting the local month of a timestamp and the month after."""
+    local = dt_util.utc_from_timestamp(timestamp_ms / 1000).astimezone(local_tz)
+    start = datetime(local.year, local.month, 1, tzinfo=local_tz)
+    if local.month == 12:
+        end = datetime(local.year + 1, 1, 1, tzinfo=local_tz)
+    else:
+        end = datetime(local.year, local.month + 1, 1, tzinfo=local_tz)
+    return int(start.timestamp() * 1000), int(end.timestamp() * 1000)
+
+
+class HourlyHistory:  # pylint: disable=too-many-instance-attributes
+    """Ring buffer of the most recent hourly usage readings.
+
+    Usage is kept in a preallocated ``array('d')`` of ``capacity`` hours, with
+    NaN for hours without a reading, so memory stays the same however long Home
+    Assistant runs. Running totals for each configured window (in hours, ending
+    at the newest reading) and for the billing cycle (the local calendar month)
+    are updated in constant time as hours are added or late readings arrive.
+    """
+
+    __slots__ = (
+        "capacity",
+        "windows",
+        "_usage",
+        "_head",
+        "_size",
+        "_newest",
+        "_sums",
+        "_local_tz",
+        "_cycle_start",
+        "_cycle_end",
+        "cycle_total",
+        "usage_unit",
+    )
+
+    def __init__(self, capacity: int, windows: tuple[int, ...], local_tz: tzinfo):
+        """Initialize an empty history."""
+        if max(windows) > capacity:
+            raise ValueError("Windows cannot be longer than the history capacity")
+        self.capacity = capacity
+        self.windows = windows
+        self._usage = array("d", [math.nan]) * capacity
+        self._local_tz = local_tz
+        self.usage_unit: str | None = None
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget every reading."""
+        self._head = 0
+        self._size = 0
+        self._newest: int | None = None
+        self._sums = [0.0] * len(self.windows)
+        self._cycle_start = 0
+        self._cycle_end = 0
+        self.cycle_total = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of hours held, including hours without a reading."""
+        return self._size
+
+    @property
+    def newest(self) -> int | None:
+        """Return the timestamp in epoch milliseconds of the newest hour."""
+        return self._newest
+
+    def total(self, hours: int) -> float:
+        """Return the usage over one of the configured windows."""
+        return self._sums[self.windows.index(hours)]
+
+    def extend(self, series: HourlySeries) -> None:
+        """Add the hours of a fetched series, updating hours already held in place."""
+        if series.usage_unit:
+            self.usage_unit = series.usage_unit
+        for timestamp, usage in zip(series.timestamps, series.usage):
+            if self._newest is None or timestamp > self._newest:
+                self._append(timestamp, usage)
+            else:
+                self._update(timestamp, usage)
+
+    def _append(self, timestamp: int, usage: float) -> None:
+        """Add a reading newer than every held hour, padding skipped hours with NaN."""
+        if self._newest is not None:
+            gap = round((timestamp - self._newest) / HOUR_MS) - 1
+            if gap >= self.capacity:
+                self.clear()
+            else:
+                for _ in range(gap):
+                    self._push(self._newest + HOUR_MS, math.nan)
+        self._push(timestamp, usage)
+
+    def _push(self, timestamp: int, usage: float) -> None:
+        """Write one hour at the head of the buffer and slide the window totals."""
+        value = 0.0 if math.isnan(usage) else usage
+        for position, hours in enumerate(self.windows):
+            if self._size >= hours:
+                # The hour aged hours - 1 drops out of the window
+                self._sums[position] -= self._value_at_age(hours - 1)
+            self._sums[position] += value
+        if timestamp >= self._cycle_end:
+            self._cycle_start, self._cycle_end = _month_bounds(timestamp, self._local_tz)
+            self.cycle_total = 0.0
+        self.cycle_total += value
+        self._usage[self._head] = usage
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        self._newest = timestamp
+
+    def _update(self, timestamp: int, usage: float) -> None:
+        """Replace the reading of an hour already held, correcting the totals that include it."""
+        age = round((self._newest - timestamp) / HOUR_MS)
+        if age >= self._size:
+            return
+        index = (self._head - 1 - age) % self.capacity
+        old = self._usage[index]
+        if old == usage or (math.isnan(old) and math.isnan(usage)):
+            return
+        delta = (0.0 if math.isnan(usage) else usage) - (0.0 if math.isnan(old) else old)
+        self._usage[index] = usage
+        for position, hours in enumerate(self.windows):
+            if age < hours:
+                self._sums[position] += delta
+        if timestamp >= self._cycle_start:
+            self.cycle_total += delta
+
+    def chronological(self) -> array:
+        """Return a copy of the held hours from oldest to newest, with NaN for missing readings."""
+        if self._size < self.capacity:
+            return self._usage[: self._size]
+        return self._usage[self._head :] + self._usage[: self._head]
+
+    def _value_at_age(self, age: int) -> float:
+        """Return the usage of the hour age hours before the newest, with missing readings as zero."""
+        value = self._usage[(self._head - 1 - age) % self.capacity]
+        return 0.0 if math.isnan(value) else value
+
+    @property
+    def cycle_start(self) -> datetime | None:
+        """Return the start of the billing cycle the cycle total covers."""
+        if not self._size:
+            return None
+        return dt_util.utc_from_timestamp(self._cycle_start / 1000).astimezone(self._local_tz)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the usage buffer in bytes."""
+        return self.capacity * self._usage.itemsize
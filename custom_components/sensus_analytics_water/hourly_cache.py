@@ -0,0 +1,118 @@
+"""Day-keyed cache for hourly usage data."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, tzinfo
+
+from homeassistant.util import dt as dt_util
+
+from .series import HourlySeries
+
+
+def expected_hours(day: date, local_tz: tzinfo) -> int:
+    """Return the number of local hours in a day, accounting for DST changes."""
+    start = datetime.combine(day, time.min, tzinfo=local_tz)
+    end = datetime.combine(day + timedelta(days=1), time.min, tzinfo=local_tz)
+    # Aware datetimes sharing a tzinfo subtract as wall time, so compare in UTC
+    return round((dt_util.as_utc(end) - dt_util.as_utc(start)).total_seconds() / 3600)
+
+
+def is_day_complete(rows: HourlySeries | None, day: date, local_tz: tzinfo) -> bool:
+    """Return True if a day's hourly rows cover every hour with a trailing reading."""
+    if not rows or len(rows) < expected_hours(day, local_tz):
+        return False
+    return rows[-1].usage is not None
+
+
+@dataclass
+class _CacheEntry:
+    """Hourly rows for one local day and when they were fetched."""
+
+    rows: HourlySeries | None
+    fetched_at: datetime
+    complete: bool
+
+
+class HourlyDataCache:
+    """Cache processed hourly rows keyed by local date.
+
+    Incomplete days are always due for a refetch, complete days only once the
+    refresh TTL has expired.
+    """
+
+    def __init__(self, refresh_ttl: timedelta, max_days: int):
+        """Initialize the cache."""
+        self._refresh_ttl = refresh_ttl
+        self._max_days = max_days
+        self._entries: dict[date, _CacheEntry] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, day: date) -> HourlySeries | None:
+        """Return cached rows for a day regardless of freshness."""
+        entry = self._entries.get(day)
+        return entry.rows if entry else None
+
+    def get_fresh(self, day: date, now: datetime) -> HourlySeries | None:
+        """Return cached rows for a day if they do not need to be refetched."""
+        entry = self._entries.get(day)
+        if entry is None or not entry.complete or now - entry.fetched_at >= self._refresh_ttl:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.rows
+
+    def put(self, day: date, rows: HourlySeries, now: datetime, local_tz: tzinfo) -> None:
+        """Store the rows fetched for a day and evict days that fell out of the window."""
+        self._entries[day] = _CacheEntry(rows, now, is_day_complete(rows, day, local_tz))
+        for cached_day in sorted(self._entries)[: -self._max_days]:
+            del self._entries[cached_day]
+
+
+class UsageRangeCache:
+    """Least recently used cache of hourly rows for days queried by date range.
+
+    Complete days never change again and are kept until evicted. Incomplete or
+    empty days are served for ``retry_ttl`` after they were fetched, so repeated
+    queries covering recent days do not reach the portal either.
+    """
+
+    def __init__(self, retry_ttl: timedelta, max_days: int):
+        """Initialize the cache."""
+        self._retry_ttl = retry_ttl
+        self._max_days = max_days
+        self._entries: OrderedDict[date, _CacheEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of days held."""
+        return len(self._entries)
+
+    def missing(self, days: Iterable[date], now: datetime) -> list[date]:
+        """Return the days that have to be fetched, in the order given."""
+        missing = []
+        for day in days:
+            entry = self._entries.get(day)
+            if entry is None or (not entry.complete and now - entry.fetched_at >= self._retry_ttl):
+                self.misses += 1
+                missing.append(day)
+            else:
+                self.hits += 1
+                self._entries.move_to_end(day)
+        return missing
+
+    def get(self, day: date) -> HourlySeries | None:
+        """Return the rows held for a day."""
+        entry = self._entries.get(day)
+        return entry.rows if entry else None
+
+    def put(self, day: date, rows: HourlySeries | None, now: datetime, local_tz: tzinfo) -> None:
+        """Store the rows fetched for a day, evicting the least recently used days beyond the limit."""
+        self._entries[day] = _CacheEntry(rows, now, is_day_complete(rows, day, local_tz))
+        self._entries.move_to_end(day)
+        while len(self._entries) > self._max_days:
+            self._entries.popitem(last=False)
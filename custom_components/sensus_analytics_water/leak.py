@@ -0,0 +1,127 @@
+"""Incremental continuous-flow detection over hourly usage."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import date, tzinfo
+
+from homeassistant.util import dt as dt_util
+
+from .const import LEAK_NIGHT_FLOW, LEAK_NIGHT_HOURS, LEAK_RUN_HOURS
+from .series import HourlySeries
+
+
+@dataclass(slots=True)
+class DayFlow:
+    """Flow statistics for one local day."""
+
+    day: date
+    zero_flow_hours: int = 0
+    min_night_flow: float | None = None
+    night_hours_seen: int = 0
+    longest_run: int = 0
+
+
+# The thresholds and the running state are read together on every hour fed
+class LeakDetector:  # pylint: disable=too-many-instance-attributes
+    """Detect continuous flow from hourly readings, visiting every hour once.
+
+    Each hour updates the current run of hours with flow and the statistics of
+    its local day: hours without flow, the minimum flow during the night and the
+    longest run. Hours at or before the newest hour already processed are
+    skipped, so feeding the same or overlapping series again costs nothing. An
+    hour without a reading is skipped once a later hour has one, and otherwise
+    waited for.
+
+    A leak is reported while the current run reaches ``run_hours`` or the most
+    recent complete night had flow above ``night_flow`` in every night hour.
+    """
+
+    def __init__(
+        self,
+        local_tz: tzinfo,
+        run_hours: int = LEAK_RUN_HOURS,
+        night_hours: tuple[int, ...] = LEAK_NIGHT_HOURS,
+        night_flow: float = LEAK_NIGHT_FLOW,
+    ):
+        """Initialize the detector."""
+        self._local_tz = local_tz
+        self.run_hours = run_hours
+        self.night_hours = night_hours
+        self.night_flow = night_flow
+        self.newest: int | None = None
+        self.current_run = 0
+        # The local day of the newest hour processed
+        self.current_day: DayFlow | None = None
+        self.last_night: DayFlow | None = None
+        self.reasons: list[str] = []
+
+    @property
+    def leak(self) -> bool:
+        """Return True while a leak threshold is crossed."""
+        return bool(self.reasons)
+
+    def feed(self, series: HourlySeries) -> bool:
+        """Process the hours not seen before and return True if a leak was just detected."""
+        timestamps = series.timestamps
+        usage = series.usage
+        last_known = len(usage) - 1
+        while last_known >= 0 and math.isnan(usage[last_known]):
+            last_known -= 1
+
+        for index in range(last_known + 1):
+            timestamp = timestamps[index]
+            if self.newest is not None and timestamp <= self.newest:
+                continue
+            self.newest = timestamp
+            if not math.isnan(usage[index]):
+                self._observe(timestamp, usage[index])
+
+        was_leak = self.leak
+        self._evaluate()
+        return self.leak and not was_leak
+
+    def _observe(self, timestamp: int, value: float) -> None:
+        """Update the run and day statistics with one hour of usage."""
+        local = dt_util.utc_from_timestamp(timestamp / 1000).astimezone(self._local_tz)
+        if self.current_day is None or self.current_day.day != local.date():
+            self.current_day = DayFlow(local.date())
+        day = self.current_day
+
+        if value > 0:
+            self.current_run += 1
+            day.longest_run = max(day.longest_run, self.current_run)
+        else:
+            self.current_run = 0
+            day.zero_flow_hours += 1
+
+        if local.hour in self.night_hours:
+            day.min_night_flow = value if day.min_night_flow is None else min(day.min_night_flow, value)
+            day.night_hours_seen += 1
+            if day.night_hours_seen == len(self.night_hours):
+                self.last_night = day
+
+    def _evaluate(self) -> None:
+        """Work out which leak thresholds are crossed."""
+        reasons = []
+        if self.current_run >= self.run_hours:
+            reasons.append("continuous_flow")
+        night = self.last_night
+        if night is not None and night.min_night_flow is not None and night.min_night_flow > self.night_flow:
+            reasons.append("night_flow")
+        self.reasons = reasons
+
+    def as_dict(self) -> dict:
+        """Return the detector state for entity attributes."""
+        day = self.current_day
+        night = self.last_night
+        return {
+            "reasons": list(self.reasons),
+            "current_run_hours": self.current_run,
+            "day": day.day.isoformat() if day else None,
+            "longest_run_hours": day.longest_run if day else None,
+            "zero_flow_hours": day.zero_flow_hours if day else None,
+            "min_night_flow": night.min_night_flow if night else None,
+            "night_of": night.day.isoformat() if night else None,
+        }
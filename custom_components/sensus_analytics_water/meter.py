@@ -0,0 +1,58 @@
+"""Per-meter state tracked by the coordinator."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.util import slugify
+
+from .baseline import HourOfWeekBaseline
+from .const import DEFAULT_NAME, DOMAIN, HOUSEHOLD_METER_ID
+from .history import HourlyHistory
+from .hourly_cache import HourlyDataCache
+from .leak import LeakDetector
+from .snapshot import SensusSnapshot
+
+
+@dataclass(slots=True)
+class MeterState:
+    """Values derived from the latest poll for one meter on a config entry."""
+
+    meter_id: str
+    # None for the household total, which is computed rather than fetched
+    hourly_cache: HourlyDataCache | None = None
+    snapshot: SensusSnapshot | None = None
+    # Local hour -> hourly row with its pre-converted local time
+    hourly_index: dict[int, dict] = field(default_factory=dict)
+    # Recent hourly usage with rolling totals, None for the household total
+    history: HourlyHistory | None = None
+    # Continuous-flow detection, None for the household total
+    leak: LeakDetector | None = None
+    # Hour-of-week usage profile and the score of the newest day, None for the household total
+    baseline: HourOfWeekBaseline | None = None
+
+
+def meter_identity(entry, meter_id: str | None):
+    """Return the unique id prefix, name prefix and device of a meter's entities."""
+    if meter_id is None:
+        # The configured meter keeps the ids used before an entry could hold several meters
+        device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=DEFAULT_NAME,
+            manufacturer="Unknown",
+            model="Water Utility Meter",
+        )
+        return f"{DOMAIN}_{entry.entry_id}", DEFAULT_NAME, device_info
+    if meter_id == HOUSEHOLD_METER_ID:
+        name, model = f"{DEFAULT_NAME} Household Total", "Household Total"
+    else:
+        name, model = f"{DEFAULT_NAME} {meter_id}", "Water Utility Meter"
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, f"{entry.entry_id}_{meter_id}")},
+        name=name,
+        manufacturer="Unknown",
+        model=model,
+        via_device=(DOMAIN, entry.entry_id),
+    )
+    return f"{DOMAIN}_{entry.entry_id}_{slugify(meter_id)}", name, device_info
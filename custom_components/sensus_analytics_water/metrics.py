@@ -0,0 +1,138 @@
+"""Request-level timing and size instrumentation."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+# Number of samples kept per rolling histogram
+HISTOGRAM_SAMPLES = 200
+
+
+class RollingHistogram:
+    """Keep the most recent samples of a measurement and summarize them."""
+
+    __slots__ = ("_samples",)
+
+    def __init__(self, maxlen: int = HISTOGRAM_SAMPLES):
+        """Initialize the histogram."""
+        self._samples: deque[float] = deque(maxlen=maxlen)
+
+    def add(self, value: float) -> None:
+        """Record one sample."""
+        self._samples.append(value)
+
+    def __len__(self) -> int:
+        """Return the number of samples kept."""
+        return len(self._samples)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the nearest-rank percentile of the kept samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def as_dict(self) -> dict:
+        """Return p50, p95, max and the sample count."""
+        return {
+            "count": len(self._samples),
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "max": max(self._samples, default=None),
+        }
+
+
+@dataclass(slots=True)
+class _OperationMetrics:
+    """Durations, sizes and outcomes for one kind of request or parse step."""
+
+    durations: RollingHistogram = field(default_factory=RollingHistogram)
+    sizes: RollingHistogram = field(default_factory=RollingHistogram)
+    calls: int = 0
+    errors: int = 0
+
+
+class RequestMetrics:
+    """Collect per-operation timings, payload sizes, retries and poll outcomes.
+
+    Operations are the HTTP calls (``login``, ``widget``, ``usage``) and the
+    parse steps that follow them (``widget_parse``, ``usage_parse``).
+    """
+
+    def __init__(self):
+        """Initialize the metrics."""
+        self._operations: dict[str, _OperationMetrics] = {}
+        self.retries = 0
+        self.polls = 0
+        self.failed_polls = 0
+        self.last_poll_duration: float | None = None
+        self._poll_durations = RollingHistogram()
+        self._poll_outcomes: deque[bool] = deque(maxlen=HISTOGRAM_SAMPLES)
+
+    def _operation(self, name: str) -> _OperationMetrics:
+        """Return the metrics of an operation, creating them on first use."""
+        operation = self._operations.get(name)
+        if operation is None:
+            operation = self._operations[name] = _OperationMetrics()
+        return operation
+
+    def record(self, name: str, duration: float, size: int | None = None, error: bool = False) -> None:
+        """Record one completed operation."""
+        operation = self._operation(name)
+        operation.calls += 1
+        operation.durations.add(duration)
+        if size is not None:
+            operation.sizes.add(size)
+        if error:
+            operation.errors += 1
+
+    @contextmanager
+    def measure(self, name: str):
+        """Time the wrapped block as one operation, counting exceptions as errors."""
+        start = time.monotonic()
+        try:
+            yield
+        except BaseException:
+            self.record(name, time.monotonic() - start, error=True)
+            raise
+        self.record(name, time.monotonic() - start)
+
+    def record_poll(self, duration: float, success: bool) -> None:
+        """Record the outcome of one coordinator update."""
+        self.polls += 1
+        if not success:
+            self.failed_polls += 1
+        self.last_poll_duration = duration
+        self._poll_durations.add(duration)
+        self._poll_outcomes.append(success)
+
+    @property
+    def error_rate(self) -> float | None:
+        """Return the percentage of recent polls that failed."""
+        if not self._poll_outcomes:
+            return None
+        failures = sum(1 for success in self._poll_outcomes if not success)
+        return round(failures / len(self._poll_outcomes) * 100, 1)
+
+    def as_dict(self) -> dict:
+        """Return every metric in a JSON-serializable form."""
+        return {
+            "polls": self.polls,
+            "failed_polls": self.failed_polls,
+            "error_rate": self.error_rate,
+            "retries": self.retries,
+            "last_poll_duration": self.last_poll_duration,
+            "poll_duration": self._poll_durations.as_dict(),
+            "operations": {
+                name: {
+                    "calls": operation.calls,
+                    "errors": operation.errors,
+                    "duration": operation.durations.as_dict(),
+                    "size": operation.sizes.as_dict(),
+                }
+                for name, operation in self._operations.items()
+            },
+        }
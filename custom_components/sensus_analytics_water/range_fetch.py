@@ -0,0 +1,125 @@
+"""Multi-day hourly usage requests using the portal's larger zoom levels."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, time, timedelta, tzinfo
+
+from .api import SensusAnalyticsApiError
+from .series import HourlySeries
+
+_LOGGER = logging.getLogger(__name__)
+
+# Zoom levels tried for multi-day windows, largest first, with their window length in days
+RANGE_ZOOM_LEVELS = (("month", 31), ("week", 7))
+
+# Anything spaced a day apart (23h on DST days) is a daily aggregate, not hourly rows
+_MAX_HOURLY_GAP_MS = 23 * 60 * 60 * 1000
+
+FetchWindow = Callable[[date, date, str], Awaitable[HourlySeries | None]]
+
+
+def local_day_start_ms(day: date, local_tz: tzinfo) -> int:
+    """Return the start of a local day as epoch milliseconds."""
+    return int(datetime.combine(day, time.min, tzinfo=local_tz).timestamp() * 1000)
+
+
+def is_hourly_series(series: HourlySeries) -> bool:
+    """Return True if the rows look like hourly readings rather than daily totals."""
+    timestamps = series.timestamps
+    return all(0 < later - earlier < _MAX_HOURLY_GAP_MS for earlier, later in zip(timestamps, timestamps[1:]))
+
+
+def split_by_local_day(series: HourlySeries, days: list[date], local_tz: tzinfo) -> dict[date, HourlySeries | None]:
+    """Slice a multi-day series into one zero-copy series per local day."""
+    result = {}
+    for day in days:
+        day_series = series.between(
+            local_day_start_ms(day, local_tz), local_day_start_ms(day + timedelta(days=1), local_tz)
+        )
+        result[day] = day_series if len(day_series) else None
+    return result
+
+
+class HourlyRangeFetcher:  # pylint: disable=too-few-public-methods
+    """Fetch hourly usage for a date range with as few requests as the portal allows.
+
+    Ranges are split into week or month windows. When a window request fails,
+    is rejected or stops short its days are requested one by one instead. Only
+    an explicit rejection (a failed operation or daily instead of hourly rows)
+    followed by per-day requests that return data stops the zoom level from
+    being tried again; transient errors do not.
+    """
+
+    def __init__(
+        self,
+        fetch_window: FetchWindow,
+        local_tz: tzinfo,
+        concurrency: int,
+        zoom_levels=RANGE_ZOOM_LEVELS,
+    ):
+        """Initialize the range fetcher."""
+        self._fetch_window = fetch_window
+        self._local_tz = local_tz
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._zoom_levels = zoom_levels
+        self._unsupported: set[str] = set()
+        self.requests = 0
+
+    async def async_fetch(self, start_day: date, end_day: date) -> dict[date, HourlySeries | None]:
+        """Return hourly rows for every local day from start_day to end_day inclusive."""
+        results = await asyncio.gather(
+            *(self._async_fetch_window(start, end, zoom) for start, end, zoom in self._windows(start_day, end_day))
+        )
+        days: dict[date, HourlySeries | None] = {}
+        for result in results:
+            days.update(result)
+        return days
+
+    def _windows(self, start_day: date, end_day: date):
+        """Yield (start, end, zoom) windows covering the range."""
+        zoom, size = next(
+            ((zoom, size) for zoom, size in self._zoom_levels if zoom not in self._unsupported),
+            ("day", 1),
+        )
+        day = start_day
+        while day <= end_day:
+            window_end = min(day + timedelta(days=size - 1), end_day)
+            yield day, window_end, zoom
+            day = window_end + timedelta(days=1)
+
+    async def _async_fetch_window(self, start: date, end: date, zoom: str) -> dict[date, HourlySeries | None]:
+        """Fetch one window, falling back to per-day requests if the portal rejects it."""
+        days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+        ranged = zoom != "day" and len(days) > 1
+        rejected = False
+        if ranged:
+            try:
+                rows = await self._async_request(start, end, zoom)
+            except SensusAnalyticsApiError as error:
+                # Timeouts and server errors say nothing about the zoom level
+                _LOGGER.debug("Zoom %s request for %s to %s failed: %s", zoom, start, end, error)
+            else:
+                if rows and is_hourly_series(rows):
+                    if rows.timestamps[-1] >= local_day_start_ms(end, self._local_tz):
+                        return split_by_local_day(rows, days, self._local_tz)
+                    _LOGGER.debug("Zoom %s window %s to %s stopped short", zoom, start, end)
+                else:
+                    # A failed operation or daily totals instead of hourly rows
+                    rejected = True
+            _LOGGER.debug("Falling back to daily requests for %s to %s", start, end)
+
+        daily = await asyncio.gather(*(self._async_request(day, day, "day") for day in days))
+        # Only blame the zoom level if the same days are served one at a time
+        if rejected and any(daily) and zoom not in self._unsupported:
+            _LOGGER.info("Portal does not serve hourly data at zoom %s, using daily requests", zoom)
+            self._unsupported.add(zoom)
+        return {day: rows or None for day, rows in zip(days, daily)}
+
+    async def _async_request(self, start: date, end: date, zoom: str) -> HourlySeries | None:
+        """Issue one usage request under the concurrency limit."""
+        async with self._semaphore:
+            self.requests += 1
+            return await self._fetch_window(start, end, zoom)
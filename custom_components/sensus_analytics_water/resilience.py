@@ -0,0 +1,124 @@
+"""Backoff, jitter and circuit breaking for upstream failures."""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+
+from .const import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RECOVERY_TIMEOUT, DATA_CIRCUIT_BREAKERS, POLL_JITTER
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def jittered(interval: timedelta) -> timedelta:
+    """Stretch an interval by a random fraction so entries drift out of lockstep."""
+    return interval * (1 + random.uniform(0, POLL_JITTER))  # nosec B311
+
+
+class ExponentialBackoff:
+    """Grow the poll interval on consecutive failures, with equal jitter."""
+
+    def __init__(self, base: timedelta, maximum: timedelta):
+        """Initialize the backoff."""
+        self.base = base
+        self.maximum = max(base, maximum)
+        self.failures = 0
+
+    def next_interval(self) -> timedelta:
+        """Record a failure and return how long to wait before retrying."""
+        self.failures += 1
+        ceiling = min(self.maximum, self.base * 2 ** min(self.failures - 1, 16))
+        # Keep at least half the ceiling so retries still spread out
+        return ceiling / 2 + ceiling / 2 * random.random()  # nosec B311
+
+    def reset(self) -> None:
+        """Forget previous failures after a successful poll."""
+        self.failures = 0
+
+
+class CircuitBreaker:
+    """Stop polling a host after repeated failures until a probe succeeds.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    every poll is short-circuited. Once ``recovery_timeout`` has passed a
+    single poll is let through as a probe; its result closes the circuit or
+    opens it again.
+    """
+
+    def __init__(self, host: str, failure_threshold: int, recovery_timeout: float):
+        """Initialize the circuit breaker."""
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self.short_circuited = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while polls to the host are being short-circuited."""
+        return self._opened_at is not None
+
+    def retry_after(self) -> float:
+        """Return the seconds until the next probe is allowed."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Return True if a poll may contact the host."""
+        if self._opened_at is None:
+            return True
+        if not self._probing and self.retry_after() == 0:
+            self._probing = True
+            return True
+        self.short_circuited += 1
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        if self._opened_at is not None:
+            _LOGGER.info("%s is reachable again, resuming polls", self.host)
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def release_probe(self) -> None:
+        """Let the next poll probe again when a probe ended without an outcome."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the circuit once the threshold is reached."""
+        self.failures += 1
+        if self._probing or (self._opened_at is None and self.failures >= self.failure_threshold):
+            _LOGGER.warning(
+                "%s failed %s times in a row, pausing polls for %s seconds",
+                self.host,
+                self.failures,
+                self.recovery_timeout,
+            )
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def as_dict(self) -> dict:
+        """Return the breaker state for diagnostics."""
+        return {
+            "open": self.is_open,
+            "failures": self.failures,
+            "short_circuited": self.short_circuited,
+            "retry_after": round(self.retry_after(), 1),
+        }
+
+
+def async_get_circuit_breaker(hass: HomeAssistant, base_url: str) -> CircuitBreaker:
+    """Return the circuit breaker shared by every entry polling a base URL."""
+    breakers: dict[str, CircuitBreaker] = hass.data.setdefault(DATA_CIRCUIT_BREAKERS, {})
+    breaker = breakers.get(base_url)
+    if breaker is None:
+        breaker = breakers[base_url] = CircuitBreaker(base_url, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RECOVERY_TIMEOUT)
+    return breaker
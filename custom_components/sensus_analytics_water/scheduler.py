@@ -0,0 +1,95 @@
+"""Adaptive poll scheduling driven by the meter's lastRead timestamp."""
+
+from __future__ import annotations
+
+import statistics
+from collections import deque
+from datetime import datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+
+# Polling interval the integration used before it learned the upload cadence
+BASELINE_INTERVAL = timedelta(minutes=5)
+# Number of lastRead changes used to estimate the upload cadence
+CADENCE_SAMPLES = 8
+
+
+class AdaptivePollScheduler:
+    """Learn how often the meter uploads and poll around the predicted next read.
+
+    Between uploads the interval grows towards ``max_interval``; once the next
+    read is due (or overdue) it tightens to ``min_interval``.
+    """
+
+    def __init__(self, min_interval: timedelta, max_interval: timedelta):
+        """Initialize the scheduler."""
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self._reads: deque[datetime] = deque(maxlen=CADENCE_SAMPLES + 1)
+        self._started = dt_util.utcnow()
+        self.polls = 0
+        self.polls_with_new_read = 0
+
+    @property
+    def cadence(self) -> timedelta | None:
+        """Return the median time between meter uploads, if known."""
+        if len(self._reads) < 2:
+            return None
+        reads = list(self._reads)
+        deltas = [(later - earlier).total_seconds() for earlier, later in zip(reads, reads[1:])]
+        return timedelta(seconds=statistics.median(deltas))
+
+    @property
+    def last_read(self) -> datetime | None:
+        """Return the most recent lastRead seen."""
+        return self._reads[-1] if self._reads else None
+
+    @property
+    def predicted_next_read(self) -> datetime | None:
+        """Return when the next upload is expected."""
+        cadence = self.cadence
+        if cadence is None:
+            return None
+        return self._reads[-1] + cadence
+
+    def observe(self, last_read_ms) -> None:
+        """Record the lastRead value returned by a successful poll."""
+        self.polls += 1
+        if not last_read_ms:
+            return
+        try:
+            last_read = dt_util.utc_from_timestamp(last_read_ms / 1000)
+        except (ValueError, TypeError):
+            return
+        if self._reads and last_read <= self._reads[-1]:
+            return
+        self._reads.append(last_read)
+        self.polls_with_new_read += 1
+
+    def next_interval(self, now: datetime | None = None) -> timedelta:
+        """Return how long to wait before the next poll."""
+        predicted = self.predicted_next_read
+        if predicted is None:
+            # Still learning the cadence
+            return self.min_interval
+        now = now or dt_util.utcnow()
+        remaining = predicted - now
+        if remaining > self.min_interval:
+            # Sleep until shortly before the predicted read
+            wait = remaining - self.min_interval
+        else:
+            # Due or overdue: poll fast at first, then relax if the upload never shows up
+            wait = max(self.min_interval, (now - predicted) / 4)
+        return min(max(wait, self.min_interval), self.max_interval)
+
+    @property
+    def baseline_polls(self) -> int:
+        """Return how many polls a fixed five-minute interval would have made."""
+        elapsed = dt_util.utcnow() - self._started
+        return int(elapsed / BASELINE_INTERVAL) + 1
+
+    @property
+    def request_reduction(self) -> float:
+        """Return the percentage of polls avoided compared to the fixed interval."""
+        baseline = self.baseline_polls
+        return round(max(0.0, 1 - self.polls / baseline) * 100, 1)
@@ -1,125 +1,204 @@
 """Sensor platform for the Sensus Analytics Integration."""
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .const import DEFAULT_NAME, DOMAIN
-
-CF_TO_GALLON = 7.48052
+from .const import DEFAULT_NAME, DOMAIN, HOUSEHOLD_METER_ID
+from .meter import meter_identity
+from .snapshot import convert_usage
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     """Set up the Sensus Analytics sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
     currency = hass.config.currency
-    sensors = [
-        SensusAnalyticsDailyUsageSensor(coordinator, entry),
-        SensusAnalyticsUsageUnitSensor(coordinator, entry),
-        SensusAnalyticsMeterAddressSensor(coordinator, entry),
-        SensusAnalyticsLastReadSensor(coordinator, entry),
-        SensusAnalyticsMeterLongitudeSensor(coordinator, entry),
-        SensusAnalyticsMeterIdSensor(coordinator, entry),
-        SensusAnalyticsMeterLatitudeSensor(coordinator, entry),
-        MeterOdometerSensor(coordinator, entry),
-        SensusAnalyticsBillingUsageSensor(coordinator, entry),
-        SensusAnalyticsBillingCostSensor(coordinator, entry, currency),
-        SensusAnalyticsDailyFeeSensor(coordinator, entry, currency),
-        LastHourUsageSensor(coordinator, entry),
-        LastHourRainfallSensor(coordinator, entry),
-        LastHourTemperatureSensor(coordinator, entry),
-        LastHourTimestampSensor(coordinator, entry),
+    known_meters: set[str] = set()
+
+    def _new_meter_sensors():
+        """Return the sensors of meters that have no entities yet."""
+        sensors = []
+        for meter_id in coordinator.meters:
+            if meter_id in known_meters:
+                continue
+            known_meters.add(meter_id)
+            if meter_id == HOUSEHOLD_METER_ID:
+                sensors.extend(_household_sensors(coordinator, entry, currency))
+            elif meter_id == coordinator.water_meter_number:
+                sensors.extend(_meter_sensors(coordinator, entry, currency))
+            else:
+                sensors.extend(_meter_sensors(coordinator, entry, currency, meter_id))
+        return sensors
+
+    @callback
+    def _async_add_new_meters() -> None:
+        """Add sensors for meters a poll found after setup."""
+        if sensors := _new_meter_sensors():
+            async_add_entities(sensors)
+
+    # The coordinator already holds data, either restored or freshly polled, so
+    # adding the entities must not wait for another poll of the portal
+    async_add_entities(
+        [
+            *_new_meter_sensors(),
+            SensusAnalyticsLoginsSkippedSensor(coordinator, entry),
+            SensusAnalyticsRequestReductionSensor(coordinator, entry),
+            SensusAnalyticsLastPollDurationSensor(coordinator, entry),
+            SensusAnalyticsUpstreamErrorRateSensor(coordinator, entry),
+        ],
+        update_before_add=False,
+    )
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_meters))
+
+
+def _meter_sensors(coordinator, entry, currency, meter_id=None):
+    """Return the sensors of one meter, the configured one by default."""
+    return [
+        SensusAnalyticsDailyUsageSensor(coordinator, entry, meter_id),
+        SensusAnalyticsUsageUnitSensor(coordinator, entry, meter_id),
+        SensusAnalyticsMeterAddressSensor(coordinator, entry, meter_id),
+        SensusAnalyticsLastReadSensor(coordinator, entry, meter_id),
+        SensusAnalyticsMeterLongitudeSensor(coordinator, entry, meter_id),
+        SensusAnalyticsMeterIdSensor(coordinator, entry, meter_id),
+        SensusAnalyticsMeterLatitudeSensor(coordinator, entry, meter_id),
+        MeterOdometerSensor(coordinator, entry, meter_id),
+        SensusAnalyticsBillingUsageSensor(coordinator, entry, meter_id),
+        SensusAnalyticsBillingCostSensor(coordinator, entry, currency, meter_id),
+        SensusAnalyticsDailyFeeSensor(coordinator, entry, currency, meter_id),
+        LastHourUsageSensor(coordinator, entry, meter_id),
+        LastHourRainfallSensor(coordinator, entry, meter_id),
+        LastHourTemperatureSensor(coordinator, entry, meter_id),
+        LastHourTimestampSensor(coordinator, entry, meter_id),
+        LastHourCostSensor(coordinator, entry, currency, meter_id),
+        RollingUsageSensor(coordinator, entry, 7, meter_id),
+        RollingUsageSensor(coordinator, entry, 30, meter_id),
+        BillingCycleHourlyTotalSensor(coordinator, entry, meter_id),
+        UsageAnomalyScoreSensor(coordinator, entry, meter_id),
+        ExpectedDailyUsageSensor(coordinator, entry, meter_id),
     ]
-    async_add_entities(sensors, True)
 
 
-# pylint: disable=too-few-public-methods
-class UsageConversionMixin:
-    """Mixin to provide usage conversion."""
+def _household_sensors(coordinator, entry, currency):
+    """Return the sensors of the household total device."""
+    return [
+        SensusAnalyticsDailyUsageSensor(coordinator, entry, HOUSEHOLD_METER_ID),
+        SensusAnalyticsLastReadSensor(coordinator, entry, HOUSEHOLD_METER_ID),
+        MeterOdometerSensor(coordinator, entry, HOUSEHOLD_METER_ID),
+        SensusAnalyticsBillingUsageSensor(coordinator, entry, HOUSEHOLD_METER_ID),
+        SensusAnalyticsBillingCostSensor(coordinator, entry, currency, HOUSEHOLD_METER_ID),
+        SensusAnalyticsDailyFeeSensor(coordinator, entry, currency, HOUSEHOLD_METER_ID),
+        LastHourUsageSensor(coordinator, entry, HOUSEHOLD_METER_ID),
+        LastHourCostSensor(coordinator, entry, currency, HOUSEHOLD_METER_ID),
+    ]
 
-    # pylint: disable=too-many-return-statements
-    def _convert_usage(self, usage, usage_unit=None):
-        """Convert usage based on configuration and native unit."""
-        if usage is None:
-            return None
-        if usage_unit is None:
-            usage_unit = self.coordinator.data.get("usageUnit")
-
-        config_unit_type = self.coordinator.config_entry.data.get("unit_type")
-
-        if usage_unit == "CF" and config_unit_type == "gal":
-            try:
-                return round(float(usage) * CF_TO_GALLON)
-            except (ValueError, TypeError):
-                return None
-        elif usage_unit == "GAL" and config_unit_type == "CF":
-            try:
-                return round(float(usage) / CF_TO_GALLON)
-            except (ValueError, TypeError):
-                return None
-        elif usage_unit == "GAL" and config_unit_type == "gal":
-            return usage
-        return usage
-
-    def _get_usage_unit(self):
-        """Determine the unit of measurement for usage sensors."""
-        usage_unit = self.coordinator.data.get("usageUnit")
-        config_unit_type = self.coordinator.config_entry.data.get("water_unit_type")
-
-        if usage_unit == "CF" and config_unit_type == "gal":
-            return "gal"
-        if usage_unit == "GAL" and config_unit_type == "CF":
-            return "CF"
-        if usage_unit == "GAL" and config_unit_type == "gal":
-            return "gal"
-        return usage_unit
-
-
-class DynamicUnitSensorBase(UsageConversionMixin, CoordinatorEntity, SensorEntity):
-    """Base class for sensors with dynamic units."""
 
-    def __init__(self, coordinator, entry):
-        """Initialize the dynamic unit sensor base."""
+class SensusSensorBase(CoordinatorEntity, SensorEntity):
+    """Base class for Sensus sensors that only write state when it changed.
+
+    Each coordinator update compares the sensor's value, unit, last reset and
+    attributes with what was last written and skips the write if nothing
+    changed. Sensors with ``_static`` set skip the comparison once their value
+    is written and only write again when availability or the stale flag
+    changes. Sensors with ``_hourly`` set are also re-evaluated at the top of
+    each hour.
+    """
+
+    # Values that do not change for a meter, such as its id and location
+    _static = False
+    # Values picked by the current local hour, re-evaluated at every hour boundary
+    _hourly = False
+
+    def __init__(self, coordinator, entry, meter_id=None):
+        """Initialize the sensor base."""
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.entry = entry
-        self._unique_id = f"{DOMAIN}_{entry.entry_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=DEFAULT_NAME,
-            manufacturer="Unknown",
-            model="Water Utility Meter",
-        )
+        self.meter = coordinator.meters[meter_id or coordinator.water_meter_number]
+        self._unique_id, self._name_prefix, self._attr_device_info = meter_identity(entry, meter_id)
+        self._written_state = None
+
+    @property
+    def available(self):
+        """Return True once data is loaded, keeping stale values visible after failed polls."""
+        return self.meter.snapshot is not None
+
+    @property
+    def _stale(self) -> bool:
+        """Return True while the data comes from storage or the last poll failed."""
+        return self.coordinator.restored or not self.coordinator.last_update_success
+
+    @property
+    def extra_state_attributes(self):
+        """Return when the data behind the sensor was fetched and whether it is stale."""
+        return {"data_fetched_at": self.coordinator.fetched_at, "stale": self._stale}
+
+    def _state_fingerprint(self):
+        """Return everything a state write would publish, except the fetch time."""
+        if not self.available:
+            return (False,)
+        attributes = dict(self.extra_state_attributes or {})
+        # The fetch time moves on every poll; it is refreshed whenever the state is written
+        attributes.pop("data_fetched_at", None)
+        return (True, self.native_value, self.native_unit_of_measurement, self.last_reset, attributes)
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the state written when the sensor is added and start the hourly tick."""
+        await super().async_added_to_hass()
+        self._written_state = self._state_fingerprint()
+        if self._hourly:
+            self.async_on_remove(async_track_time_change(self.hass, self._async_hour_changed, minute=0, second=0))
+
+    @callback
+    def _async_hour_changed(self, _now) -> None:
+        """Publish the cached row for the new hour without polling the portal."""
+        self._handle_coordinator_update()
+
+    def _static_unchanged(self) -> bool:
+        """Return True if a static value was written with the current availability and stale flag."""
+        written = self._written_state
+        if not self._static or not written or not written[0] or written[1] is None:
+            return False
+        # Only the availability and stale flag can change once a static value is written
+        return self.available and written[4].get("stale") == self._stale
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the sensor's value or attributes changed."""
+        if self._static_unchanged():
+            self.coordinator.state_writes_skipped += 1
+            return
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._written_state:
+            self.coordinator.state_writes_skipped += 1
+            return
+        self._written_state = fingerprint
+        self.coordinator.state_writes += 1
+        self.async_write_ha_state()
+
+
+class DynamicUnitSensorBase(SensusSensorBase):
+    """Base class for sensors with dynamic units."""
 
     @property
     def native_unit_of_measurement(self):
         """Return the unit of measurement."""
-        unit = self._get_usage_unit()
-        if unit == "GAL":
-            unit = "gal"  # convert to the HA standard
-        return unit
+        snapshot = self.meter.snapshot
+        return snapshot.usage_unit if snapshot else None
 
 
-class StaticUnitSensorBase(UsageConversionMixin, CoordinatorEntity, SensorEntity):
+class StaticUnitSensorBase(SensusSensorBase):
     """Base class for sensors with static units."""
 
-    def __init__(self, coordinator, entry, unit=None, device_class=None):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, coordinator, entry, unit=None, device_class=None, meter_id=None):
         """Initialize the static unit sensor base."""
-        super().__init__(coordinator)
-        self.coordinator = coordinator
-        self.entry = entry
-        self._unique_id = f"{DOMAIN}_{entry.entry_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=DEFAULT_NAME,
-            manufacturer="Unknown",
-            model="Water Utility Meter",
-        )
+        super().__init__(coordinator, entry, meter_id)
         if unit:
             self._attr_native_unit_of_measurement = unit
         if device_class:
@@ -129,10 +208,10 @@ class StaticUnitSensorBase(UsageConversionMixin, CoordinatorEntity, SensorEntity
 class SensusAnalyticsDailyUsageSensor(DynamicUnitSensorBase):
     """Representation of the daily usage sensor."""
 
-    def __init__(self, coordinator, entry):
+    def __init__(self, coordinator, entry, meter_id=None):
         """Initialize the daily usage sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_name = f"{DEFAULT_NAME} Daily Usage"
+        super().__init__(coordinator, entry, meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Daily Usage"
         self._attr_unique_id = f"{self._unique_id}_daily_usage"
         self._attr_icon = "mdi:water"
         self._attr_device_class = SensorDeviceClass.WATER
@@ -141,132 +220,132 @@ class SensusAnalyticsDailyUsageSensor(DynamicUnitSensorBase):
     @property
     def last_reset(self):
         """Return the last reset time for the daily usage sensor."""
-        return dt_util.start_of_local_day()
+        return self.meter.snapshot.day_start
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        daily_usage = self.coordinator.data.get("dailyUsage")
-        return self._convert_usage(daily_usage)
+        return self.meter.snapshot.daily_usage
 
 
 class SensusAnalyticsUsageUnitSensor(StaticUnitSensorBase):
     """Representation of the usage unit sensor."""
 
-    def __init__(self, coordinator, entry):
+    _static = True
+
+    def __init__(self, coordinator, entry, meter_id=None):
         """Initialize the usage unit sensor."""
-        super().__init__(coordinator, entry, unit=None)
-        self._attr_name = f"{DEFAULT_NAME} Native Usage Unit"
+        super().__init__(coordinator, entry, unit=None, meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Native Usage Unit"
         self._attr_unique_id = f"{self._unique_id}_usage_unit"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        unit = self.coordinator.data.get("usageUnit")
-        if unit == "GAL":
-            unit = "gal"
-        return unit
+        return self.meter.snapshot.native_usage_unit
 
 
 class SensusAnalyticsMeterAddressSensor(StaticUnitSensorBase):
     """Representation of the meter address sensor."""
 
-    def __init__(self, coordinator, entry):
+    _static = True
+
+    def __init__(self, coordinator, entry, meter_id=None):
         """Initialize the meter address sensor."""
-        super().__init__(coordinator, entry, unit=None)
-        self._attr_name = f"{DEFAULT_NAME} Meter Address"
+        super().__init__(coordinator, entry, unit=None, meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Meter Address"
         self._attr_unique_id = f"{self._unique_id}_meter_address"
         self._attr_icon = "mdi:map-marker"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        return self.coordinator.data.get("meterAddress1")
+        return self.meter.snapshot.meter_address
 
 
 class SensusAnalyticsLastReadSensor(StaticUnitSensorBase):
     """Representation of the last read timestamp sensor."""
 
-    def __init__(self, coordinator, entry):
+    def __init__(self, coordinator, entry, meter_id=None):
         """Initialize the last read sensor."""
         super().__init__(
             coordinator,
             entry,
             unit=None,
             device_class=SensorDeviceClass.TIMESTAMP,
+            meter_id=meter_id,
         )
-        self._attr_name = f"{DEFAULT_NAME} Last Read"
+        self._attr_name = f"{self._name_prefix} Last Read"
         self._attr_unique_id = f"{self._unique_id}_last_read"
         self._attr_icon = "mdi:clock-time-nine"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        last_read_ts = self.coordinator.data.get("lastRead")
-        if last_read_ts:
-            # Convert milliseconds to seconds for timestamp
-            try:
-                return dt_util.utc_from_timestamp(last_read_ts / 1000)
-            except (ValueError, TypeError):
-                return None
-        return None
+        return self.meter.snapshot.last_read
 
 
 class SensusAnalyticsMeterLongitudeSensor(StaticUnitSensorBase):
     """Representation of the meter longitude sensor."""
 
-    def __init__(self, coordinator, entry):
+    _static = True
+
+    def __init__(self, coordinator, entry, meter_id=None):
         """Initialize the meter longitude sensor."""
-        super().__init__(coordinator, entry, unit="°")
-        self._attr_name = f"{DEFAULT_NAME} Meter Longitude"
+        super().__init__(coordinator, entry, unit="°", meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Meter Longitude"
         self._attr_unique_id = f"{self._unique_id}_meter_longitude"
         self._attr_icon = "mdi:longitude"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        return self.coordinator.data.get("meterLong")
+        return self.meter.snapshot.meter_longitude
 
 
 class SensusAnalyticsMeterIdSensor(StaticUnitSensorBase):
     """Representation of the meter ID sensor."""
 
-    def __init__(self, coordinator, entry):
+    _static = True
+
+    def __init__(self, coordinator, entry, meter_id=None):
         """Initialize the meter ID sensor."""
-        super().__init__(coordinator, entry, unit=None)
-        self._attr_name = f"{DEFAULT_NAME} Meter ID"
+        super().__init__(coordinator, entry, unit=None, meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Meter ID"
         self._attr_unique_id = f"{self._unique_id}_meter_id"
         self._attr_icon = "mdi:account"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        return self.coordinator.data.get("meterId")
+        return self.meter.snapshot.meter_id
 
 
 class SensusAnalyticsMeterLatitudeSensor(StaticUnitSensorBase):
     """Representation of the meter latitude sensor."""
 
-    def __init__(self, coordinator, entry):
+    _static = True
+
+    def __init__(self, coordinator, entry, meter_id=None):
         """Initialize the meter latitude sensor."""
-        super().__init__(coordinator, entry, unit="°")
-        self._attr_name = f"{DEFAULT_NAME} Meter Latitude"
+        super().__init__(coordinator, entry, unit="°", meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Meter Latitude"
         self._attr_unique_id = f"{self._unique_id}_meter_latitude"
         self._attr_icon = "mdi:latitude"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        return self.coordinator.data.get("meterLat")
+        return self.meter.snapshot.meter_latitude
 
 
 class MeterOdometerSensor(DynamicUnitSensorBase):
     """Representation of the meter odometer sensor (previously latest read usage)."""
 
-    def __init__(self, coordinator, entry):
+    def __init__(self, coordinator, entry, meter_id=None):
         """Initialize the meter odometer sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_name = f"{DEFAULT_NAME} Meter Odometer"
+        super().__init__(coordinator, entry, meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Meter Odometer"
         self._attr_unique_id = f"{self._unique_id}_meter_odometer"
         self._attr_icon = "mdi:water"
         self._attr_device_class = SensorDeviceClass.WATER
@@ -280,17 +359,16 @@ class MeterOdometerSensor(DynamicUnitSensorBase):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        latest_read_usage = self.coordinator.data.get("latestReadUsage")
-        return self._convert_usage(latest_read_usage)
+        return self.meter.snapshot.meter_odometer
 
 
 class SensusAnalyticsBillingUsageSensor(DynamicUnitSensorBase):
     """Representation of the billing usage sensor."""
 
-    def __init__(self, coordinator, entry):
+    def __init__(self, coordinator, entry, meter_id=None):
         """Initialize the billing usage sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_name = f"{DEFAULT_NAME} Billing Usage"
+        super().__init__(coordinator, entry, meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Billing Usage"
         self._attr_unique_id = f"{self._unique_id}_billing_usage"
         self._attr_icon = "mdi:water"
         self._attr_device_class = SensorDeviceClass.WATER
@@ -299,133 +377,55 @@ class SensusAnalyticsBillingUsageSensor(DynamicUnitSensorBase):
     @property
     def last_reset(self):
         """Return the last reset time for the billing usage sensor."""
-        local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
-        now = datetime.now(local_tz)
-        return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        return self.meter.snapshot.billing_cycle_start
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        billing_usage = self.coordinator.data.get("billingUsage")
-        return self._convert_usage(billing_usage)
+        return self.meter.snapshot.billing_usage
 
 
 class SensusAnalyticsBillingCostSensor(StaticUnitSensorBase):
     """Representation of the billing cost sensor."""
 
-    def __init__(self, coordinator, entry, currency):
+    def __init__(self, coordinator, entry, currency, meter_id=None):
         """Initialize the billing cost sensor."""
-        super().__init__(coordinator, entry, unit=currency)
-        self._attr_name = f"{DEFAULT_NAME} Billing Cost"
+        super().__init__(coordinator, entry, unit=currency, meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Billing Cost"
         self._attr_unique_id = f"{self._unique_id}_billing_cost"
         self._attr_icon = "mdi:currency-usd"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        usage = self.coordinator.data.get("billingUsage")
-        if usage is None:
-            return None
-        usage_gallons = self._convert_usage(usage)
-        return self._calculate_water_cost(usage_gallons)
-
-    def _calculate_water_cost(self, usage_gallons):
-        """Calculate the billing cost based on tiers and service fee."""
-        water_tier1_gallons = self.coordinator.config_entry.data.get("water_tier1_gallons") or 0
-        water_tier1_price = self.coordinator.config_entry.data.get("water_tier1_price")
-        water_tier2_gallons = self.coordinator.config_entry.data.get("water_tier2_gallons") or 0
-        water_tier2_price = self.coordinator.config_entry.data.get("water_tier2_price") or 0
-        water_tier3_price = self.coordinator.config_entry.data.get("water_tier3_price") or 0
-        water_service_fee = self.coordinator.config_entry.data.get("water_service_fee")
-
-        cost = water_service_fee
-        if usage_gallons is not None:
-            if water_tier1_gallons == 0:
-                # No tier 1 limit, all usage is charged at tier 1 price
-                cost += usage_gallons * water_tier1_price
-            elif water_tier2_gallons == 0:
-                # No tier 2 limit, calculate for tier 1 and tier 2
-                if usage_gallons <= water_tier1_gallons:
-                    cost += usage_gallons * water_tier1_price
-                else:
-                    cost += water_tier1_gallons * water_tier1_price
-                    cost += (usage_gallons - water_tier1_gallons) * water_tier2_price
-            elif water_tier3_price > 0:
-                # Calculate for all three tiers
-                if usage_gallons <= water_tier1_gallons:
-                    cost += usage_gallons * water_tier1_price
-                elif usage_gallons <= water_tier1_gallons + water_tier2_gallons:
-                    cost += water_tier1_gallons * water_tier1_price
-                    cost += (usage_gallons - water_tier1_gallons) * water_tier2_price
-                else:
-                    cost += water_tier1_gallons * water_tier1_price
-                    cost += water_tier2_gallons * water_tier2_price
-                    cost += (usage_gallons - water_tier1_gallons - water_tier2_gallons) * water_tier3_price
-
-        return round(cost, 2)
+        return self.meter.snapshot.billing_cost
 
 
 class SensusAnalyticsDailyFeeSensor(StaticUnitSensorBase):
     """Representation of the daily fee sensor."""
 
-    def __init__(self, coordinator, entry, currency):
+    def __init__(self, coordinator, entry, currency, meter_id=None):
         """Initialize the daily fee sensor."""
-        super().__init__(coordinator, entry, unit=currency)
-        self._attr_name = f"{DEFAULT_NAME} Daily Fee"
+        super().__init__(coordinator, entry, unit=currency, meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Daily Fee"
         self._attr_unique_id = f"{self._unique_id}_daily_fee"
         self._attr_icon = "mdi:currency-usd"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        usage = self.coordinator.data.get("dailyUsage")
-        if usage is None:
-            return None
-        usage_gallons = self._convert_usage(usage)
-        return self._calculate_water_daily_fee(usage_gallons)
-
-    def _calculate_water_daily_fee(self, usage_gallons):
-        """Calculate the daily fee based on tiers."""
-        tier1_gallons = self.coordinator.config_entry.data.get("water_tier1_gallons") or 0
-        tier1_price = self.coordinator.config_entry.data.get("water_tier1_price")
-        tier2_gallons = self.coordinator.config_entry.data.get("water_tier2_gallons") or 0
-        tier2_price = self.coordinator.config_entry.data.get("water_tier2_price") or 0
-        tier3_price = self.coordinator.config_entry.data.get("water_tier3_price") or 0
-
-        cost = 0
-        if usage_gallons is not None:
-            if tier1_gallons == 0:
-                # No tier 1 limit, all usage is charged at tier 1 price
-                cost += usage_gallons * tier1_price
-            elif tier2_gallons == 0:
-                # No tier 2 limit, calculate for tier 1 and tier 2
-                if usage_gallons <= tier1_gallons:
-                    cost += usage_gallons * tier1_price
-                else:
-                    cost += tier1_gallons * tier1_price
-                    cost += (usage_gallons - tier1_gallons) * tier2_price
-            elif tier3_price > 0:
-                # Calculate for all three tiers
-                if usage_gallons <= tier1_gallons:
-                    cost += usage_gallons * tier1_price
-                elif usage_gallons <= tier1_gallons + tier2_gallons:
-                    cost += tier1_gallons * tier1_price
-                    cost += (usage_gallons - tier1_gallons) * tier2_price
-                else:
-                    cost += tier1_gallons * tier1_price
-                    cost += tier2_gallons * tier2_price
-                    cost += (usage_gallons - tier1_gallons - tier2_gallons) * tier3_price
-
-        return round(cost, 2)
+        return self.meter.snapshot.daily_fee
 
 
 class LastHourUsageSensor(DynamicUnitSensorBase):
     """Representation of the last hour usage sensor."""
 
-    def __init__(self, coordinator, entry):
+    _hourly = True
+
+    def __init__(self, coordinator, entry, meter_id=None):
         """Initialize the last hour usage sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_name = f"{DEFAULT_NAME} Last Hour Usage"
+        super().__init__(coordinator, entry, meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Last Hour Usage"
         self._attr_unique_id = f"{self._unique_id}_last_hour_water_usage"
         self._attr_icon = "mdi:water"
         self._attr_device_class = SensorDeviceClass.WATER
@@ -434,110 +434,318 @@ class LastHourUsageSensor(DynamicUnitSensorBase):
     @property
     def last_reset(self):
         """Return the last reset time for the last hour usage sensor."""
-        local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
-        now = datetime.now(local_tz)
-        return now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
+        return dt_util.now().replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
 
     @property
     def native_value(self):
         """Return the usage for the current hour from the previous day."""
-        local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
-        now = datetime.now(local_tz)
-        target_hour = now.hour
-        hourly_data = self.coordinator.data.get("hourly_usage_data", [])
-        if not hourly_data:
+        entry = self.meter.hourly_index.get(dt_util.now().hour)
+        if entry is None:
             return None
-
-        # Find the data corresponding to target_hour from the previous day
-        for entry in hourly_data:
-            entry_time = dt_util.utc_from_timestamp(entry["timestamp"] / 1000).astimezone(local_tz)
-            if entry_time.hour == target_hour:
-                usage = entry["usage"]
-                usage_unit = entry.get("usage_unit")
-                return self._convert_usage(usage, usage_unit)
-        return None
+        return entry["converted_usage"]
 
 
 class LastHourRainfallSensor(StaticUnitSensorBase):
     """Representation of the last hour rainfall sensor."""
 
-    def __init__(self, coordinator, entry):
+    _hourly = True
+
+    def __init__(self, coordinator, entry, meter_id=None):
         """Initialize the last hour rainfall sensor."""
-        super().__init__(coordinator, entry, unit="in")
-        self._attr_name = f"{DEFAULT_NAME} Last Hour Rainfall"
+        super().__init__(coordinator, entry, unit="in", meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Last Hour Rainfall"
         self._attr_unique_id = f"{self._unique_id}_last_hour_rainfall"
         self._attr_icon = "mdi:weather-rainy"
 
     @property
     def native_value(self):
         """Return the rainfall for the current hour from the previous day."""
-        local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
-        now = datetime.now(local_tz)
-        target_hour = now.hour
-        hourly_data = self.coordinator.data.get("hourly_usage_data", [])
-        if not hourly_data:
+        entry = self.meter.hourly_index.get(dt_util.now().hour)
+        if entry is None:
             return None
-
-        for entry in hourly_data:
-            entry_time = dt_util.utc_from_timestamp(entry["timestamp"] / 1000).astimezone(local_tz)
-            if entry_time.hour == target_hour:
-                rain = entry["rain"]
-                return rain
-        return None
+        return entry["rain"]
 
 
 class LastHourTemperatureSensor(StaticUnitSensorBase):
     """Representation of the last hour temperature sensor."""
 
-    def __init__(self, coordinator, entry):
+    _hourly = True
+
+    def __init__(self, coordinator, entry, meter_id=None):
         """Initialize the last hour temperature sensor."""
-        super().__init__(coordinator, entry, unit="°F")
-        self._attr_name = f"{DEFAULT_NAME} Last Hour Temperature"
+        super().__init__(coordinator, entry, unit="°F", meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Last Hour Temperature"
         self._attr_unique_id = f"{self._unique_id}_last_hour_temperature"
         self._attr_icon = "mdi:thermometer"
 
     @property
     def native_value(self):
         """Return the temperature for the current hour from the previous day."""
-        local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
-        now = datetime.now(local_tz)
-        target_hour = now.hour
-        hourly_data = self.coordinator.data.get("hourly_usage_data", [])
-        if not hourly_data:
+        entry = self.meter.hourly_index.get(dt_util.now().hour)
+        if entry is None:
             return None
-
-        for entry in hourly_data:
-            entry_time = dt_util.utc_from_timestamp(entry["timestamp"] / 1000).astimezone(local_tz)
-            if entry_time.hour == target_hour:
-                temp = entry["temp"]
-                return temp
-        return None
+        return entry["temp"]
 
 
 class LastHourTimestampSensor(StaticUnitSensorBase):
     """Representation of the last hour timestamp sensor."""
 
-    def __init__(self, coordinator, entry):
+    _hourly = True
+
+    def __init__(self, coordinator, entry, meter_id=None):
         """Initialize the last hour timestamp sensor."""
-        super().__init__(coordinator, entry, unit=None)
-        self._attr_name = f"{DEFAULT_NAME} Last Hour Timestamp"
+        super().__init__(coordinator, entry, unit=None, meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Last Hour Timestamp"
         self._attr_unique_id = f"{self._unique_id}_last_hour_timestamp"
         self._attr_icon = "mdi:clock-time-nine"
 
     @property
     def native_value(self):
         """Return the timestamp for the current hour's data from the previous day."""
-        local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
-        now = datetime.now(local_tz)
-        target_hour = now.hour
-        hourly_data = self.coordinator.data.get("hourly_usage_data", [])
-        if not hourly_data:
+        entry = self.meter.hourly_index.get(dt_util.now().hour)
+        if entry is None:
+            return None
+        return entry["local_time_str"]
+
+
+class LastHourCostSensor(StaticUnitSensorBase):
+    """Representation of the last hour cost sensor."""
+
+    _hourly = True
+
+    def __init__(self, coordinator, entry, currency, meter_id=None):
+        """Initialize the last hour cost sensor."""
+        super().__init__(coordinator, entry, unit=currency, meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Last Hour Cost"
+        self._attr_unique_id = f"{self._unique_id}_last_hour_cost"
+        self._attr_icon = "mdi:currency-usd"
+
+    @property
+    def native_value(self):
+        """Return the tiered cost of the current hour's usage from the previous day."""
+        entry = self.meter.hourly_index.get(dt_util.now().hour)
+        if entry is None:
+            return None
+        return entry["cost"]
+
+
+class RollingUsageSensor(DynamicUnitSensorBase):
+    """Representation of the usage over the last days of hourly readings."""
+
+    def __init__(self, coordinator, entry, days, meter_id=None):
+        """Initialize the rolling usage sensor."""
+        super().__init__(coordinator, entry, meter_id=meter_id)
+        self._hours = days * 24
+        self._attr_name = f"{self._name_prefix} Last {days} Days Usage"
+        self._attr_unique_id = f"{self._unique_id}_last_{days}_days_usage"
+        self._attr_icon = "mdi:water"
+        self._attr_device_class = SensorDeviceClass.WATER
+
+    @property
+    def native_value(self):
+        """Return the usage over the window ending at the newest hourly reading."""
+        history = self.meter.history
+        if not history:
             return None
+        total = convert_usage(history.total(self._hours), history.usage_unit, self.meter.snapshot.config_unit_type)
+        return round(total, 3)
+
+    @property
+    def extra_state_attributes(self):
+        """Return how many hours of the window the history covers."""
+        return {**super().extra_state_attributes, "hours_covered": min(len(self.meter.history), self._hours)}
+
+
+class BillingCycleHourlyTotalSensor(DynamicUnitSensorBase):
+    """Representation of the billing cycle usage added up from hourly readings."""
+
+    def __init__(self, coordinator, entry, meter_id=None):
+        """Initialize the billing cycle hourly total sensor."""
+        super().__init__(coordinator, entry, meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Billing Cycle Hourly Total"
+        self._attr_unique_id = f"{self._unique_id}_billing_cycle_hourly_total"
+        self._attr_icon = "mdi:water"
+        self._attr_device_class = SensorDeviceClass.WATER
+        self._attr_state_class = SensorStateClass.TOTAL
+
+    @property
+    def last_reset(self):
+        """Return the start of the billing cycle the total covers."""
+        return self.meter.history.cycle_start
+
+    @property
+    def native_value(self):
+        """Return the usage since the start of the billing cycle up to the newest hourly reading."""
+        history = self.meter.history
+        if not history:
+            return None
+        total = convert_usage(history.cycle_total, history.usage_unit, self.meter.snapshot.config_unit_type)
+        return round(total, 3)
+
+
+class UsageAnomalyScoreSensor(StaticUnitSensorBase):
+    """Representation of how unusual the newest day of hourly usage was."""
+
+    def __init__(self, coordinator, entry, meter_id=None):
+        """Initialize the usage anomaly score sensor."""
+        super().__init__(coordinator, entry, meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Usage Anomaly Score"
+        self._attr_unique_id = f"{self._unique_id}_usage_anomaly_score"
+        self._attr_icon = "mdi:chart-bell-curve"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self):
+        """Return the score of the newest day against the usual hour-of-week profile."""
+        latest = self.meter.baseline.latest
+        return round(latest.score, 2) if latest else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the day scored and its largest deviation."""
+        latest = self.meter.baseline.latest
+        if not latest:
+            return super().extra_state_attributes
+        return {
+            **super().extra_state_attributes,
+            "day": latest.day.isoformat(),
+            "hours_scored": latest.hours_scored,
+            "peak_hour": latest.peak_hour,
+            "peak_score": round(latest.peak_score, 2),
+            "weeks_covered": self.meter.baseline.weeks_covered,
+        }
+
+
+class ExpectedDailyUsageSensor(DynamicUnitSensorBase):
+    """Representation of the usage the hour-of-week profile expected for the newest day."""
+
+    def __init__(self, coordinator, entry, meter_id=None):
+        """Initialize the expected daily usage sensor."""
+        super().__init__(coordinator, entry, meter_id=meter_id)
+        self._attr_name = f"{self._name_prefix} Expected Daily Usage"
+        self._attr_unique_id = f"{self._unique_id}_expected_daily_usage"
+        self._attr_icon = "mdi:water-check"
+        self._attr_device_class = SensorDeviceClass.WATER
+
+    def _convert(self, usage):
+        """Convert hourly usage to the configured unit."""
+        return round(convert_usage(usage, self.meter.history.usage_unit, self.meter.snapshot.config_unit_type), 3)
+
+    @property
+    def native_value(self):
+        """Return the sum of the median usage of each hour of the newest day."""
+        latest = self.meter.baseline.latest
+        return self._convert(latest.expected) if latest else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the day and the usage actually recorded for it."""
+        latest = self.meter.baseline.latest
+        if not latest:
+            return super().extra_state_attributes
+        return {
+            **super().extra_state_attributes,
+            "day": latest.day.isoformat(),
+            "actual_usage": self._convert(latest.actual),
+        }
 
-        for entry in hourly_data:
-            entry_timestamp_ms = entry["timestamp"]
-            entry_time = dt_util.utc_from_timestamp(entry_timestamp_ms / 1000).astimezone(local_tz)
-            if entry_time.hour == target_hour:
-                # Return the timestamp as a formatted string
-                return entry_time.strftime("%Y-%m-%d %H:%M:%S")
-        return None
+
+class SensusAnalyticsLoginsSkippedSensor(StaticUnitSensorBase):
+    """Representation of the number of polls that reused an authenticated session."""
+
+    def __init__(self, coordinator, entry):
+        """Initialize the logins skipped sensor."""
+        super().__init__(coordinator, entry, unit=None)
+        self._attr_name = f"{DEFAULT_NAME} Logins Skipped"
+        self._attr_unique_id = f"{self._unique_id}_logins_skipped"
+        self._attr_icon = "mdi:login"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def native_value(self):
+        """Return how many logins were avoided since Home Assistant started."""
+        return self.coordinator.client.logins_skipped
+
+    @property
+    def extra_state_attributes(self):
+        """Return the login counters behind the skipped count."""
+        return {
+            "logins": self.coordinator.client.login_count,
+            "reauthentications": self.coordinator.client.reauth_count,
+        }
+
+
+class SensusAnalyticsRequestReductionSensor(StaticUnitSensorBase):
+    """Representation of the share of polls saved by the adaptive scheduler."""
+
+    def __init__(self, coordinator, entry):
+        """Initialize the request reduction sensor."""
+        super().__init__(coordinator, entry, unit="%")
+        self._attr_name = f"{DEFAULT_NAME} Request Reduction"
+        self._attr_unique_id = f"{self._unique_id}_request_reduction"
+        self._attr_icon = "mdi:chart-bell-curve"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self):
+        """Return the percentage of polls avoided compared to a fixed five-minute interval."""
+        return self.coordinator.scheduler.request_reduction
+
+    @property
+    def extra_state_attributes(self):
+        """Return the scheduler state behind the reduction."""
+        scheduler = self.coordinator.scheduler
+        cadence = scheduler.cadence
+        return {
+            "polls": scheduler.polls,
+            "baseline_polls": scheduler.baseline_polls,
+            "poll_interval_minutes": round(self.coordinator.update_interval.total_seconds() / 60, 1),
+            "upload_cadence_minutes": round(cadence.total_seconds() / 60, 1) if cadence else None,
+            "predicted_next_read": scheduler.predicted_next_read,
+        }
+
+
+class SensusAnalyticsLastPollDurationSensor(StaticUnitSensorBase):
+    """Representation of the duration of the most recent poll."""
+
+    def __init__(self, coordinator, entry):
+        """Initialize the last poll duration sensor."""
+        super().__init__(coordinator, entry, unit=UnitOfTime.SECONDS, device_class=SensorDeviceClass.DURATION)
+        self._attr_name = f"{DEFAULT_NAME} Last Poll Duration"
+        self._attr_unique_id = f"{self._unique_id}_last_poll_duration"
+        self._attr_icon = "mdi:timer-outline"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_entity_registry_enabled_default = False
+
+    @property
+    def native_value(self):
+        """Return how long the last coordinator update took."""
+        duration = self.coordinator.metrics.last_poll_duration
+        return None if duration is None else round(duration, 3)
+
+
+class SensusAnalyticsUpstreamErrorRateSensor(StaticUnitSensorBase):
+    """Representation of the share of recent polls that failed."""
+
+    def __init__(self, coordinator, entry):
+        """Initialize the upstream error rate sensor."""
+        super().__init__(coordinator, entry, unit="%")
+        self._attr_name = f"{DEFAULT_NAME} Upstream Error Rate"
+        self._attr_unique_id = f"{self._unique_id}_upstream_error_rate"
+        self._attr_icon = "mdi:cloud-alert"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_entity_registry_enabled_default = False
+
+    @property
+    def native_value(self):
+        """Return the percentage of recent polls that failed."""
+        return self.coordinator.metrics.error_rate
+
+    @property
+    def extra_state_attributes(self):
+        """Return the retry count behind the error rate."""
+        return {"retries": self.coordinator.metrics.retries}
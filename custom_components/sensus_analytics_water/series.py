@@ -0,0 +1,116 @@
+"""Columnar storage for hourly usage readings."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left
+from typing import NamedTuple
+
+
+def _to_float(value) -> float:
+    """Return a column value, storing missing readings as NaN."""
+    return math.nan if value is None else float(value)
+
+
+def _from_float(value: float) -> float | None:
+    """Return a reading, mapping NaN back to None."""
+    return None if math.isnan(value) else value
+
+
+class HourlyReading(NamedTuple):
+    """One hour of readings taken from a series."""
+
+    timestamp: int
+    usage: float | None
+    rain: float | None
+    temp: float | None
+
+
+class HourlySeries:
+    """Hourly readings stored as parallel typed columns with the units kept once.
+
+    Timestamps (epoch milliseconds) live in an ``array('q')`` and usage, rain and
+    temperature in ``array('d')`` columns, with NaN standing in for missing values.
+    Series returned by :meth:`between` hold memoryview slices of the parent's
+    buffers, so slicing copies no data.
+    """
+
+    __slots__ = ("timestamps", "usage", "rain", "temp", "usage_unit", "rain_unit", "temp_unit")
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, timestamps, usage, rain, temp, usage_unit=None, rain_unit=None, temp_unit=None):
+        """Initialize the series from equally long columns."""
+        self.timestamps = timestamps
+        self.usage = usage
+        self.rain = rain
+        self.temp = temp
+        self.usage_unit = usage_unit
+        self.rain_unit = rain_unit
+        self.temp_unit = temp_unit
+
+    @classmethod
+    def from_usage_list(cls, usage_list) -> HourlySeries:
+        """Build a series from the API's usage list (a units row followed by hourly rows)."""
+        units = usage_list[0]  # ["CCF", "INCHES", "FAHRENHEIT", "gal"]
+        timestamps = array("q")
+        usage = array("d")
+        rain = array("d")
+        temp = array("d")
+        for entry in usage_list[1:]:
+            timestamp, usage_value, rain_value, temp_value = entry[:4]
+            timestamps.append(int(timestamp))
+            usage.append(_to_float(usage_value))
+            rain.append(_to_float(rain_value))
+            temp.append(_to_float(temp_value))
+        return cls(timestamps, usage, rain, temp, units[0], units[1], units[2])
+
+    def to_usage_list(self) -> list[list]:
+        """Return the series in the API's usage list layout, for JSON storage."""
+        return [
+            [self.usage_unit, self.rain_unit, self.temp_unit],
+            *([reading.timestamp, reading.usage, reading.rain, reading.temp] for reading in self),
+        ]
+
+    def __len__(self) -> int:
+        """Return the number of hours in the series."""
+        return len(self.timestamps)
+
+    def __getitem__(self, index: int) -> HourlyReading:
+        """Return the readings for one hour."""
+        return HourlyReading(
+            self.timestamps[index],
+            _from_float(self.usage[index]),
+            _from_float(self.rain[index]),
+            _from_float(self.temp[index]),
+        )
+
+    def __iter__(self):
+        """Iterate over the hours in the series."""
+        for index in range(len(self.timestamps)):
+            yield self[index]
+
+    def between(self, start_ms: int, end_ms: int) -> HourlySeries:
+        """Return the hours with start_ms <= timestamp < end_ms without copying."""
+        start = bisect_left(self.timestamps, start_ms)
+        stop = bisect_left(self.timestamps, end_ms, start)
+        return HourlySeries(*(view[start:stop] for view in self.view()), *self.units)
+
+    def view(self) -> tuple[memoryview, memoryview, memoryview, memoryview]:
+        """Return zero-copy views of the timestamp, usage, rain and temp columns."""
+        return (
+            memoryview(self.timestamps),
+            memoryview(self.usage),
+            memoryview(self.rain),
+            memoryview(self.temp),
+        )
+
+    @property
+    def units(self) -> tuple[str | None, str | None, str | None]:
+        """Return the usage, rain and temperature units."""
+        return self.usage_unit, self.rain_unit, self.temp_unit
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the column buffers in bytes."""
+        return sum(column.nbytes for column in self.view())
@@ -0,0 +1,197 @@
+"""Services for the Sensus Analytics Integration (Water)."""
+
+from __future__ import annotations
+
+import math
+import os
+from datetime import date, tzinfo
+from functools import partial
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .api import SensusAnalyticsApiError
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DAYS,
+    ATTR_END,
+    ATTR_FORMAT,
+    ATTR_GRANULARITY,
+    ATTR_PATH,
+    ATTR_START,
+    DOMAIN,
+    EXPORT_FORMAT_CSV,
+    EXPORT_FORMAT_PARQUET,
+    GRANULARITY_DAILY,
+    GRANULARITY_HOURLY,
+    SERVICE_BACKFILL,
+    SERVICE_EXPORT,
+    SERVICE_GET_USAGE,
+    USAGE_QUERY_MAX_DAYS,
+)
+from .export import async_export_usage
+from .series import HourlySeries
+
+BACKFILL_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DAYS): vol.All(vol.Coerce(int), vol.Range(min=1, max=3650)),
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+GET_USAGE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_START): cv.date,
+        vol.Required(ATTR_END): cv.date,
+        vol.Optional(ATTR_GRANULARITY, default=GRANULARITY_DAILY): vol.In([GRANULARITY_HOURLY, GRANULARITY_DAILY]),
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+EXPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_START): cv.date,
+        vol.Required(ATTR_END): cv.date,
+        vol.Optional(ATTR_FORMAT, default=EXPORT_FORMAT_CSV): vol.In([EXPORT_FORMAT_CSV, EXPORT_FORMAT_PARQUET]),
+        vol.Optional(ATTR_PATH): cv.string,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+
+def _get_coordinators(hass: HomeAssistant, call: ServiceCall) -> list:
+    """Return the coordinators a service call targets."""
+    coordinators = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is None:
+        return list(coordinators.values())
+    if entry_id not in coordinators:
+        raise ServiceValidationError(f"Config entry {entry_id} is not loaded")
+    return [coordinators[entry_id]]
+
+
+def _validate_range(start: date, end: date, today: date, max_days: int | None = None) -> None:
+    """Reject date ranges the portal cannot answer or that are too long for one call."""
+    if start > end:
+        raise ServiceValidationError("The start date must not be after the end date")
+    if end > today:
+        raise ServiceValidationError("The end date must not be in the future")
+    if max_days is not None and (end - start).days >= max_days:
+        raise ServiceValidationError(f"A query can cover at most {max_days} days")
+
+
+def hourly_rows(rows: HourlySeries, local_tz: tzinfo) -> list[dict]:
+    """Return one row per hour with its local time."""
+    return [
+        {
+            "time": dt_util.utc_from_timestamp(reading.timestamp / 1000).astimezone(local_tz).isoformat(),
+            "usage": reading.usage,
+            "rain": reading.rain,
+            "temperature": reading.temp,
+        }
+        for reading in rows
+    ]
+
+
+def daily_row(day: date, rows: HourlySeries | None) -> dict:
+    """Return the totals of a day, with None where no hour had a reading."""
+    usage = [value for value in rows.usage if not math.isnan(value)] if rows else []
+    rain = [value for value in rows.rain if not math.isnan(value)] if rows else []
+    temp = [value for value in rows.temp if not math.isnan(value)] if rows else []
+    return {
+        "date": day.isoformat(),
+        "usage": round(math.fsum(usage), 6) if usage else None,
+        "rain": round(math.fsum(rain), 6) if rain else None,
+        "temperature": round(math.fsum(temp) / len(temp), 2) if temp else None,
+        "hours": len(usage),
+    }
+
+
+async def async_handle_backfill(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Start a statistics backfill in the background for each targeted entry."""
+    for coordinator in _get_coordinators(hass, call):
+        coordinator.config_entry.async_create_background_task(
+            hass,
+            coordinator.backfill.async_run(call.data[ATTR_DAYS]),
+            f"{DOMAIN}_backfill_{coordinator.config_entry.entry_id}",
+        )
+
+
+async def async_handle_get_usage(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Return the usage of each targeted entry's meter over a date range."""
+    local_tz = dt_util.get_time_zone(hass.config.time_zone)
+    start, end = call.data[ATTR_START], call.data[ATTR_END]
+    _validate_range(start, end, dt_util.now(local_tz).date(), USAGE_QUERY_MAX_DAYS)
+    hourly = call.data[ATTR_GRANULARITY] == GRANULARITY_HOURLY
+
+    response = {}
+    for coordinator in _get_coordinators(hass, call):
+        try:
+            days = await coordinator.async_get_usage_range(start, end)
+        except (SensusAnalyticsApiError, KeyError, TypeError, ValueError) as error:
+            raise HomeAssistantError(f"Could not fetch usage: {error}") from error
+        usage_unit, rain_unit, temp_unit = next((rows.units for rows in days.values() if rows), (None,) * 3)
+        if hourly:
+            rows = [row for day_rows in days.values() if day_rows for row in hourly_rows(day_rows, local_tz)]
+        else:
+            rows = [daily_row(day, day_rows) for day, day_rows in days.items()]
+        response[coordinator.config_entry.entry_id] = {
+            "meter_id": coordinator.water_meter_number,
+            "usage_unit": usage_unit,
+            "rain_unit": rain_unit,
+            "temperature_unit": temp_unit,
+            "rows": rows,
+        }
+    return response
+
+
+async def async_handle_export(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Write the hourly usage of each targeted entry's meter over a date range to a file."""
+    local_tz = dt_util.get_time_zone(hass.config.time_zone)
+    start, end = call.data[ATTR_START], call.data[ATTR_END]
+    _validate_range(start, end, dt_util.now(local_tz).date())
+    file_format = call.data[ATTR_FORMAT]
+    coordinators = _get_coordinators(hass, call)
+    path = call.data.get(ATTR_PATH)
+    if path is not None:
+        if len(coordinators) > 1:
+            raise ServiceValidationError("Choose a config entry when exporting to a given path")
+        if not hass.config.is_allowed_path(path):
+            raise ServiceValidationError(f"Cannot write to {path}, add it to allowlist_external_dirs")
+
+    response = {}
+    for coordinator in coordinators:
+        meter = slugify(coordinator.water_meter_number)
+        target = path or hass.config.path(DOMAIN, f"{meter}_{start}_{end}.{file_format}")
+        try:
+            response[coordinator.config_entry.entry_id] = await async_export_usage(
+                hass, coordinator, start, end, target, file_format
+            )
+        except (SensusAnalyticsApiError, KeyError, TypeError, ValueError) as error:
+            raise HomeAssistantError(f"Could not fetch usage: {error}") from error
+        except OSError as error:
+            raise HomeAssistantError(f"Could not write {os.path.basename(target)}: {error}") from error
+    return response
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+    hass.services.async_register(DOMAIN, SERVICE_BACKFILL, partial(async_handle_backfill, hass), schema=BACKFILL_SCHEMA)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_USAGE,
+        partial(async_handle_get_usage, hass),
+        schema=GET_USAGE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT,
+        partial(async_handle_export, hass),
+        schema=EXPORT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,81 @@
+"""Portal sessions shared between config entries."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from urllib.parse import urlsplit
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+from .api import SensusPortalSession
+from .const import DATA_SESSIONS, HOST_CONCURRENCY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PortalSessionRegistry:
+    """Hand out one authenticated session per base URL and username.
+
+    Meters on the same login borrow the same session, so they share its cookie
+    and keep-alive connections and log in once between them. Every session for
+    a portal host also shares one semaphore limiting concurrent requests.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the registry."""
+        self.hass = hass
+        self._sessions: dict[tuple[str, str], SensusPortalSession] = {}
+        self._borrowers: dict[tuple[str, str], int] = {}
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_detach_all)
+
+    def acquire(self, base_url: str, username: str, password: str) -> SensusPortalSession:
+        """Return the shared session for a login, creating it on first use."""
+        key = (base_url, username)
+        portal = self._sessions.get(key)
+        if portal is None:
+            host = urlsplit(base_url).netloc
+            host_limit = self._host_limits.setdefault(host, asyncio.Semaphore(HOST_CONCURRENCY))
+            # A dedicated session keeps the portal cookie out of HA's shared cookie jar. It
+            # outlives the entry being set up, so the registry detaches it instead of HA
+            portal = self._sessions[key] = SensusPortalSession(
+                async_create_clientsession(self.hass, auto_cleanup=False), base_url, username, password, host_limit
+            )
+        else:
+            portal.update_password(password)
+        self._borrowers[key] = self._borrowers.get(key, 0) + 1
+        return portal
+
+    async def async_release(self, portal: SensusPortalSession) -> None:
+        """Return a borrowed session, detaching it once no entry uses it."""
+        key = (portal.base_url, portal.username)
+        self._borrowers[key] -= 1
+        if self._borrowers[key] > 0:
+            return
+        del self._borrowers[key]
+        del self._sessions[key]
+        _LOGGER.debug("Closing portal session for %s", portal.base_url)
+        portal.session.detach()
+
+    @callback
+    def _async_detach_all(self, _event: Event) -> None:
+        """Detach the sessions still borrowed when Home Assistant closes."""
+        for portal in self._sessions.values():
+            portal.session.detach()
+        self._sessions.clear()
+        self._borrowers.clear()
+
+    def borrowers(self, portal: SensusPortalSession) -> int:
+        """Return how many config entries share a session."""
+        return self._borrowers.get((portal.base_url, portal.username), 0)
+
+
+def async_get_session_registry(hass: HomeAssistant) -> PortalSessionRegistry:
+    """Return the registry of shared portal sessions."""
+    registry = hass.data.get(DATA_SESSIONS)
+    if registry is None:
+        registry = hass.data[DATA_SESSIONS] = PortalSessionRegistry(hass)
+    return registry
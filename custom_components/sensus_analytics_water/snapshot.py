@@ -0,0 +1,143 @@
+"""Derived sensor values computed once per coordinator update."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_WATER_UNIT_TYPE
+from .tariff import TariffEngine
+
+CF_TO_GALLON = 7.48052
+
+
+def convert_usage(usage, usage_unit, config_unit_type):
+    """Convert usage based on configuration and native unit."""
+    if usage is None:
+        return None
+    if usage_unit == "CF" and config_unit_type == "gal":
+        try:
+            return round(float(usage) * CF_TO_GALLON)
+        except (ValueError, TypeError):
+            return None
+    if usage_unit == "GAL" and config_unit_type == "CF":
+        try:
+            return round(float(usage) / CF_TO_GALLON)
+        except (ValueError, TypeError):
+            return None
+    return usage
+
+
+def resolve_usage_unit(usage_unit, config_unit_type):
+    """Determine the unit of measurement for usage sensors."""
+    if usage_unit == "CF" and config_unit_type == "gal":
+        return "gal"
+    if usage_unit == "GAL" and config_unit_type == "CF":
+        return "CF"
+    if usage_unit == "GAL":
+        return "gal"  # convert to the HA standard
+    return usage_unit
+
+
+def _last_read_time(last_read_ts):
+    """Convert the millisecond lastRead value to a datetime."""
+    if not last_read_ts:
+        return None
+    try:
+        return dt_util.utc_from_timestamp(last_read_ts / 1000)
+    except (ValueError, TypeError):
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class SensusSnapshot:  # pylint: disable=too-many-instance-attributes
+    """Immutable sensor values derived from one successful update."""
+
+    daily_usage: float | None
+    billing_usage: float | None
+    meter_odometer: float | None
+    usage_unit: str | None
+    native_usage_unit: str | None
+    config_unit_type: str | None
+    meter_address: str | None
+    meter_id: str | None
+    meter_latitude: float | None
+    meter_longitude: float | None
+    last_read: datetime | None
+    billing_cost: float | None
+    daily_fee: float | None
+    day_start: datetime
+    billing_cycle_start: datetime
+
+    @classmethod
+    def from_data(cls, data: Mapping[str, Any], config: Mapping[str, Any], tariff: TariffEngine) -> SensusSnapshot:
+        """Build the snapshot from the widget payload and the entry configuration."""
+        native_unit = data.get("usageUnit")
+        config_unit_type = config.get(CONF_WATER_UNIT_TYPE)
+        daily_usage = convert_usage(data.get("dailyUsage"), native_unit, config_unit_type)
+        billing_usage = convert_usage(data.get("billingUsage"), native_unit, config_unit_type)
+        day_start = dt_util.start_of_local_day()
+
+        billing_cost = None
+        if billing_usage is not None:
+            billing_cost = round(tariff.service_fee + tariff.cost(billing_usage), 2)
+        daily_fee = None
+        if daily_usage is not None:
+            daily_fee = round(tariff.cost(daily_usage), 2)
+
+        return cls(
+            daily_usage=daily_usage,
+            billing_usage=billing_usage,
+            meter_odometer=convert_usage(data.get("latestReadUsage"), native_unit, config_unit_type),
+            usage_unit=resolve_usage_unit(native_unit, config_unit_type),
+            native_usage_unit="gal" if native_unit == "GAL" else native_unit,
+            config_unit_type=config_unit_type,
+            meter_address=data.get("meterAddress1"),
+            meter_id=data.get("meterId"),
+            meter_latitude=data.get("meterLat"),
+            meter_longitude=data.get("meterLong"),
+            last_read=_last_read_time(data.get("lastRead")),
+            billing_cost=billing_cost,
+            daily_fee=daily_fee,
+            day_start=day_start,
+            billing_cycle_start=day_start.replace(day=1),
+        )
+
+    @classmethod
+    def combine(cls, snapshots: Iterable[SensusSnapshot], meter_id: str) -> SensusSnapshot | None:
+        """Sum the usage and costs of several meters, or return None if their units differ."""
+        snapshots = list(snapshots)
+        if not snapshots or len({snapshot.usage_unit for snapshot in snapshots}) > 1:
+            return None
+        first = snapshots[0]
+        last_reads = [snapshot.last_read for snapshot in snapshots if snapshot.last_read]
+        return cls(
+            daily_usage=_sum(snapshot.daily_usage for snapshot in snapshots),
+            billing_usage=_sum(snapshot.billing_usage for snapshot in snapshots),
+            meter_odometer=_sum(snapshot.meter_odometer for snapshot in snapshots),
+            usage_unit=first.usage_unit,
+            native_usage_unit=first.native_usage_unit,
+            config_unit_type=first.config_unit_type,
+            meter_address=first.meter_address,
+            meter_id=meter_id,
+            meter_latitude=first.meter_latitude,
+            meter_longitude=first.meter_longitude,
+            last_read=max(last_reads, default=None),
+            billing_cost=_sum((snapshot.billing_cost for snapshot in snapshots), 2),
+            daily_fee=_sum((snapshot.daily_fee for snapshot in snapshots), 2),
+            day_start=first.day_start,
+            billing_cycle_start=first.billing_cycle_start,
+        )
+
+
+def _sum(values: Iterable[float | None], digits: int | None = None) -> float | None:
+    """Add up the known values, returning None when none are known."""
+    known = [value for value in values if value is not None]
+    if not known:
+        return None
+    total = sum(known)
+    return total if digits is None else round(total, digits)
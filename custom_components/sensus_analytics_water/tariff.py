@@ -0,0 +1,74 @@
+"""Tiered water tariff compiled into breakpoints for fast evaluation."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import numpy as np
+
+
+class TariffEngine:
+    """Evaluate the configured tier prices for one or many usage totals.
+
+    The tier configuration is compiled once into ascending breakpoints, the
+    price charged above each breakpoint and the cost accumulated up to it, so
+    evaluating a usage total is a binary search plus one multiply-add. Batches
+    run the same search and multiply-add over NumPy arrays.
+    """
+
+    __slots__ = ("breakpoints", "prices", "base_costs", "service_fee", "_arrays")
+
+    def __init__(self, breakpoints: list[float], prices: list[float], service_fee: float = 0.0):
+        """Initialize the engine from tier start points and their prices."""
+        self.breakpoints = breakpoints
+        self.prices = prices
+        self.base_costs = [0.0]
+        for index in range(1, len(breakpoints)):
+            width = breakpoints[index] - breakpoints[index - 1]
+            self.base_costs.append(self.base_costs[-1] + width * prices[index - 1])
+        self.service_fee = service_fee
+        self._arrays = (np.array(breakpoints, dtype=float), np.array(prices, dtype=float), np.array(self.base_costs))
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> TariffEngine:
+        """Compile the tier options of a config entry."""
+        tier1_gallons = config.get("water_tier1_gallons") or 0
+        tier1_price = config.get("water_tier1_price") or 0
+        tier2_gallons = config.get("water_tier2_gallons") or 0
+        tier2_price = config.get("water_tier2_price") or 0
+        tier3_price = config.get("water_tier3_price") or 0
+        service_fee = config.get("water_service_fee") or 0
+
+        if tier1_gallons == 0:
+            # No tier 1 limit, all usage is charged at tier 1 price
+            return cls([0.0], [tier1_price], service_fee)
+        if tier2_gallons == 0:
+            # No tier 2 limit, usage above tier 1 is charged at tier 2 price
+            return cls([0.0, tier1_gallons], [tier1_price, tier2_price], service_fee)
+        return cls(
+            [0.0, tier1_gallons, tier1_gallons + tier2_gallons],
+            [tier1_price, tier2_price, tier3_price],
+            service_fee,
+        )
+
+    def cost(self, usage: float) -> float:
+        """Return the tiered cost of a usage total, excluding the service fee."""
+        tier = max(bisect_right(self.breakpoints, usage) - 1, 0)
+        return self.base_costs[tier] + (usage - self.breakpoints[tier]) * self.prices[tier]
+
+    def _cost_array(self, usages: np.ndarray) -> np.ndarray:
+        """Return the tiered cost of each usage total in an array."""
+        breakpoints, prices, base_costs = self._arrays
+        tiers = np.maximum(np.searchsorted(breakpoints, usages, side="right") - 1, 0)
+        return base_costs[tiers] + (usages - breakpoints[tiers]) * prices[tiers]
+
+    def costs(self, usages: Iterable[float]) -> list[float]:
+        """Return the tiered cost of each usage total."""
+        return self._cost_array(np.fromiter(usages, dtype=float)).tolist()
+
+    def marginal_costs(self, increments: Iterable[float], start: float = 0.0) -> list[float]:
+        """Return what each successive increment adds once usage has reached ``start``."""
+        totals = np.cumsum(np.fromiter(increments, dtype=float))
+        return np.diff(self._cost_array(totals + start), prepend=self.cost(start)).tolist()